@@ -0,0 +1,75 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Import time of cron_descriptor entry points in fresh interpreters, checked against budgets
+
+Exits with status 1 when best time of some entry point exceeds its budget, so it can guard CI.
+
+Run from repository root:
+
+    python benchmarks/bench_import.py --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Entry point: (import statement, budget in milliseconds)
+ENTRY_POINTS = {
+    "package": ("import cron_descriptor", 10.0),
+    "validate": ("from cron_descriptor.ExpressionValidator import ExpressionValidator", 60.0),
+    "describe": ("from cron_descriptor import get_description", 120.0),
+}
+
+
+def import_time(statement: str, repeat: int) -> float:
+    """Best time of statement in fresh interpreter in milliseconds
+    """
+    code = f"import time; s = time.perf_counter(); {statement}; print(time.perf_counter() - s)"
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout  # noqa: S603
+        times.append(float(output))
+    return min(times) * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply budgets, i.e. for slow CI machines")
+    args = parser.parse_args()
+
+    failed = 0
+    print(f"{'entry point':>12} {'ms':>8} {'budget':>8}")
+    for name, (statement, budget) in ENTRY_POINTS.items():
+        elapsed = import_time(statement, args.repeat)
+        over = elapsed > budget * args.scale
+        failed += over
+        print(f"{name:>12} {elapsed:>8.2f} {budget * args.scale:>8.2f}{'  OVER BUDGET' if over else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Time spent in ExpressionParser.parse, which includes normalization of all parts
+
+Timed side by side with PreviousExpressionParser, which normalizes with the algorithm used before
+single pass normalization (a sweep over all parts per rule, replace per name), so the speedup is
+measured on the same machine. Run from repository root:
+
+    python benchmarks/bench_normalize.py --rounds 20000
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cron_descriptor import Options
+from cron_descriptor.ExpressionParser import ExpressionParser
+
+EXPRESSIONS = (
+    "* * * * *",
+    "*/5 * * * *",
+    "0 23 ? * MON-FRI",
+    "30 11 * JAN,FEB,MAR SUN",
+    "0 0/30 8-9 5,20 * ?",
+    "0 0 12 ? * 2#3",
+    "23 12 * JAN-FEB * 2013-2014",
+    "0 0 6 ? * 1/2 2019/3",
+    "* * * * 1-7",
+)
+
+
+class PreviousExpressionParser(ExpressionParser):
+    """Parser with previous normalize_expression, kept only for comparison
+    """
+
+    def normalize_expression(self, expression_parts: list[str]) -> None:
+        # convert ? to * only for DOM and DOW
+        expression_parts[3] = expression_parts[3].replace("?", "*")
+        expression_parts[5] = expression_parts[5].replace("?", "*")
+
+        # convert 0/, 1/ to */
+        for i, start in ((0, "0/"), (1, "0/"), (2, "0/"), (3, "1/"), (4, "1/"), (5, "1/"), (6, "1/")):
+            if expression_parts[i].startswith(start):
+                expression_parts[i] = expression_parts[i].replace(start, "*/")
+
+        # Adjust DOW based on dayOfWeekStartIndexZero option
+        def digit_replace(match: re.Match[str]) -> str:
+            match_value = match.group()
+            dow_digits = re.sub(r"\D", "", match_value)
+            dow_digits_adjusted = dow_digits
+            if self._options.day_of_week_start_index_zero:
+                if dow_digits == "7":
+                    dow_digits_adjusted = "0"
+            else:
+                dow_digits_adjusted = str(int(dow_digits) - 1)
+
+            return match_value.replace(dow_digits, dow_digits_adjusted)
+
+        expression_parts[5] = re.sub(r"(^\d)|([^#/\s]\d)", digit_replace, expression_parts[5])
+
+        # convert SUN-SAT format to 0-6 format
+        for day_number, day_name in self._cron_days.items():
+            expression_parts[5] = expression_parts[5].upper().replace(day_name, str(day_number))
+
+        # convert JAN-DEC format to 1-12 format
+        for month_number, month_name in self._cron_months.items():
+            expression_parts[4] = expression_parts[4].upper().replace(month_name, str(month_number))
+
+        # convert 0 second to (empty)
+        if expression_parts[0] == "0":
+            expression_parts[0] = ""
+
+        # Make single hour a "self-range" when seconds or minutes have interval
+        has_part_zero_star_and_slash = any(ext in expression_parts[0] for ext in ["*", "/"])
+        has_part_one_star_and_slash = any(ext in expression_parts[1] for ext in ["*", "/"])
+        has_part_two_special_chars = any(ext in expression_parts[2] for ext in ["*", "-", ",", "/"])
+        if not has_part_two_special_chars and (has_part_zero_star_and_slash or has_part_one_star_and_slash):
+            expression_parts[2] += f"-{expression_parts[2]}"
+
+        # Loop through all parts and apply global normalization
+        for i in range(len(expression_parts)):
+            # convert all '*/1' to '*'
+            if expression_parts[i] == "*/1":
+                expression_parts[i] = "*"
+
+            # Convert Month, DOW, Year step values with a starting value to between expressions
+            if "/" in expression_parts[i] and not any(exp in expression_parts[i] for exp in ["*", "-", ","]):
+                step_range_through = {4: "12", 5: "6", 6: "9999"}.get(i)
+                if step_range_through is not None:
+                    parts = expression_parts[i].split("/")
+                    expression_parts[i] = f"{parts[0]}-{step_range_through}/{parts[1]}"
+
+
+def time_parse(parser_class: type[ExpressionParser], expression: str, options: Options, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parser_class(expression, options).parse()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20_000)
+    args = parser.parse_args()
+
+    for day_of_week_start_index_zero in (True, False):
+        options = Options(locale_code="en_US", day_of_week_start_index_zero=day_of_week_start_index_zero)
+        print(f"day_of_week_start_index_zero={day_of_week_start_index_zero}")
+        print(f"{'expression':>32} {'previous us':>12} {'current us':>11} {'speedup':>8}")
+        for expression in EXPRESSIONS:
+            previous = time_parse(PreviousExpressionParser, expression, options, args.rounds)
+            current = time_parse(ExpressionParser, expression, options, args.rounds)
+            print(f"{expression:>32} {previous * 1e6:>12.2f} {current * 1e6:>11.2f} {previous / current:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Throughput of describe_many depending on number of worker processes
+
+Run from repository root:
+
+    python benchmarks/bench_parallel.py --items 200000 --unique 20000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cron_descriptor import Options, describe_many
+
+
+def make_corpus(items: int, unique: int, seed: int = 0) -> list[str]:
+    """Generates corpus of expressions with given number of unique ones
+    """
+    rng = random.Random(seed)  # noqa: S311
+    templates = (
+        "{m} {h} * * *",
+        "*/{s} * * * *",
+        "{m} {h} * * {d}",
+        "{m} {h} {dom} * *",
+        "0 {m} {h} ? * {d}L",
+        "{m} {h}-{h2} * * 1-5",
+        "0 {m}/{s} {h} {dom}W * ?",
+    )
+    pool: list[str] = []
+    while len(pool) < unique:
+        h = rng.randrange(0, 23)
+        pool.append(rng.choice(templates).format(
+            m=rng.randrange(0, 60), h=h, h2=rng.randrange(h, 24), s=rng.randrange(2, 30),
+            d=rng.randrange(0, 7), dom=rng.randrange(1, 29),
+        ))
+    return [rng.choice(pool) for _ in range(items)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--unique", type=int, default=20_000)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, nargs="*", default=None, help="Worker counts to measure, default 1, 2, 4 ... cpu count")
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({1, *(2 ** i for i in range(1, cpu_count.bit_length()) if 2 ** i <= cpu_count), cpu_count})
+    corpus = make_corpus(args.items, args.unique)
+    options = Options(locale_code="en_US")
+
+    print(f"{args.items} expressions, {args.unique} unique, {cpu_count} CPUs")
+    print(f"{'workers':>8} {'seconds':>10} {'expr/s':>12} {'speedup':>8}")
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        for _ in describe_many(corpus, options, workers=workers, chunk_size=args.chunk_size):
+            pass
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.3f} {args.items / elapsed:>12.0f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Clean versus error-heavy batches: try_describe and validate_many against catching raised exceptions
+
+Run from repository root:
+
+    python benchmarks/bench_results.py --items 50000 --invalid 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_parallel import make_corpus
+
+from cron_descriptor import FormatError, Options, description_cache, get_description, try_describe, validate_many
+from cron_descriptor.ExpressionValidator import ExpressionValidator
+
+INVALID = ("61 * * * *", "* 25 * * *", "* * 32 * *", "* * * 13 *", "* * * * MON#6", "* * * JAN,XYZ *", "* * 5-1 * *")
+
+
+def with_invalid(corpus: list[str], share: float) -> list[str]:
+    rng = random.Random(1)  # noqa: S311
+    return [rng.choice(INVALID) if rng.random() < share else expression for expression in corpus]
+
+
+def raising_validate(corpus: list[str]) -> None:
+    validator = ExpressionValidator()
+    for expression in corpus:
+        with contextlib.suppress(FormatError):
+            validator.validate(expression)
+
+
+def raising_describe(corpus: list[str], options: Options) -> None:
+    validator = ExpressionValidator()
+    for expression in corpus:
+        with contextlib.suppress(FormatError):
+            validator.validate(expression)
+            get_description(expression, options)
+
+
+def timed(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--unique", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--invalid", type=float, default=0.1, help="Share of invalid expressions in error-heavy batch")
+    args = parser.parse_args()
+
+    options = Options(locale_code="en_US")
+    description_cache.resize(0)
+    clean = make_corpus(args.items, args.unique)
+    batches = (("clean", clean), (f"{args.invalid:.0%} invalid", with_invalid(clean, args.invalid)))
+
+    print(f"{'benchmark':>18} {'batch':>12} {'us/expression':>14}")
+    for batch_name, corpus in batches:
+        for name, func in (
+            ("validate raising", lambda corpus=corpus: raising_validate(corpus)),
+            ("validate_many", lambda corpus=corpus: list(validate_many(corpus))),
+            ("describe raising", lambda corpus=corpus: raising_describe(corpus, options)),
+            ("try_describe", lambda corpus=corpus: [try_describe(expression, options) for expression in corpus]),
+        ):
+            elapsed = timed(func, args.repeat)
+            print(f"{name:>18} {batch_name:>12} {elapsed / len(corpus) * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
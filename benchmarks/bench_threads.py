@@ -0,0 +1,93 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Throughput of describing with one shared Options instance depending on number of threads
+
+Measured path is get_description(expression, options) with memoization disabled. Localization is
+resolved once on options before timing, so describing takes no lock, the shared catalog cache
+lookups made during the run are printed and expected to be 0.
+
+Threads only scale on free-threaded build (python3.13t and newer), with GIL the numbers show
+the cost of sharing. Run from repository root:
+
+    python3.13t benchmarks/bench_threads.py --items 100000 --unique 10000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_parallel import make_corpus
+
+from cron_descriptor import Options, description_cache, get_description
+from cron_descriptor.GetText import catalog_cache
+
+
+def cache_lookups() -> int:
+    return sum(cache.hits + cache.misses for cache in (catalog_cache, catalog_cache.resolved, catalog_cache.templates))
+
+
+def describe_chunk(chunk: list[str], options: Options) -> int:
+    for expression in chunk:
+        get_description(expression, options)
+    return len(chunk)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--unique", type=int, default=10_000)
+    parser.add_argument("--threads", type=int, nargs="*", default=None, help="Thread counts to measure, default 1, 2, 4 ... cpu count")
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    thread_counts = args.threads or sorted({1, *(2 ** i for i in range(1, cpu_count.bit_length()) if 2 ** i <= cpu_count), cpu_count})
+    corpus = make_corpus(args.items, args.unique)
+    # One instance for all threads, nothing is copied or locked per call
+    description_cache.resize(0)
+    options = Options(locale_code="en_US")
+    options.get_text()
+    lookups = cache_lookups()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{args.items} expressions, {args.unique} unique, {cpu_count} CPUs, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>8} {'seconds':>10} {'expr/s':>12} {'speedup':>8} {'efficiency':>10}")
+    baseline = None
+    for threads in thread_counts:
+        chunks = [corpus[i::threads] for i in range(threads)]
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            start = time.perf_counter()
+            done = sum(executor.map(describe_chunk, chunks, [options] * threads))
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(f"{threads:>8} {elapsed:>10.3f} {done / elapsed:>12.0f} {speedup:>7.2f}x {speedup / threads:>9.0%}")
+    print(f"shared cache lookups during run: {cache_lookups() - lookups}")
+
+
+if __name__ == "__main__":
+    main()
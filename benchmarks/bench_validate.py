@@ -0,0 +1,72 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Throughput of ExpressionValidator.validate over generated corpus
+
+Cached numbers reuse remembered field part results, uncached numbers set PART_CACHE_SIZE to 0
+so every part goes through its field grammar.
+
+Run from repository root:
+
+    python benchmarks/bench_validate.py --items 200000 --unique 20000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_parallel import make_corpus
+
+from cron_descriptor import ExpressionValidator as expression_validator_module  # noqa: N813
+from cron_descriptor.ExpressionValidator import check_expression
+
+
+def run(corpus: list[str], cache_size: int) -> float:
+    expression_validator_module.PART_CACHE_SIZE = cache_size
+    for results in expression_validator_module._part_results:  # noqa: SLF001
+        results.clear()
+    start = time.perf_counter()
+    for expression in corpus:
+        check_expression(expression)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--unique", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.items, args.unique)
+    print(f"{'mode':>9} {'us/expression':>14} {'expressions/s':>14}")
+    for mode, cache_size in (("uncached", 0), ("cached", expression_validator_module.PART_CACHE_SIZE)):
+        elapsed = min(run(corpus, cache_size) for _ in range(args.rounds))
+        print(f"{mode:>9} {elapsed / args.items * 1e6:>14.2f} {args.items / elapsed:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark suite for parse, validate and describe hot paths
+
+Needs only the standard library. Results are written as JSON and can be compared
+against a stored baseline run.
+
+Run from repository root:
+
+    python benchmarks/suite.py --output baseline.json
+    python benchmarks/suite.py --baseline baseline.json --max-regression 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from bench_parallel import make_corpus
+
+from cron_descriptor import CronExpression, CronIndex, Describer, DescriptionTypeEnum, ExpressionDescriptor, Options, __version__
+from cron_descriptor.ExpressionParser import ExpressionParser
+from cron_descriptor.ExpressionValidator import ExpressionValidator
+from cron_descriptor.GetText import GetText, catalog_cache
+
+EXPRESSIONS = (
+    "* * * * *",
+    "*/5 * * * *",
+    "0 23 ? * MON-FRI",
+    "30 11 * JAN,FEB,MAR SUN",
+    "0 0/30 8-9 5,20 * ?",
+    "0 0 12 ? * 2#3",
+    "0 0 L * *",
+    "0 0 15W * ?",
+    "23 12 * JAN-FEB * 2013-2014",
+    "0 0 6 ? * 1/2 2019/3",
+)
+
+
+class Result(NamedTuple):
+    value: float
+    unit: str
+
+
+def best_of(func: Callable[[], object], repeat: int, number: int | None = None) -> float:
+    """Returns best time of single call in microseconds, number of calls per round is picked by timeit unless given
+    """
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def bench_parse(options: Options, repeat: int) -> dict[str, Result]:
+    def run() -> None:
+        for expression in EXPRESSIONS:
+            ExpressionParser(expression, options).parse()
+    return {"parse": Result(best_of(run, repeat) / len(EXPRESSIONS), "us")}
+
+
+def bench_validate(repeat: int) -> dict[str, Result]:
+    validator = ExpressionValidator()
+
+    def run() -> None:
+        for expression in EXPRESSIONS:
+            validator.validate(expression)
+    return {"validate": Result(best_of(run, repeat) / len(EXPRESSIONS), "us")}
+
+
+def bench_describe(options: Options, repeat: int) -> dict[str, Result]:
+    descriptors = [ExpressionDescriptor(expression, options) for expression in EXPRESSIONS]
+    results = {}
+    for description_type in DescriptionTypeEnum:
+        def run(description_type: DescriptionTypeEnum = description_type) -> None:
+            for descriptor in descriptors:
+                descriptor.get_description(description_type)
+        results[f"describe.{description_type.name.lower()}"] = Result(best_of(run, repeat) / len(descriptors), "us")
+
+    def create() -> None:
+        for expression in EXPRESSIONS:
+            ExpressionDescriptor(expression, options).get_description()
+    results["describe.create_and_full"] = Result(best_of(create, repeat) / len(EXPRESSIONS), "us")
+
+    describer = Describer(options)
+
+    def bound() -> None:
+        for expression in EXPRESSIONS:
+            describer.describe(expression)
+    results["describe.describer_full"] = Result(best_of(bound, repeat) / len(EXPRESSIONS), "us")
+    return results
+
+
+def bench_schedule(options: Options, repeat: int) -> dict[str, Result]:
+    expressions = [CronExpression(expression, options) for expression in EXPRESSIONS]
+    start = dt.datetime(2026, 1, 1, 12, 0, 0)  # noqa: DTZ001
+
+    def matches() -> None:
+        for expression in expressions:
+            expression.matches(start)
+
+    def get_next() -> None:
+        for expression in expressions:
+            expression.get_next(start)
+    return {
+        "schedule.matches": Result(best_of(matches, repeat) / len(expressions), "us"),
+        "schedule.get_next": Result(best_of(get_next, repeat) / len(expressions), "us"),
+    }
+
+
+def bench_index(options: Options, repeat: int, jobs: int = 20_000) -> dict[str, Result]:
+    index: CronIndex[int] = CronIndex()
+    start = time.perf_counter()
+    for job_id, expression in enumerate(make_corpus(jobs, jobs)):
+        index.add(job_id, expression, options)
+    add = (time.perf_counter() - start) / jobs
+    times = [dt.datetime(2026, 1, 5, 9, minute) for minute in range(60)]  # noqa: DTZ001
+
+    def due() -> None:
+        for time_ in times:
+            index.due(time_)
+    return {
+        "index.add": Result(add * 1e6, "us"),
+        f"index.due_{jobs}": Result(best_of(due, repeat) / len(times), "us"),
+    }
+
+
+def bench_locales(repeat: int) -> dict[str, Result]:
+    """First call (catalog read from disk) and warm call (cached catalog) of GetText for every shipped locale
+    """
+    results = {}
+    for path in sorted(GetText.locale_dir().glob("*.mo")):
+        code = path.stem
+        cold = []
+        for _ in range(repeat):
+            catalog_cache.clear()
+            start = time.perf_counter()
+            GetText(code)
+            cold.append(time.perf_counter() - start)
+        results[f"locale.{code}.first"] = Result(min(cold) * 1e6, "us")
+        results[f"locale.{code}.warm"] = Result(best_of(partial(GetText, code), repeat, number=1000), "us")
+    catalog_cache.clear()
+    return results
+
+
+def bench_import(repeat: int) -> dict[str, Result]:
+    """Time of import cron_descriptor in fresh interpreter
+    """
+    code = "import time; s = time.perf_counter(); import cron_descriptor; print(time.perf_counter() - s)"
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout  # noqa: S603
+        times.append(float(output))
+    return {"import": Result(min(times) * 1e3, "ms")}
+
+
+def bench_memory(options: Options, count: int = 1000) -> dict[str, Result]:
+    """Memory retained by ExpressionDescriptor instances, measured with tracemalloc
+    """
+    # Warm catalogs and caches so only descriptors themselves are measured
+    for expression in EXPRESSIONS:
+        ExpressionDescriptor(expression, options).get_description()
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    descriptors = [ExpressionDescriptor(EXPRESSIONS[i % len(EXPRESSIONS)], options) for i in range(count)]
+    after, peak = tracemalloc.get_traced_memory()
+    for descriptor in descriptors:
+        descriptor.get_description()
+    _, describe_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "memory.descriptor": Result((after - before) / count, "bytes"),
+        "memory.descriptor_peak": Result((peak - before) / count, "bytes"),
+        "memory.describe_peak": Result(describe_peak - after, "bytes"),
+    }
+
+
+def run(repeat: int, locale_code: str) -> dict[str, Result]:
+    options = Options(locale_code=locale_code)
+    results: dict[str, Result] = {}
+    results.update(bench_import(repeat))
+    results.update(bench_parse(options, repeat))
+    results.update(bench_validate(repeat))
+    results.update(bench_describe(options, repeat))
+    results.update(bench_schedule(options, repeat))
+    results.update(bench_index(options, repeat))
+    results.update(bench_locales(repeat))
+    results.update(bench_memory(options))
+    return results
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], max_regression: float) -> list[str]:
+    """Prints comparison table against baseline
+
+    Args:
+        results: Results of current run
+        baseline: Results of baseline run
+        max_regression: Allowed relative slowdown, i.e. 0.2 for 20 %
+    Returns:
+        Names of benchmarks slower than allowed
+
+    """
+    regressions = []
+    print(f"{'benchmark':<32} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None or previous["unit"] != current["unit"]:
+            print(f"{name:<32} {'-':>12} {current['value']:>12.2f} {'new':>8}")
+            continue
+        change = current["value"] / previous["value"] - 1 if previous["value"] else 0.0
+        marker = ""
+        if change > max_regression:
+            regressions.append(name)
+            marker = " !"
+        print(f"{name:<32} {previous['value']:>12.2f} {current['value']:>12.2f} {change:>+7.1%}{marker}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of rounds, best one is reported")
+    parser.add_argument("--locale", default="en_US", help="Locale used for parse and describe benchmarks")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare results with JSON written by earlier run")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed relative slowdown against baseline")
+    args = parser.parse_args()
+
+    results = {name: result._asdict() for name, result in run(args.repeat, args.locale).items()}
+    report = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "date": dt.datetime.now(dt.timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(results, baseline, args.max_regression)
+        if regressions:
+            print(f"{len(regressions)} benchmarks slower than allowed: {', '.join(regressions)}")
+            return 1
+    else:
+        for name, result in results.items():
+            print(f"{name:<32} {result['value']:>12.2f} {result['unit']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Vectorized matching of many timestamps against one schedule
+
+NumPy is optional (pip install cron_descriptor[numpy]), without it the same results
+are computed with Schedule.matches in a plain loop.
+"""
+from __future__ import annotations
+
+import importlib
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from .Schedule import YEAR_OFFSET
+
+if TYPE_CHECKING:
+    import datetime as dt
+    from collections.abc import Iterable
+
+    from .Schedule import Schedule
+
+# 1970-01-01 was Thursday
+EPOCH_WEEKDAY = 4
+
+
+@cache
+def numpy_module() -> Any:  # noqa: ANN401
+    """Returns numpy module or None when it is not installed, imported on first use to keep import of cron_descriptor fast
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+def match_array(schedule: Schedule, times: Any) -> Any:  # noqa: ANN401
+    """Checks which of times the schedule fires at, microseconds are ignored
+
+    Args:
+        schedule: Compiled schedule
+        times: Array of datetime64 (or anything convertible to it) when NumPy is installed,
+            iterable of datetime objects otherwise
+    Returns:
+        Boolean NumPy array (False for NaT), or list of bools when NumPy is not installed
+
+    """
+    np = numpy_module()
+    if np is None:
+        return match_list(schedule, times)
+    return _match_numpy(np, schedule, np.asarray(times, dtype="datetime64[s]"))
+
+
+def match_list(schedule: Schedule, times: Iterable[dt.datetime]) -> list[bool]:
+    """Pure Python variant of match_array
+
+    Args:
+        schedule: Compiled schedule
+        times: Times to check
+    Returns:
+        List of bools
+
+    """
+    return [schedule.matches(time) for time in times]
+
+
+def _table(np: Any, mask: int, size: int) -> Any:  # noqa: ANN401
+    """Converts bitmask into boolean lookup table indexed by bit
+    """
+    return np.array([bool(mask >> i & 1) for i in range(size)])
+
+
+def _match_numpy(np: Any, schedule: Schedule, times: Any) -> Any:  # noqa: ANN401
+    masks = schedule.masks
+    fields = schedule.fields
+
+    # NaT would turn into garbage index, it is computed as epoch and masked out at the end
+    valid = ~np.isnat(times)
+    times = np.where(valid, times, np.datetime64(0, "s"))
+
+    days = times.astype("datetime64[D]")
+    months = times.astype("datetime64[M]")
+    seconds_of_day = (times - days).astype(np.int64)
+    month_index = months.astype(np.int64)
+    month_start = months.astype("datetime64[D]")
+
+    year = month_index // 12 + YEAR_OFFSET
+    day = (days - month_start).astype(np.int64) + 1
+    last_day = ((months + 1).astype("datetime64[D]") - month_start).astype(np.int64)
+    # Cron weekdays, 0 is Sunday
+    weekday = (days.astype(np.int64) + EPOCH_WEEKDAY) % 7
+    first_weekday = (month_start.astype(np.int64) + EPOCH_WEEKDAY) % 7
+    last_weekday = (first_weekday + last_day - 1) % 7
+
+    result = _table(np, masks.seconds, 60)[seconds_of_day % 60]
+    result &= _table(np, masks.minutes, 60)[seconds_of_day // 60 % 60]
+    result &= _table(np, masks.hours, 24)[seconds_of_day // 3600]
+    result &= _table(np, masks.months, 12)[month_index % 12]
+    if masks.years is not None:
+        years = _table(np, masks.years, masks.years.bit_length())
+        year_index = year - YEAR_OFFSET
+        in_range = (year_index >= 0) & (year_index < len(years))
+        result &= in_range & years[np.where(in_range, year_index, 0)]
+
+    by_day_of_month = _table(np, masks.days_of_month, 31)[day - 1]
+    for offset in fields.last_day_offsets:
+        by_day_of_month |= day == last_day - offset
+    for nearest in fields.nearest_weekdays:
+        by_day_of_month |= (nearest <= last_day) & (day == _nearest_weekday(np, nearest, (first_weekday + nearest - 1) % 7, last_day))
+    if fields.last_weekday:
+        by_day_of_month |= day == _nearest_weekday(np, last_day, last_weekday, last_day)
+
+    by_day_of_week = _table(np, masks.days_of_week, 7)[weekday]
+    for day_of_week in fields.last_days_of_week:
+        by_day_of_week |= day == last_day - (last_weekday - day_of_week) % 7
+    for day_of_week, nth in fields.nth_days_of_week:
+        by_day_of_week |= day == 1 + (day_of_week - first_weekday) % 7 + (nth - 1) * 7
+
+    if schedule.any_day_of_month:
+        result &= by_day_of_month | by_day_of_week
+    else:
+        result &= by_day_of_month & by_day_of_week
+    return result & valid
+
+
+def _nearest_weekday(np: Any, day: Any, weekday: Any, last_day: Any) -> Any:  # noqa: ANN401
+    """Array variant of Schedule.nearest_weekday
+    """
+    saturday = np.where(day == 1, day + 2, day - 1)
+    sunday = np.where(day == last_day, day - 2, day + 1)
+    return np.where(weekday == 6, saturday, np.where(weekday == 0, sunday, day))
@@ -0,0 +1,162 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import itertools
+import sys
+from collections import deque
+from typing import TYPE_CHECKING, Union
+
+from .Describer import Describer
+from .Exception import FormatException, MissingFieldException
+from .LRUCache import LRUCache
+from .Options import Options
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
+    from .CronExpression import CronExpression
+
+DescriptionResult = Union[str, FormatException, MissingFieldException]
+
+
+def describe_many(
+    expressions: Iterable[str | CronExpression],
+    options: Options | None=None,
+    *,
+    cache_size: int | None=None,
+    workers: int | None=None,
+    chunk_size: int = 1024,
+) -> Iterator[DescriptionResult]:
+    """Generates human readable strings for many Cron Expressions
+
+    Options and locale catalog are resolved once for the whole batch and every unique
+    expression is described only once, repeated expressions reuse the first result.
+
+    Args:
+        expressions: Any iterable of cron expression strings or CronExpression
+        options: Options to control the output description
+        cache_size: Maximum number of unique results kept for reuse, unlimited when None
+        workers: Number of worker processes, expressions are described in current process when None or 1
+        chunk_size: Number of expressions sent to worker process at once
+    Returns:
+        Iterator yielding, in input order, description or exception raised for that expression
+
+    """
+    if options is None:
+        options = Options()
+
+    results: LRUCache[str | CronExpression, DescriptionResult] = LRUCache(sys.maxsize if cache_size is None else cache_size)
+
+    if workers is not None and workers != 1:
+        yield from _describe_parallel(expressions, options, results, workers, chunk_size)
+        return
+
+    describer = Describer(options)
+    for expression in expressions:
+        result = results.get(expression)
+        if result is None:
+            result = describe_one(expression, describer)
+            results.put(expression, result)
+        yield result
+
+
+def describe_one(expression: str | CronExpression, options: Options | Describer) -> DescriptionResult:
+    """Describes single expression, returning exception instead of raising it
+
+    Args:
+        expression: The cron expression string or CronExpression
+        options: Options to control the output description, or Describer already bound to them
+    Returns:
+        Description or exception raised while describing
+
+    """
+    describer = options if isinstance(options, Describer) else Describer(options)
+    try:
+        return describer.describe(expression)
+    except (FormatException, MissingFieldException) as e:
+        return e
+
+
+def _describe_parallel(
+    expressions: Iterable[str | CronExpression],
+    options: Options,
+    results: LRUCache[str | CronExpression, DescriptionResult],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[DescriptionResult]:
+    """Describes expressions in chunks on process pool, keeping input order
+
+    Only a few chunks per worker are in flight at once, so input is consumed lazily.
+    """
+    # Process pool machinery (multiprocessing) is only imported when parallel description is requested
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    pending: deque[tuple[list[str | CronExpression], dict[str | CronExpression, DescriptionResult], list[str | CronExpression], Future[list[DescriptionResult]]]] = deque()
+    iterator = iter(expressions)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(options,)) as executor:
+        while chunk := list(itertools.islice(iterator, chunk_size)):
+            known: dict[str | CronExpression, DescriptionResult] = {}
+            unique: list[str | CronExpression] = []
+            for expression in dict.fromkeys(chunk):
+                result = results.get(expression)
+                if result is None:
+                    unique.append(expression)
+                else:
+                    known[expression] = result
+            pending.append((chunk, known, unique, executor.submit(_describe_chunk, unique)))
+
+            if len(pending) >= workers * 2:
+                yield from _collect_chunk(*pending.popleft(), results)
+
+        while pending:
+            yield from _collect_chunk(*pending.popleft(), results)
+
+
+def _collect_chunk(
+    chunk: list[str | CronExpression],
+    known: dict[str | CronExpression, DescriptionResult],
+    unique: list[str | CronExpression],
+    future: Future[list[DescriptionResult]],
+    results: LRUCache[str | CronExpression, DescriptionResult],
+) -> Iterator[DescriptionResult]:
+    for expression, result in zip(unique, future.result()):
+        known[expression] = result
+        results.put(expression, result)
+    for expression in chunk:
+        yield known[expression]
+
+
+_worker_describer: Describer | None = None
+
+
+def _init_worker(options: Options) -> None:
+    """Process pool initializer, resolves locale catalog once per worker process
+    """
+    global _worker_describer  # noqa: PLW0603
+    _worker_describer = Describer(options)
+
+
+def _describe_chunk(expressions: list[str | CronExpression]) -> list[DescriptionResult]:
+    describer = _worker_describer if _worker_describer is not None else Describer()
+    return [describe_one(expression, describer) for expression in expressions]
@@ -0,0 +1,179 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Weekday and month names of bundled locales
+
+Names do not depend on process wide LC_TIME, tables are built once at import and shared by all descriptors.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class CalendarNames(NamedTuple):
+    """Names of one language
+
+    days are indexed by CRON day number (0 is Sunday), months by month number (index 0 is empty)
+    """
+    days: tuple[str, ...]
+    months: tuple[str, ...]
+
+
+def _names(days: tuple[str, ...], months: tuple[str, ...]) -> CalendarNames:
+    return CalendarNames(days, ("", *months))
+
+
+# Keyed by language, full locale code only where territory differs
+CALENDAR_NAMES: dict[str, CalendarNames] = {
+    "cs": _names(
+        ("neděle", "pondělí", "úterý", "středa", "čtvrtek", "pátek", "sobota"),
+        ("leden", "únor", "březen", "duben", "květen", "červen", "červenec", "srpen", "září", "říjen", "listopad", "prosinec"),
+    ),
+    "da": _names(
+        ("søndag", "mandag", "tirsdag", "onsdag", "torsdag", "fredag", "lørdag"),
+        ("januar", "februar", "marts", "april", "maj", "juni", "juli", "august", "september", "oktober", "november", "december"),
+    ),
+    "de": _names(
+        ("Sonntag", "Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag"),
+        ("Januar", "Februar", "März", "April", "Mai", "Juni", "Juli", "August", "September", "Oktober", "November", "Dezember"),
+    ),
+    "el": _names(
+        ("Κυριακή", "Δευτέρα", "Τρίτη", "Τετάρτη", "Πέμπτη", "Παρασκευή", "Σάββατο"),
+        ("Ιανουάριος", "Φεβρουάριος", "Μάρτιος", "Απρίλιος", "Μάιος", "Ιούνιος", "Ιούλιος", "Αύγουστος", "Σεπτέμβριος", "Οκτώβριος", "Νοέμβριος", "Δεκέμβριος"),
+    ),
+    "en": _names(
+        ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"),
+        ("January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"),
+    ),
+    "es": _names(
+        ("domingo", "lunes", "martes", "miércoles", "jueves", "viernes", "sábado"),
+        ("enero", "febrero", "marzo", "abril", "mayo", "junio", "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre"),
+    ),
+    "fa": _names(
+        ("یکشنبه", "دوشنبه", "سه‌شنبه", "چهارشنبه", "پنجشنبه", "جمعه", "شنبه"),
+        ("ژانویه", "فوریه", "مارس", "آوریل", "مه", "ژوئن", "ژوئیه", "اوت", "سپتامبر", "اکتبر", "نوامبر", "دسامبر"),
+    ),
+    "fi": _names(
+        ("sunnuntai", "maanantai", "tiistai", "keskiviikko", "torstai", "perjantai", "lauantai"),
+        ("tammikuu", "helmikuu", "maaliskuu", "huhtikuu", "toukokuu", "kesäkuu", "heinäkuu", "elokuu", "syyskuu", "lokakuu", "marraskuu", "joulukuu"),
+    ),
+    "fr": _names(
+        ("dimanche", "lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi"),
+        ("janvier", "février", "mars", "avril", "mai", "juin", "juillet", "août", "septembre", "octobre", "novembre", "décembre"),
+    ),
+    "he": _names(
+        ("יום ראשון", "יום שני", "יום שלישי", "יום רביעי", "יום חמישי", "יום שישי", "יום שבת"),
+        ("ינואר", "פברואר", "מרץ", "אפריל", "מאי", "יוני", "יולי", "אוגוסט", "ספטמבר", "אוקטובר", "נובמבר", "דצמבר"),
+    ),
+    "hu": _names(
+        ("vasárnap", "hétfő", "kedd", "szerda", "csütörtök", "péntek", "szombat"),
+        ("január", "február", "március", "április", "május", "június", "július", "augusztus", "szeptember", "október", "november", "december"),
+    ),
+    "it": _names(
+        ("domenica", "lunedì", "martedì", "mercoledì", "giovedì", "venerdì", "sabato"),
+        ("gennaio", "febbraio", "marzo", "aprile", "maggio", "giugno", "luglio", "agosto", "settembre", "ottobre", "novembre", "dicembre"),
+    ),
+    "ja": _names(
+        ("日曜日", "月曜日", "火曜日", "水曜日", "木曜日", "金曜日", "土曜日"),
+        tuple(f"{month}月" for month in range(1, 13)),
+    ),
+    "kk": _names(
+        ("жексенбі", "дүйсенбі", "сейсенбі", "сәрсенбі", "бейсенбі", "жұма", "сенбі"),
+        ("қаңтар", "ақпан", "наурыз", "сәуір", "мамыр", "маусым", "шілде", "тамыз", "қыркүйек", "қазан", "қараша", "желтоқсан"),
+    ),
+    "ko": _names(
+        ("일요일", "월요일", "화요일", "수요일", "목요일", "금요일", "토요일"),
+        tuple(f"{month}월" for month in range(1, 13)),
+    ),
+    "nb": _names(
+        ("søndag", "mandag", "tirsdag", "onsdag", "torsdag", "fredag", "lørdag"),
+        ("januar", "februar", "mars", "april", "mai", "juni", "juli", "august", "september", "oktober", "november", "desember"),
+    ),
+    "nl": _names(
+        ("zondag", "maandag", "dinsdag", "woensdag", "donderdag", "vrijdag", "zaterdag"),
+        ("januari", "februari", "maart", "april", "mei", "juni", "juli", "augustus", "september", "oktober", "november", "december"),
+    ),
+    "pl": _names(
+        ("niedziela", "poniedziałek", "wtorek", "środa", "czwartek", "piątek", "sobota"),
+        ("styczeń", "luty", "marzec", "kwiecień", "maj", "czerwiec", "lipiec", "sierpień", "wrzesień", "październik", "listopad", "grudzień"),
+    ),
+    "pt": _names(
+        ("domingo", "segunda-feira", "terça-feira", "quarta-feira", "quinta-feira", "sexta-feira", "sábado"),
+        ("janeiro", "fevereiro", "março", "abril", "maio", "junho", "julho", "agosto", "setembro", "outubro", "novembro", "dezembro"),
+    ),
+    "ro": _names(
+        ("duminică", "luni", "marți", "miercuri", "joi", "vineri", "sâmbătă"),
+        ("ianuarie", "februarie", "martie", "aprilie", "mai", "iunie", "iulie", "august", "septembrie", "octombrie", "noiembrie", "decembrie"),
+    ),
+    "ru": _names(
+        ("воскресенье", "понедельник", "вторник", "среда", "четверг", "пятница", "суббота"),
+        ("январь", "февраль", "март", "апрель", "май", "июнь", "июль", "август", "сентябрь", "октябрь", "ноябрь", "декабрь"),
+    ),
+    "sk": _names(
+        ("nedeľa", "pondelok", "utorok", "streda", "štvrtok", "piatok", "sobota"),
+        ("január", "február", "marec", "apríl", "máj", "jún", "júl", "august", "september", "október", "november", "december"),
+    ),
+    "sl": _names(
+        ("nedelja", "ponedeljek", "torek", "sreda", "četrtek", "petek", "sobota"),
+        ("januar", "februar", "marec", "april", "maj", "junij", "julij", "avgust", "september", "oktober", "november", "december"),
+    ),
+    "sv": _names(
+        ("söndag", "måndag", "tisdag", "onsdag", "torsdag", "fredag", "lördag"),
+        ("januari", "februari", "mars", "april", "maj", "juni", "juli", "augusti", "september", "oktober", "november", "december"),
+    ),
+    "ta": _names(
+        ("ஞாயிறு", "திங்கள்", "செவ்வாய்", "புதன்", "வியாழன்", "வெள்ளி", "சனி"),
+        ("ஜனவரி", "பிப்ரவரி", "மார்ச்", "ஏப்ரல்", "மே", "ஜூன்", "ஜூலை", "ஆகஸ்ட்", "செப்டம்பர்", "அக்டோபர்", "நவம்பர்", "டிசம்பர்"),
+    ),
+    "tr": _names(
+        ("Pazar", "Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma", "Cumartesi"),
+        ("Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz", "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık"),
+    ),
+    "uk": _names(
+        ("неділя", "понеділок", "вівторок", "середа", "четвер", "пʼятниця", "субота"),
+        ("січень", "лютий", "березень", "квітень", "травень", "червень", "липень", "серпень", "вересень", "жовтень", "листопад", "грудень"),
+    ),
+    "vi": _names(
+        ("Chủ Nhật", "Thứ Hai", "Thứ Ba", "Thứ Tư", "Thứ Năm", "Thứ Sáu", "Thứ Bảy"),
+        tuple(f"tháng {month}" for month in range(1, 13)),
+    ),
+    "zh": _names(
+        ("星期日", "星期一", "星期二", "星期三", "星期四", "星期五", "星期六"),
+        ("一月", "二月", "三月", "四月", "五月", "六月", "七月", "八月", "九月", "十月", "十一月", "十二月"),
+    ),
+}
+
+DEFAULT_NAMES = CALENDAR_NAMES["en"]
+
+
+def calendar_names(locale_code: str) -> CalendarNames:
+    """Returns names for locale, falling back to its language and to English
+
+    Args:
+        locale_code: Locale code as used by catalogs, i.e. de_DE
+    Returns:
+        Names of locale
+
+    """
+    names = CALENDAR_NAMES.get(locale_code)
+    if names is None:
+        names = CALENDAR_NAMES.get(locale_code.partition("_")[0].lower(), DEFAULT_NAMES)
+    return names
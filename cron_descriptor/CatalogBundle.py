@@ -0,0 +1,229 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Single file bundle of all bundled locale catalogs
+
+Layout, all integers little endian uint32, offsets are absolute:
+
+    header          magic "CDCB", version, locale count
+    locale index    per locale: name offset, name length, info offset, info length, table offset, table slots
+    hash tables     per locale: slots of key offset, key length, value offset, value length; key offset 0 is empty slot
+    string pool     UTF-8 locale names, headers, message ids and translations
+
+Tables use open addressing with linear probing on crc32 of UTF-8 message id. Nothing is parsed up front,
+reader looks messages up in the mapped file and remembers the ones it decoded, so forked workers share
+the pages of the file instead of holding parsed copies of every catalog.
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+import zlib
+from collections.abc import Iterator, Mapping
+from functools import cache
+from importlib import resources
+from pathlib import Path
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
+
+BUNDLE_NAME = "catalogs.bin"
+MAGIC = b"CDCB"
+VERSION = 1
+
+_header = struct.Struct("<4sII")
+_locale = struct.Struct("<IIIIII")
+_slot = struct.Struct("<IIII")
+
+Buffer = Union[bytes, mmap.mmap]
+CatalogKey = Union[str, tuple[str, int]]
+
+
+def _key_bytes(key: CatalogKey) -> bytes:
+    # Plural forms (msgid, n) are stored as msgid NUL n
+    if isinstance(key, tuple):
+        return f"{key[0]}\x00{key[1]}".encode()
+    return key.encode()
+
+
+def _table_size(entries: int) -> int:
+    size = 8
+    while size < entries * 2:
+        size *= 2
+    return size
+
+
+def build_bundle(catalogs: Mapping[str, tuple[Mapping[CatalogKey, str], Mapping[str, str]]]) -> bytes:
+    """Serializes catalogs to bundle
+
+    Args:
+        catalogs: Locale code mapped to (catalog, info) as parsed by gettext.GNUTranslations
+    Returns:
+        Bundle bytes
+
+    """
+    codes = sorted(catalogs)
+    pool = bytearray()
+    pool_start = _header.size + _locale.size * len(codes) + sum(_slot.size * _table_size(len(catalogs[code][0])) for code in codes)
+
+    def add(data: bytes) -> tuple[int, int]:
+        offset = pool_start + len(pool)
+        pool.extend(data)
+        return offset, len(data)
+
+    index = bytearray()
+    tables = bytearray()
+    table_offset = _header.size + _locale.size * len(codes)
+    for code in codes:
+        catalog, info = catalogs[code]
+        size = _table_size(len(catalog))
+        slots: list[tuple[int, int, int, int]] = [(0, 0, 0, 0)] * size
+        for key, value in sorted(catalog.items(), key=lambda item: _key_bytes(item[0])):
+            raw = _key_bytes(key)
+            slot = zlib.crc32(raw) & (size - 1)
+            while slots[slot][0]:
+                slot = (slot + 1) & (size - 1)
+            slots[slot] = (*add(raw), *add(value.encode()))
+        headers = "".join(f"{name}: {value}\n" for name, value in sorted(info.items()))
+        index.extend(_locale.pack(*add(code.encode()), *add(headers.encode()), table_offset + len(tables), size))
+        for slot_value in slots:
+            tables.extend(_slot.pack(*slot_value))
+    return _header.pack(MAGIC, VERSION, len(codes)) + bytes(index) + bytes(tables) + bytes(pool)
+
+
+class BundleCatalog(Mapping[CatalogKey, str]):
+    """Read only catalog of one locale, messages are decoded on first lookup
+    """
+
+    def __init__(self, data: Buffer, table_offset: int, slots: int) -> None:
+        self._data = data
+        self._table_offset = table_offset
+        self._mask = slots - 1
+        self._decoded: dict[CatalogKey, str | None] = {}
+
+    def _find(self, key: CatalogKey) -> str | None:
+        raw = _key_bytes(key)
+        data = self._data
+        slot = zlib.crc32(raw) & self._mask
+        while True:
+            key_offset, key_length, value_offset, value_length = _slot.unpack_from(data, self._table_offset + slot * _slot.size)
+            if not key_offset:
+                return None
+            if key_length == len(raw) and data[key_offset:key_offset + key_length] == raw:
+                return data[value_offset:value_offset + value_length].decode()
+            slot = (slot + 1) & self._mask
+
+    def get(self, key: CatalogKey, default: str | None = None) -> str | None:  # type: ignore[override]
+        try:
+            value = self._decoded[key]
+        except KeyError:
+            value = self._decoded[key] = self._find(key)
+        return default if value is None else value
+
+    def __getitem__(self, key: CatalogKey) -> str:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[CatalogKey]:
+        data = self._data
+        for slot in range(self._mask + 1):
+            key_offset, key_length, _, _ = _slot.unpack_from(data, self._table_offset + slot * _slot.size)
+            if key_offset:
+                msgid, _, plural = bytes(data[key_offset:key_offset + key_length]).decode().partition("\x00")
+                yield (msgid, int(plural)) if plural else msgid
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class CatalogBundle:
+    """Index of bundle, maps locale codes to their catalogs
+    """
+
+    def __init__(self, data: Buffer) -> None:
+        """Reads header and locale index of bundle
+
+        Args:
+            data: Bundle content, usually memory mapped file
+        Raises:
+            ValueError: if data is not a bundle of supported version
+
+        """
+        magic, version, count = _header.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            msg = f"Unsupported catalog bundle {magic!r} version {version}"
+            raise ValueError(msg)
+        self._data = data
+        self._locales: dict[str, tuple[int, int, int, int]] = {}
+        for position in range(count):
+            name_offset, name_length, info_offset, info_length, table_offset, slots = _locale.unpack_from(data, _header.size + position * _locale.size)
+            name = bytes(data[name_offset:name_offset + name_length]).decode()
+            self._locales[name] = (info_offset, info_length, table_offset, slots)
+
+    def locales(self) -> list[str]:
+        return sorted(self._locales)
+
+    def catalog(self, locale_code: str) -> tuple[BundleCatalog, dict[str, str]] | None:
+        """Returns catalog and headers of locale
+
+        Args:
+            locale_code: Locale to look up
+        Returns:
+            (catalog, info) or None when bundle does not contain locale_code
+
+        """
+        entry = self._locales.get(locale_code)
+        if entry is None:
+            return None
+        info_offset, info_length, table_offset, slots = entry
+        headers = bytes(self._data[info_offset:info_offset + info_length]).decode()
+        info = dict(line.split(": ", 1) for line in headers.splitlines())
+        return BundleCatalog(self._data, table_offset, slots), info
+
+
+def read_bundle(resource: Traversable) -> CatalogBundle | None:
+    """Opens bundle, file on disk is memory mapped, other resources (i.e. in zip archive) are read to memory
+
+    Args:
+        resource: Bundle file, pathlib.Path or importlib.resources resource
+    Returns:
+        Bundle or None when resource does not exist or is not a valid bundle
+
+    """
+    try:
+        if isinstance(resource, Path):
+            with resource.open("rb") as f:
+                data: Buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = resource.read_bytes()
+        return CatalogBundle(data)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+@cache
+def package_bundle() -> CatalogBundle | None:
+    """Bundle shipped with package, opened once per process
+    """
+    return read_bundle(resources.files(f"{__package__}.locale").joinpath(BUNDLE_NAME))
@@ -0,0 +1,150 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import datetime as dt
+from collections import Counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from .CronExpression import CronExpression
+from .ExpressionDescriptor import get_description
+from .Options import Options
+from .Schedule import set_bits
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class CollisionGroup(NamedTuple):
+    """Expressions firing together at the same instants
+
+    expressions and descriptions are aligned, jobs counts duplicates of expressions,
+    times are the shared times of day and instants_per_day is number of shared fire
+    instants per analyzed day.
+    """
+
+    expressions: tuple[str, ...]
+    descriptions: tuple[str, ...]
+    jobs: int
+    times: tuple[dt.time, ...]
+    instants_per_day: float
+
+
+def collision_report(
+        expressions: Iterable[str | CronExpression],
+        options: Options | None=None,
+        *,
+        start: dt.date | None=None,
+        days: int = 7,
+        min_jobs: int = 2,
+) -> list[CollisionGroup]:
+    """Finds groups of expressions starting at the same instants
+
+    Unique expressions get bit in inverted bitmaps of every hour, minute, second and analyzed
+    day they fire on. Expressions sharing instant are found by ANDing bitmaps of its hour,
+    minute, second and day, instants with identical set of expressions form one group.
+    Nothing is simulated, cost grows with number of unique expressions and instants used.
+
+    Args:
+        expressions: Cron expression strings or parsed CronExpressions, duplicates count as more jobs
+        options: Options for parsing and descriptions
+        start: First analyzed day, today by default
+        days: Number of analyzed days
+        min_jobs: Smallest number of jobs reported as group
+    Returns:
+        Groups ordered by number of jobs and shared instants, largest first
+    Raises:
+        MissingFieldException: if some expression is empty
+        FormatException: if some expression has wrong format
+
+    """
+    if options is None:
+        options = Options()
+    if start is None:
+        start = dt.date.today()  # noqa: DTZ011
+
+    compiled: dict[str | CronExpression, CronExpression] = {}
+    multiplicity: Counter[CronExpression] = Counter()
+    for expression in expressions:
+        cron = compiled.get(expression)
+        if cron is None:
+            cron = compiled[expression] = expression if isinstance(expression, CronExpression) else CronExpression(expression, options)
+        multiplicity[cron] += 1
+    unique = list(multiplicity)
+    size = len(unique)
+
+    schedules = [cron.schedule for cron in unique]
+    hours = _inverted([schedule.masks.hours for schedule in schedules], 24, size)
+    minutes = _inverted([schedule.masks.minutes for schedule in schedules], 60, size)
+    seconds = _inverted([schedule.masks.seconds for schedule in schedules], 60, size)
+    analyzed_days = [start + dt.timedelta(days=i) for i in range(days)]
+    active_days = _inverted([sum(1 << i for i, day in enumerate(analyzed_days) if schedule.fires_on(day)) for schedule in schedules], days, size)
+
+    # Set of expressions -> shared instants (day index, second of day)
+    groups: dict[int, list[tuple[int, int]]] = {}
+    for day_index, active in enumerate(active_days):
+        for hour in _used(hours, active):
+            by_hour = active & hours[hour]
+            for minute in _used(minutes, by_hour):
+                by_minute = by_hour & minutes[minute]
+                for second in _used(seconds, by_minute):
+                    members = by_minute & seconds[second]
+                    groups.setdefault(members, []).append((day_index, hour * 3600 + minute * 60 + second))
+
+    report = []
+    descriptions: dict[CronExpression, str] = {}
+    for members, instants in groups.items():
+        positions = list(set_bits(members))
+        jobs = sum(multiplicity[unique[position]] for position in positions)
+        if jobs < min_jobs:
+            continue
+        crons = [unique[position] for position in positions]
+        for cron in crons:
+            if cron not in descriptions:
+                descriptions[cron] = get_description(cron, options)
+        report.append(CollisionGroup(
+            expressions=tuple(cron.expression for cron in crons),
+            descriptions=tuple(descriptions[cron] for cron in crons),
+            jobs=jobs,
+            times=tuple(dt.time(second // 3600, second // 60 % 60, second % 60) for second in sorted({second for _, second in instants})),
+            instants_per_day=len(instants) / days,
+        ))
+    report.sort(key=lambda group: (group.jobs, group.instants_per_day), reverse=True)
+    return report
+
+
+def _inverted(masks: list[int], values: int, size: int) -> list[int]:
+    """Builds one bitmap over expressions per field value from per expression field masks
+
+    Bitmaps are assembled as digit strings, setting bits one by one in large ints would copy them every time.
+    """
+    digits = [bytearray(b"0" * size) for _ in range(values)]
+    for position, mask in enumerate(masks):
+        for value in set_bits(mask):
+            digits[value][size - 1 - position] = 0x31
+    return [int(value_digits, 2) if size else 0 for value_digits in digits]
+
+
+def _used(bitmaps: list[int], candidates: int) -> list[int]:
+    """Returns values whose bitmap shares some expression with candidates
+    """
+    return [value for value, bitmap in enumerate(bitmaps) if bitmap & candidates]
@@ -0,0 +1,427 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import datetime as dt
+from itertools import islice
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .Exception import FormatError
+from .ExpressionParser import ExpressionParser
+from .Options import Options
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .Schedule import Schedule
+
+ONE_SECOND = dt.timedelta(seconds=1)
+
+
+class FieldSpec(NamedTuple):
+    name: str
+    minimum: int
+    maximum: int
+
+
+# Indexes match parts returned by ExpressionParser.parse
+FIELDS = (
+    FieldSpec("Second", 0, 59),
+    FieldSpec("Minute", 0, 59),
+    FieldSpec("Hour", 0, 23),
+    FieldSpec("DayOfMonth", 1, 31),
+    FieldSpec("Month", 1, 12),
+    FieldSpec("DayOfWeek", 0, 6),
+    FieldSpec("Year", 1970, 2099),
+)
+
+
+class ExpandedFields(NamedTuple):
+    seconds: frozenset[int]
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days_of_month: frozenset[int]
+    months: frozenset[int]
+    days_of_week: frozenset[int]
+    years: frozenset[int] | None
+    # DOM specials: L and L-n (as offsets from last day), nW, LW
+    last_day_offsets: frozenset[int]
+    nearest_weekdays: frozenset[int]
+    last_weekday: bool
+    # DOW specials: nL, n#k
+    last_days_of_week: frozenset[int]
+    nth_days_of_week: frozenset[tuple[int, int]]
+
+
+class CronExpression:
+    """Parsed, immutable cron expression
+
+    Expression is parsed and normalized once, the instance can then be passed to
+    ExpressionDescriptor, get_description or ExpressionValidator in place of a string
+    and rendered in any number of locales and casings.
+    """
+
+    __slots__ = ("_day_of_week_start_index_zero", "_expanded", "_expression", "_parts", "_schedule")
+
+    _expression: str
+    _parts: tuple[str, ...]
+    _day_of_week_start_index_zero: bool
+    _expanded: ExpandedFields | None
+    _schedule: Schedule | None
+
+    def __init__(self, expression: str, options: Options | None=None) -> None:
+        """Parses expression
+
+        Args:
+            expression: The cron expression string
+            options: Parsing options, only day_of_week_start_index_zero is used
+        Raises:
+            MissingFieldException: if expression is empty or None
+            FormatException: if expression has wrong format
+
+        """
+        if options is None:
+            options = Options()
+        parser = ExpressionParser(expression, options)
+        object.__setattr__(self, "_expression", expression)
+        object.__setattr__(self, "_parts", tuple(parser.parse()))
+        object.__setattr__(self, "_day_of_week_start_index_zero", options.day_of_week_start_index_zero)
+        object.__setattr__(self, "_expanded", None)
+        object.__setattr__(self, "_schedule", None)
+
+    @property
+    def expression(self) -> str:
+        """Original expression string"""
+        return self._expression
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        """Normalized 7 part tuple (seconds, minutes, hours, day of month, month, day of week, year)"""
+        return self._parts
+
+    @property
+    def day_of_week_start_index_zero(self) -> bool:
+        return self._day_of_week_start_index_zero
+
+    @property
+    def expanded(self) -> ExpandedFields:
+        """Value sets of all fields, computed on first access
+
+        Raises:
+            FormatException: if some field can not be expanded
+
+        """
+        if self._expanded is None:
+            object.__setattr__(self, "_expanded", expand_parts(self._parts))
+        return self._expanded  # type: ignore[return-value]
+
+    @property
+    def seconds(self) -> frozenset[int]:
+        return self.expanded.seconds
+
+    @property
+    def minutes(self) -> frozenset[int]:
+        return self.expanded.minutes
+
+    @property
+    def hours(self) -> frozenset[int]:
+        return self.expanded.hours
+
+    @property
+    def days_of_month(self) -> frozenset[int]:
+        return self.expanded.days_of_month
+
+    @property
+    def months(self) -> frozenset[int]:
+        return self.expanded.months
+
+    @property
+    def days_of_week(self) -> frozenset[int]:
+        """Days of week, 0 is Sunday"""
+        return self.expanded.days_of_week
+
+    @property
+    def years(self) -> frozenset[int] | None:
+        """Years, None when year is not restricted"""
+        return self.expanded.years
+
+    @property
+    def schedule(self) -> Schedule:
+        """Expression compiled to field bitmasks, created on first access
+
+        Raises:
+            FormatException: if some field can not be expanded
+
+        """
+        if self._schedule is None:
+            # Imported on first use, plain parse and describe never need it
+            from .Schedule import Schedule  # noqa: PLC0415
+
+            schedule = Schedule(self.expanded, day_of_month_star=self._parts[3].startswith("*"), day_of_week_star=self._parts[5].startswith("*"))
+            object.__setattr__(self, "_schedule", schedule)
+        return self._schedule  # type: ignore[return-value]
+
+    def matches(self, time: dt.datetime) -> bool:
+        """Checks whether expression fires at time, microseconds are ignored
+
+        Args:
+            time: Time to check
+        Returns:
+            True when expression fires at time
+        Raises:
+            FormatException: if some field can not be expanded
+
+        """
+        return self.schedule.matches(time)
+
+    def match_array(self, times: Any) -> Any:  # noqa: ANN401
+        """Checks many times at once, microseconds are ignored
+
+        With NumPy installed times are converted to datetime64[s] array and all fields
+        are decomposed and matched with array operations. Without NumPy times must be
+        datetime objects and result is list of bools, values are the same.
+
+        Args:
+            times: Array of datetime64 or iterable of datetime objects
+        Returns:
+            Boolean NumPy array or list of bools
+        Raises:
+            FormatException: if some field can not be expanded
+
+        """
+        from .ArrayMatch import match_array  # noqa: PLC0415
+
+        return match_array(self.schedule, times)
+
+    def occurrences(self, start: dt.datetime | None=None, *, reverse: bool=False) -> Iterator[dt.datetime]:
+        """Lazily yields fire times after start, or before start when reverse is set
+
+        Times are wall clock times in tzinfo of start, start itself is never yielded.
+
+        Args:
+            start: Time to search from, now (naive local time) by default
+            reverse: Yield earlier fire times in descending order
+        Returns:
+            Iterator of fire times
+        Raises:
+            FormatException: if some field can not be expanded
+
+        """
+        if start is None:
+            start = dt.datetime.now()  # noqa: DTZ005
+        schedule = self.schedule
+        if reverse:
+            return schedule.iter_backward(start.replace(microsecond=0) if start.microsecond else start - ONE_SECOND)
+        return schedule.iter_forward(start.replace(microsecond=0) + ONE_SECOND)
+
+    def get_next(self, start: dt.datetime | None=None, n: int=1) -> list[dt.datetime]:
+        """Returns next n fire times after start
+
+        Args:
+            start: Time to search from, now (naive local time) by default
+            n: Number of fire times
+        Returns:
+            Ascending fire times, fewer than n when schedule ends (i.e. year is restricted)
+        Raises:
+            FormatException: if some field can not be expanded
+
+        """
+        return list(islice(self.occurrences(start), n))
+
+    def get_prev(self, start: dt.datetime | None=None, n: int=1) -> list[dt.datetime]:
+        """Returns previous n fire times before start
+
+        Args:
+            start: Time to search from, now (naive local time) by default
+            n: Number of fire times
+        Returns:
+            Descending fire times, fewer than n when schedule has no more of them
+        Raises:
+            FormatException: if some field can not be expanded
+
+        """
+        return list(islice(self.occurrences(start, reverse=True), n))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CronExpression):
+            return NotImplemented
+        return self._parts == other._parts
+
+    def __hash__(self) -> int:
+        return hash(self._parts)
+
+    def __reduce__(self) -> tuple[object, ...]:
+        return _restore, (self._expression, self._parts, self._day_of_week_start_index_zero)
+
+    def __str__(self) -> str:
+        return self._expression
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._expression!r})"
+
+
+def _restore(expression: str, parts: tuple[str, ...], day_of_week_start_index_zero: bool) -> CronExpression:  # noqa: FBT001
+    instance = CronExpression.__new__(CronExpression)
+    object.__setattr__(instance, "_expression", expression)
+    object.__setattr__(instance, "_parts", parts)
+    object.__setattr__(instance, "_day_of_week_start_index_zero", day_of_week_start_index_zero)
+    object.__setattr__(instance, "_expanded", None)
+    object.__setattr__(instance, "_schedule", None)
+    return instance
+
+
+def expand_parts(parts: tuple[str, ...] | list[str]) -> ExpandedFields:
+    """Expands normalized expression parts into value sets
+
+    Args:
+        parts: 7 normalized parts as returned by ExpressionParser.parse
+    Returns:
+        Expanded fields
+    Raises:
+        FormatException: if some field can not be expanded
+
+    """
+    seconds = expand_field(parts[0] or "0", FIELDS[0])
+    minutes = expand_field(parts[1], FIELDS[1])
+    hours = expand_field(parts[2], FIELDS[2])
+    months = expand_field(parts[4], FIELDS[4])
+    years = None if parts[6] in ("", "*") else expand_field(parts[6], FIELDS[6])
+
+    # Day of month specials
+    days_of_month: set[int] = set()
+    last_day_offsets: set[int] = set()
+    nearest_weekdays: set[int] = set()
+    last_weekday = False
+    dom_spec = FIELDS[3]
+    for item in parts[3].split(","):
+        if item == "L":
+            last_day_offsets.add(0)
+        elif item.startswith("L-"):
+            last_day_offsets.add(_to_int(item[2:], item, dom_spec, (0, dom_spec.maximum - 1)))
+        elif item in ("LW", "WL"):
+            last_weekday = True
+        elif "W" in item:
+            nearest_weekdays.add(_to_int(item.replace("W", ""), item, dom_spec))
+        else:
+            days_of_month.update(expand_item(item, dom_spec))
+
+    # Day of week specials
+    days_of_week: set[int] = set()
+    last_days_of_week: set[int] = set()
+    nth_days_of_week: set[tuple[int, int]] = set()
+    dow_spec = FIELDS[5]
+    for item in parts[5].split(","):
+        if item == "L":
+            days_of_week.add(dow_spec.maximum)
+        elif item.endswith("L"):
+            last_days_of_week.add(_to_int(item[:-1], item, dow_spec))
+        elif "#" in item:
+            day, _, nth = item.partition("#")
+            nth_days_of_week.add((_to_int(day, item, dow_spec), _to_int(nth, item, dow_spec, (1, 5))))
+        else:
+            days_of_week.update(expand_item(item, dow_spec))
+
+    return ExpandedFields(
+        seconds=seconds,
+        minutes=minutes,
+        hours=hours,
+        days_of_month=frozenset(days_of_month),
+        months=months,
+        days_of_week=frozenset(days_of_week),
+        years=years,
+        last_day_offsets=frozenset(last_day_offsets),
+        nearest_weekdays=frozenset(nearest_weekdays),
+        last_weekday=last_weekday,
+        last_days_of_week=frozenset(last_days_of_week),
+        nth_days_of_week=frozenset(nth_days_of_week),
+    )
+
+
+def expand_field(expression: str, spec: FieldSpec) -> frozenset[int]:
+    """Expands comma separated field into set of values
+
+    Args:
+        expression: Normalized field expression
+        spec: Field bounds
+    Returns:
+        Set of values
+    Raises:
+        FormatException: if field can not be expanded
+
+    """
+    values: set[int] = set()
+    for item in expression.split(","):
+        values.update(expand_item(item, spec))
+    return frozenset(values)
+
+
+def expand_item(item: str, spec: FieldSpec) -> list[int]:
+    """Expands single list item (*, n, n-n, */n, n/n, n-n/n) into values
+
+    Args:
+        item: List item
+        spec: Field bounds
+    Returns:
+        List of values
+    Raises:
+        FormatException: if item can not be expanded
+
+    """
+    range_part, slash, step_part = item.partition("/")
+    step = _to_int(step_part, item, spec, (1, None)) if slash else 1
+
+    if range_part == "*":
+        values = list(range(spec.minimum, spec.maximum + 1))
+    elif "-" in range_part:
+        start_part, _, end_part = range_part.partition("-")
+        start = _to_int(start_part, item, spec)
+        # Normalization converts "n/m" to "n-9999/m" for years, which means "through the last year"
+        end = _to_int(end_part, item, spec, (spec.minimum, 9999 if spec is FIELDS[6] else spec.maximum))
+        end = min(end, spec.maximum)
+        # Wrapping range, i.e. FRI-MON
+        values = list(range(start, end + 1)) if start <= end else list(range(start, spec.maximum + 1)) + list(range(spec.minimum, end + 1))
+    else:
+        start = _to_int(range_part, item, spec)
+        values = list(range(start, spec.maximum + 1)) if slash else [start]
+
+    return values[::step]
+
+
+def _to_int(value: str, item: str, spec: FieldSpec, bounds: tuple[int, int | None] | None=None) -> int:
+    mi, mx = (spec.minimum, spec.maximum) if bounds is None else bounds
+    try:
+        number = int(value)
+    except ValueError as e:
+        msg = f"({spec.name}) Illegal Expression Format '{item}'"
+        raise FormatError(msg) from e
+    if number < mi or (mx is not None and number > mx):
+        msg = f"{spec.name} values must be between {mi} and {mx} but '{value}' is provided"
+        raise FormatError(msg)
+    return number
@@ -0,0 +1,240 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Generic, NamedTuple, TypeVar
+
+from .CronExpression import CronExpression
+from .LRUCache import LRUCache
+from .Options import Options
+from .Schedule import set_bits
+
+if TYPE_CHECKING:
+    import datetime as dt
+
+J = TypeVar("J", bound=Hashable)
+
+
+# Number of slots sharing one set of bitmaps, keeps add and remove cheap in large indexes
+BLOCK_SIZE = 4096
+
+# Number of compiled expressions kept for reuse, jobs often share the same schedule
+COMPILED_CACHE_SIZE = 1024
+
+
+class IndexedJob(NamedTuple):
+    slot: int
+    expression: CronExpression
+
+
+class _Block:
+    """Bitmaps of BLOCK_SIZE consecutive slots, one bitmap per value of each field
+    """
+
+    __slots__ = ("any_day", "any_year", "day_specials", "days_of_month", "days_of_week", "hours", "minutes", "months", "seconds", "years")
+
+    def __init__(self) -> None:
+        self.seconds = [0] * 60
+        self.minutes = [0] * 60
+        self.hours = [0] * 24
+        self.days_of_month = [0] * 32
+        self.months = [0] * 13
+        self.days_of_week = [0] * 7
+        self.years: dict[int, int] = {}
+        self.any_year = 0
+        self.any_day = 0
+        self.day_specials = 0
+
+
+class CronIndex(Generic[J]):
+    """Inverted index answering which jobs fire at given time
+
+    Every job gets a slot, bit of that slot is set in one bitmap per allowed value of each field
+    (i.e. minute 5 bitmap has bits of all jobs firing at minute 5). Lookup ANDs one bitmap per
+    field, so its cost does not grow with number of jobs that do not fire. Slots are grouped
+    in blocks of BLOCK_SIZE, so add and remove touch only small bitmaps of one block.
+
+    Days are indexed in two groups following Vixie cron semantics: jobs where both day of month
+    and day of week are restricted match when either of them matches, other jobs need both.
+    Jobs with month dependent day specials (L, W, LW, nL, n#k) are checked one by one, but only
+    those left after all other fields matched.
+    """
+
+    def __init__(self) -> None:
+        """Initializes empty CronIndex
+        """
+        self._lock = threading.RLock()
+        self._jobs: dict[J, IndexedJob] = {}
+        self._slots: list[J | None] = []
+        self._free_slots: list[int] = []
+        self._blocks: list[_Block] = []
+        self._compiled: LRUCache[tuple[str, bool], CronExpression] = LRUCache(maxsize=COMPILED_CACHE_SIZE)
+
+    def add(self, job_id: J, expression: str | CronExpression, options: Options | None=None) -> None:
+        """Adds job, replacing existing job with the same id
+
+        Args:
+            job_id: Job identifier
+            expression: The cron expression string or already parsed CronExpression
+            options: Parsing options used when expression is string
+        Raises:
+            MissingFieldException: if expression is empty
+            FormatException: if expression has wrong format
+
+        """
+        if not isinstance(expression, CronExpression):
+            expression = self._compile(expression, options or Options())
+        schedule = expression.schedule
+        fields = schedule.fields
+
+        with self._lock:
+            if job_id in self._jobs:
+                self.remove(job_id)
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                self._slots[slot] = job_id
+            else:
+                slot = len(self._slots)
+                self._slots.append(job_id)
+                if slot % BLOCK_SIZE == 0:
+                    self._blocks.append(_Block())
+            self._jobs[job_id] = IndexedJob(slot, expression)
+
+            block = self._blocks[slot // BLOCK_SIZE]
+            bit = 1 << (slot % BLOCK_SIZE)
+            self._set_bit(bit, fields.seconds, block.seconds)
+            self._set_bit(bit, fields.minutes, block.minutes)
+            self._set_bit(bit, fields.hours, block.hours)
+            self._set_bit(bit, fields.days_of_month, block.days_of_month)
+            self._set_bit(bit, fields.months, block.months)
+            self._set_bit(bit, fields.days_of_week, block.days_of_week)
+            if fields.years is None:
+                block.any_year |= bit
+            else:
+                for year in fields.years:
+                    block.years[year] = block.years.get(year, 0) | bit
+            if schedule.any_day_of_month:
+                block.any_day |= bit
+            if schedule.has_day_specials:
+                block.day_specials |= bit
+
+    def remove(self, job_id: J) -> None:
+        """Removes job
+
+        Args:
+            job_id: Job identifier
+        Raises:
+            KeyError: if job is not in index
+
+        """
+        with self._lock:
+            slot, expression = self._jobs.pop(job_id)
+            fields = expression.schedule.fields
+            block = self._blocks[slot // BLOCK_SIZE]
+            clear = ~(1 << (slot % BLOCK_SIZE))
+            self._clear_bit(clear, fields.seconds, block.seconds)
+            self._clear_bit(clear, fields.minutes, block.minutes)
+            self._clear_bit(clear, fields.hours, block.hours)
+            self._clear_bit(clear, fields.days_of_month, block.days_of_month)
+            self._clear_bit(clear, fields.months, block.months)
+            self._clear_bit(clear, fields.days_of_week, block.days_of_week)
+            for year in fields.years or ():
+                bits = block.years[year] & clear
+                if bits:
+                    block.years[year] = bits
+                else:
+                    del block.years[year]
+            block.any_year &= clear
+            block.any_day &= clear
+            block.day_specials &= clear
+            self._slots[slot] = None
+            self._free_slots.append(slot)
+
+    def due(self, time: dt.datetime) -> list[J]:
+        """Returns ids of jobs firing at time, microseconds are ignored
+
+        Args:
+            time: Time to check
+        Returns:
+            Ids of matching jobs
+
+        """
+        second, minute, hour, day, month, year = time.second, time.minute, time.hour, time.day, time.month, time.year
+        day_of_week = time.isoweekday() % 7
+        due: list[J] = []
+        with self._lock:
+            for block_number, block in enumerate(self._blocks):
+                bits = block.seconds[second] & block.minutes[minute] & block.hours[hour] & block.months[month]
+                if bits:
+                    bits &= block.any_year | block.years.get(year, 0)
+                if not bits:
+                    continue
+
+                by_day_of_month = block.days_of_month[day]
+                by_day_of_week = block.days_of_week[day_of_week]
+                specials = bits & block.day_specials
+                bits &= ~block.day_specials & ((block.any_day & (by_day_of_month | by_day_of_week)) | (~block.any_day & by_day_of_month & by_day_of_week))
+
+                first_slot = block_number * BLOCK_SIZE
+                # Month dependent days are checked only for jobs left after all other fields
+                for position in set_bits(specials):
+                    job_id = self._slots[first_slot + position]
+                    if self._jobs[job_id].expression.schedule.day_mask(year, month) >> (day - 1) & 1:  # type: ignore[index]
+                        bits |= 1 << position
+                due.extend(self._slots[first_slot + position] for position in set_bits(bits))  # type: ignore[misc]
+            return due
+
+    def _compile(self, expression: str, options: Options) -> CronExpression:
+        key = (expression, options.day_of_week_start_index_zero)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = CronExpression(expression, options)
+            self._compiled.put(key, compiled)
+        return compiled
+
+    def get(self, job_id: J) -> CronExpression | None:
+        """Returns expression of job or None when job is not in index
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return None if job is None else job.expression
+
+    def __contains__(self, job_id: object) -> bool:
+        with self._lock:
+            return job_id in self._jobs
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    @staticmethod
+    def _set_bit(bit: int, values: frozenset[int], bitmaps: list[int]) -> None:
+        for value in values:
+            bitmaps[value] |= bit
+
+    @staticmethod
+    def _clear_bit(clear: int, values: frozenset[int], bitmaps: list[int]) -> None:
+        for value in values:
+            bitmaps[value] &= clear
+
@@ -0,0 +1,87 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .DescriptionTypeEnum import DescriptionTypeEnum
+from .ExpressionDescriptor import ExpressionDescriptor
+from .Options import Options
+
+if TYPE_CHECKING:
+    from .CronExpression import CronExpression
+
+
+class Describer:
+    """Describes any number of Cron Expressions with the same options
+
+    Locale catalog, day and month names are resolved once when Describer is created, describe() only parses
+    and renders. Describer is not modified after creation, so one instance can be shared by threads.
+    """
+
+    __slots__ = ("get_text", "options")
+
+    def __init__(self, options: Options | None=None) -> None:
+        """Initialize Describer
+
+        Args:
+            options: Options to control the output description
+        Raises:
+            OSError: if not even fallback locale can be loaded
+
+        """
+        if options is None:
+            options = Options()
+        self.options = options
+        self.get_text = options.get_text()
+
+    def descriptor(self, expression: str | CronExpression) -> ExpressionDescriptor:
+        """Returns descriptor of expression using resolved localization
+
+        Args:
+            expression: The cron expression string or already parsed CronExpression
+        Returns:
+            ExpressionDescriptor
+        Raises:
+            MissingFieldException: if expression is empty
+            FormatException: if expression has wrong format
+
+        """
+        return ExpressionDescriptor.bound(expression, self.options, self.get_text)
+
+    def describe(self, expression: str | CronExpression, description_type: DescriptionTypeEnum = DescriptionTypeEnum.FULL) -> str:
+        """Generates a human readable string for the Cron Expression
+
+        Args:
+            expression: The cron expression string or already parsed CronExpression
+            description_type: Which part(s) of the expression to describe
+        Returns:
+            The cron expression description
+        Raises:
+            MissingFieldException: if expression is empty
+            FormatException: if expression has wrong format
+
+        """
+        return ExpressionDescriptor.bound(expression, self.options, self.get_text).get_description(description_type)
+
+    def __repr__(self) -> str:
+        return f"Describer({self.options!r})"
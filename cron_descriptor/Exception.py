@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+from __future__ import annotations
 
 
 class MissingFieldException(Exception):
@@ -32,8 +33,13 @@ class MissingFieldException(Exception):
             message: Message of exception
 
         """
+        self.field = message
         super().__init__(f"Field '{message}' not found.")
 
+    def __reduce__(self) -> tuple[type[MissingFieldException], tuple[str]]:
+        # Keep original field on unpickling (i.e. when returned from worker process)
+        return type(self), (self.field,)
+
 
 class FormatException(Exception):
     """Deprecated use FormatError
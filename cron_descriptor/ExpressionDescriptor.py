@@ -21,29 +21,31 @@
 # SOFTWARE.
 from __future__ import annotations
 
-import calendar
 import datetime
 import re
-from typing import Callable, TypedDict
-
-from typing_extensions import Unpack
+from typing import TYPE_CHECKING, Callable, ClassVar
 
+from .CalendarNames import DEFAULT_NAMES
 from .CasingTypeEnum import CasingTypeEnum
+from .CronExpression import CronExpression
 from .DescriptionTypeEnum import DescriptionTypeEnum
-from .Exception import FormatError, WrongArgumentError
+from .Exception import FormatError
 from .ExpressionParser import ExpressionParser
-from .GetText import GetText
-from .Options import Options
+from .LRUCache import LRUCache
+from .Options import Options, OptionsKwargs
 from .StringBuilder import StringBuilder
 
+if TYPE_CHECKING:
+    import sys
+
+    from .GetText import GetText
+    from .Templates import Segment
+
+    if sys.version_info >= (3, 11):
+        from typing import Unpack
+    else:
+        from typing_extensions import Unpack
 
-class OptionsKwargs(TypedDict, total=False):
-    use_24hour_time_format: bool
-    locale_code: str
-    casing_type: CasingTypeEnum
-    verbose: bool
-    day_of_week_start_index_zero: bool
-    locale_location: str | None
 
 class ExpressionDescriptor:
     """Converts a Cron Expression into a human readable string
@@ -51,15 +53,31 @@ class ExpressionDescriptor:
 
     _special_characters = ("/", "-", ",", "*")
 
+    _description_methods: ClassVar[dict[DescriptionTypeEnum, str]] = {
+        DescriptionTypeEnum.FULL: "get_full_description",
+        DescriptionTypeEnum.TIMEOFDAY: "get_time_of_day_description",
+        DescriptionTypeEnum.HOURS: "get_hours_description",
+        DescriptionTypeEnum.MINUTES: "get_minutes_description",
+        DescriptionTypeEnum.SECONDS: "get_seconds_description",
+        DescriptionTypeEnum.DAYOFMONTH: "get_day_of_month_description",
+        DescriptionTypeEnum.MONTH: "get_month_description",
+        DescriptionTypeEnum.DAYOFWEEK: "get_day_of_week_description",
+        DescriptionTypeEnum.YEAR: "get_year_description",
+    }
+
+    _weekday_regex = re.compile(r"(\d{1,2}W)|(W\d{1,2})")
+    _last_day_offset_regex = re.compile(r"L-(\d{1,2})")
+    _year_regex = re.compile(r"^\d+$")
+
     _expression = ""
     _options: Options
     _expression_parts: list[str]
 
-    def __init__(self, expression: str, options: Options | None=None, **kwargs: Unpack[OptionsKwargs]) -> None:
+    def __init__(self, expression: str | CronExpression, options: Options | None=None, **kwargs: Unpack[OptionsKwargs]) -> None:
         """Initializes a new instance of the ExpressionDescriptor
 
         Args:
-            expression: The cron expression string
+            expression: The cron expression string or already parsed CronExpression
             options: Options to control the output description
         Raises:
             WrongArgumentException: if kwarg is unknown
@@ -67,24 +85,40 @@ class ExpressionDescriptor:
         """
         if options is None:
             options = Options()
-        self._expression = expression
-        self._options = options
-        self._expression_parts = []
-
-        # if kwargs in _options, overwrite it, if not raise exception
-        for kwarg, value in kwargs.items():
-            if hasattr(self._options, kwarg):
-                setattr(self._options, kwarg, value)
-            else:
-                msg = f"Unknown {kwarg} configuration argument"
-                raise WrongArgumentError(msg)
+        if kwargs:
+            # Caller's options are shared, kwargs apply to copy used by this descriptor only
+            options = options.replace(**kwargs)
 
         # Initializes localization
-        self.get_text = GetText(options.locale_code, options.locale_location)
+        self._bind(expression, options, options.get_text())
+
+    @classmethod
+    def bound(cls, expression: str | CronExpression, options: Options, get_text: GetText) -> ExpressionDescriptor:
+        """Creates descriptor using already resolved localization, skipping per expression setup
+
+        Args:
+            expression: The cron expression string or already parsed CronExpression
+            options: Options to control the output description
+            get_text: Localization resolved for options
+        Returns:
+            New ExpressionDescriptor
+
+        """
+        descriptor = cls.__new__(cls)
+        descriptor._bind(expression, options, get_text)  # noqa: SLF001
+        return descriptor
+
+    def _bind(self, expression: str | CronExpression, options: Options, get_text: GetText) -> None:
+        self._expression = expression.expression if isinstance(expression, CronExpression) else expression
+        self._options = options
+        self.get_text = get_text
 
-        # Parse expression
-        parser = ExpressionParser(self._expression, self._options)
-        self._expression_parts = parser.parse()
+        # Parse expression, CronExpression is already parsed and keeps its day_of_week_start_index_zero
+        if isinstance(expression, CronExpression):
+            self._expression_parts = list(expression.parts)
+        else:
+            parser = ExpressionParser(self._expression, self._options)
+            self._expression_parts = parser.parse()
 
     def translate(self, message: str) -> str:
         return self.get_text.trans.gettext(message)
@@ -100,19 +134,8 @@ class ExpressionDescriptor:
             Exception:
 
         """
-        choices = {
-            DescriptionTypeEnum.FULL: self.get_full_description,
-            DescriptionTypeEnum.TIMEOFDAY: self.get_time_of_day_description,
-            DescriptionTypeEnum.HOURS: self.get_hours_description,
-            DescriptionTypeEnum.MINUTES: self.get_minutes_description,
-            DescriptionTypeEnum.SECONDS: self.get_seconds_description,
-            DescriptionTypeEnum.DAYOFMONTH: self.get_day_of_month_description,
-            DescriptionTypeEnum.MONTH: self.get_month_description,
-            DescriptionTypeEnum.DAYOFWEEK: self.get_day_of_week_description,
-            DescriptionTypeEnum.YEAR: self.get_year_description,
-        }
-
-        return choices.get(description_type, self.get_seconds_description)()
+        describe: Callable[[], str] = getattr(self, self._description_methods.get(description_type, "get_seconds_description"))
+        return describe()
 
     def get_full_description(self) -> str:
         """Generates the FULL description
@@ -152,6 +175,7 @@ class ExpressionDescriptor:
         seconds_expression = self._expression_parts[0]
         minute_expression = self._expression_parts[1]
         hour_expression = self._expression_parts[2]
+        messages = self.get_text.templates.messages
 
         description = StringBuilder()
 
@@ -160,7 +184,7 @@ class ExpressionDescriptor:
             any(exp in hour_expression for exp in self._special_characters) is False and \
                 any(exp in seconds_expression for exp in self._special_characters) is False:
             # specific time of day (i.e. 10 14)
-            description.append(self.translate("At "))
+            description.append(messages["At "])
             description.append(
                 self.format_time(
                     hour_expression,
@@ -171,13 +195,13 @@ class ExpressionDescriptor:
                 any(exp in hour_expression for exp in self._special_characters) is False:
             # minute range in single hour (i.e. 0-10 11)
             minute_parts = minute_expression.split("-")
-            description.append(self.translate("Every minute between {0} and {1}").format(
+            description.append(messages["Every minute between {0} and {1}"].format(
                 self.format_time(hour_expression, minute_parts[0]), self.format_time(hour_expression, minute_parts[1])))
         elif seconds_expression == "" and "," in hour_expression and "-" not in hour_expression and \
                 any(exp in minute_expression for exp in self._special_characters) is False:
             # hours list with single minute (o.e. 30 6,14,16)
             hour_parts = hour_expression.split(",")
-            description.append(self.translate("At"))
+            description.append(messages["At"])
             for i, hour_part in enumerate(hour_parts):
                 description.append(" ")
                 description.append(self.format_time(hour_part, minute_expression))
@@ -186,7 +210,7 @@ class ExpressionDescriptor:
                     description.append(",")
 
                 if i == len(hour_parts) - 2:
-                    description.append(self.translate(" and"))
+                    description.append(messages[" and"])
         else:
             # default time description
             seconds_description = self.get_seconds_description()
@@ -213,28 +237,12 @@ class ExpressionDescriptor:
             The SECONDS description
 
         """
+        return self.get_segment_description(self._expression_parts[0], self.get_text.templates.seconds, str, self._seconds_format)
 
-        def get_description_format(s: str) -> str:
-            if s == "0":
-                return ""
-
-            try:
-                if int(s) < 20:
-                    return self.translate("at {0} seconds past the minute")
-
-                return self.translate("at {0} seconds past the minute [grThen20]") or self.translate("at {0} seconds past the minute")
-            except ValueError:
-                return self.translate("at {0} seconds past the minute")
-
-        return self.get_segment_description(
-            self._expression_parts[0],
-            self.translate("every second"),
-            lambda s: s,
-            lambda s: self.translate("every {0} seconds").format(s),
-            lambda _: self.translate("seconds {0} through {1} past the minute"),
-            get_description_format,
-            lambda _: self.translate(", second {0} through second {1}") or self.translate(", {0} through {1}"),
-        )
+    def _seconds_format(self, s: str) -> str:
+        if s == "0":
+            return ""
+        return self.get_description_format(s, self.get_text.templates.seconds)
 
     def get_minutes_description(self) -> str:
         """Generates a description for only the MINUTE portion of the expression
@@ -243,29 +251,12 @@ class ExpressionDescriptor:
             The MINUTE description
 
         """
-        seconds_expression = self._expression_parts[0]
-
-        def get_description_format(s: str) -> str:
-            if s == "0" and seconds_expression == "":
-                return ""
-
-            try:
-                if int(s) < 20:
-                    return self.translate("at {0} minutes past the hour")
+        return self.get_segment_description(self._expression_parts[1], self.get_text.templates.minutes, str, self._minutes_format)
 
-                return self.translate("at {0} minutes past the hour [grThen20]") or self.translate("at {0} minutes past the hour")
-            except ValueError:
-                return self.translate("at {0} minutes past the hour")
-
-        return self.get_segment_description(
-            self._expression_parts[1],
-            self.translate("every minute"),
-            lambda s: s,
-            lambda s: self.translate("every {0} minutes").format(s),
-            lambda _: self.translate("minutes {0} through {1} past the hour"),
-            get_description_format,
-            lambda _: self.translate(", minute {0} through minute {1}") or self.translate(", {0} through {1}"),
-        )
+    def _minutes_format(self, s: str) -> str:
+        if s == "0" and self._expression_parts[0] == "":
+            return ""
+        return self.get_description_format(s, self.get_text.templates.minutes)
 
     def get_hours_description(self) -> str:
         """Generates a description for only the HOUR portion of the expression
@@ -274,16 +265,10 @@ class ExpressionDescriptor:
             The HOUR description
 
         """
-        expression = self._expression_parts[2]
-        return self.get_segment_description(
-            expression,
-            self.translate("every hour"),
-            lambda s: self.format_time(s, "0"),
-            lambda s: self.translate("every {0} hours").format(s),
-            lambda _: self.translate("between {0} and {1}"),
-            lambda _: self.translate("at {0}"),
-            lambda _: self.translate(", hour {0} through hour {1}") or self.translate(", {0} through {1}"),
-        )
+        return self.get_segment_description(self._expression_parts[2], self.get_text.templates.hours, self._format_hour)
+
+    def _format_hour(self, s: str) -> str:
+        return self.format_time(s, "0")
 
     def get_day_of_week_description(self) -> str:
         """Generates a description for only the DAYOFWEEK portion of the expression
@@ -298,48 +283,29 @@ class ExpressionDescriptor:
             # or a dupe description like "every day, every day".
             return ""
 
-        def get_day_name(s: str) -> str:
-            exp = s
-            if "#" in s:
-                exp, _ = s.split("#", 2)
-            elif "L" in s:
-                exp = exp.replace("L", "")
-            return ExpressionDescriptor.number_to_day(int(exp))
-
-        def get_format(s: str) -> str:
-            if "#" in s:
-                day_of_week_of_month = s[s.find("#") + 1:]
-
-                try:
-                    day_of_week_of_month_number = int(day_of_week_of_month)
-                    choices = {
-                        1: self.translate("first"),
-                        2: self.translate("second"),
-                        3: self.translate("third"),
-                        4: self.translate("fourth"),
-                        5: self.translate("fifth"),
-                    }
-                    day_of_week_of_month_description = choices.get(day_of_week_of_month_number, "")
-                except ValueError:
-                    day_of_week_of_month_description = ""
-
-                formatted = "{}{}{}".format(self.translate(", on the "), day_of_week_of_month_description, self.translate(" {0} of the month"))
-            elif "L" in s:
-                formatted = self.translate(", on the last {0} of the month")
-            else:
-                formatted = self.translate(", only on {0}")
+        return self.get_segment_description(self._expression_parts[5], self.get_text.templates.day_of_week, self._day_name, self._day_of_week_format)
 
-            return formatted
+    def _day_name(self, s: str) -> str:
+        exp = s
+        if "#" in s:
+            exp, _ = s.split("#", 2)
+        elif "L" in s:
+            exp = exp.replace("L", "")
+        return ExpressionDescriptor.number_to_day(int(exp), self.get_text.names.days)
 
-        return self.get_segment_description(
-            self._expression_parts[5],
-            self.translate(", every day"),
-            lambda s: get_day_name(s),
-            lambda s: self.translate(", every {0} days of the week").format(s),
-            lambda _: self.translate(", {0} through {1}"),
-            lambda s: get_format(s),
-            lambda _: self.translate(", {0} through {1}"),
-        )
+    def _day_of_week_format(self, s: str) -> str:
+        templates = self.get_text.templates
+        if "#" in s:
+            try:
+                day_of_week_of_month_number = int(s[s.find("#") + 1:])
+            except ValueError:
+                day_of_week_of_month_number = 0
+            ordinals = templates.ordinals
+            day_of_week_of_month_description = ordinals[day_of_week_of_month_number] if 0 < day_of_week_of_month_number < len(ordinals) else ""
+            return f"{templates.messages[', on the ']}{day_of_week_of_month_description}{templates.messages[' {0} of the month']}"
+        if "L" in s:
+            return templates.messages[", on the last {0} of the month"]
+        return templates.day_of_week.description
 
     def get_month_description(self) -> str:
         """Generates a description for only the MONTH portion of the expression
@@ -348,15 +314,14 @@ class ExpressionDescriptor:
             The MONTH description
 
         """
-        return self.get_segment_description(
-            self._expression_parts[4],
-            "",
-            lambda s: datetime.date(datetime.datetime.now(tz=datetime.timezone.utc).date().year, int(s), 1).strftime("%B"),
-            lambda s: self.translate(", every {0} months").format(s),
-            lambda _: self.translate(", month {0} through month {1}") or self.translate(", {0} through {1}"),
-            lambda _: self.translate(", only in {0}"),
-            lambda _: self.translate(", month {0} through month {1}") or self.translate(", {0} through {1}"),
-        )
+        return self.get_segment_description(self._expression_parts[4], self.get_text.templates.month, self._month_name)
+
+    def _month_name(self, s: str) -> str:
+        month = int(s)
+        if not 1 <= month <= 12:
+            msg = f"Month {month} is out of range!"
+            raise FormatError(msg)
+        return self.get_text.names.months[month]
 
     def get_day_of_month_description(self) -> str:
         """Generates a description for only the DAYOFMONTH portion of the expression
@@ -366,40 +331,31 @@ class ExpressionDescriptor:
 
         """
         expression = self._expression_parts[3]
+        messages = self.get_text.templates.messages
 
         if expression == "L":
-            description = self.translate(", on the last day of the month")
+            description = messages[", on the last day of the month"]
         elif expression in ("LW", "WL"):
-            description = self.translate(", on the last weekday of the month")
+            description = messages[", on the last weekday of the month"]
         else:
-            regex = re.compile(r"(\d{1,2}W)|(W\d{1,2})")
-            m = regex.match(expression)
+            m = self._weekday_regex.match(expression)
             if m:  # if matches
                 day_number = int(m.group().replace("W", ""))
 
-                day_string = self.translate("first weekday") if day_number == 1 else self.translate("weekday nearest day {0}").format(day_number)
-                description = self.translate(", on the {0} of the month").format(day_string)
+                day_string = messages["first weekday"] if day_number == 1 else messages["weekday nearest day {0}"].format(day_number)
+                description = messages[", on the {0} of the month"].format(day_string)
             elif expression == "*" and self._expression_parts[5] != "*":
                 # DOW is specified, but DOM is *, so do not generate DOM description.
                 # Otherwise, we could get a contradiction like "every day, on Tuesday"
                 description = ""
             else:
                 # Handle "last day offset"(i.e.L - 5: "5 days before the last day of the month")
-                regex = re.compile(r"L-(\d{1,2})")
-                m = regex.match(expression)
+                m = self._last_day_offset_regex.match(expression)
                 if m:  # if matches
                     off_set_days = m.group(1)
-                    description = self.translate(", {0} days before the last day of the month").format(off_set_days)
+                    description = messages[", {0} days before the last day of the month"].format(off_set_days)
                 else:
-                    description = self.get_segment_description(
-                        expression,
-                        self.translate(", every day"),
-                        lambda s: s,
-                        lambda s: self.translate(", every day") if s == "1" else self.translate(", every {0} days"),
-                        lambda _: self.translate(", between day {0} and {1} of the month"),
-                        lambda _: self.translate(", on day {0} of the month"),
-                        lambda _: self.translate(", {0} through {1}"),
-                    )
+                    description = self.get_segment_description(expression, self.get_text.templates.day_of_month, str)
 
         return description
 
@@ -410,46 +366,48 @@ class ExpressionDescriptor:
             The YEAR description
 
         """
+        return self.get_segment_description(self._expression_parts[6], self.get_text.templates.year, self._format_year)
+
+    def _format_year(self, s: str) -> str:
+        if self._year_regex.match(s):
+            year_int = int(s)
+            if year_int < 1900:
+                return str(year_int)
+            return datetime.date(year_int, 1, 1).strftime("%Y")
+
+        return s
+
+    @staticmethod
+    def get_description_format(s: str, segment: Segment) -> str:
+        """Returns format for single value or list, values of 20 and more may have own format (i.e. in Russian)
+
+        Args:
+            s: Value or list
+            segment: Formats of expression part
+        Returns:
+            Format with {0} for value description
 
-        def format_year(s: str) -> str:
-            regex = re.compile(r"^\d+$")
-            if regex.match(s):
-                year_int = int(s)
-                if year_int < 1900:
-                    return str(year_int)
-                return datetime.date(year_int, 1, 1).strftime("%Y")
-
-            return s
-
-        return self.get_segment_description(
-            self._expression_parts[6],
-            "",
-            lambda s: format_year(s),
-            lambda s: self.translate(", every {0} years").format(s),
-            lambda _: self.translate(", year {0} through year {1}") or self.translate(", {0} through {1}"),
-            lambda _: self.translate(", only in {0}"),
-            lambda _: self.translate(", year {0} through year {1}") or self.translate(", {0} through {1}"),
-        )
+        """
+        if segment.description_large is segment.description:
+            return segment.description
+        try:
+            return segment.description_large if int(s) >= 20 else segment.description
+        except ValueError:
+            return segment.description
 
     def get_segment_description(
         self,
         expression: str,
-        all_description: str,
+        segment: Segment,
         get_single_item_description: Callable[[str], str],
-        get_interval_description_format: Callable[[str], str],
-        get_between_description_format: Callable[[str], str],
-        get_description_format: Callable[[str], str],
-        get_range_format: Callable[[str], str],
+        get_description_format: Callable[[str], str] | None = None,
     ) -> str:
         """Returns segment description
         Args:
             expression: Segment to descript
-            all_description: *
-            get_single_item_description: 1
-            get_interval_description_format: 1/2
-            get_between_description_format: 1-2
-            get_description_format: format get_single_item_description
-            get_range_format: function that formats range expressions depending on cron parts
+            segment: Resolved formats of the segment
+            get_single_item_description: Describes single value, i.e. day name for day of week
+            get_description_format: Picks format for single value or list, segment.description is used when None
         Returns:
             segment description
 
@@ -458,20 +416,22 @@ class ExpressionDescriptor:
             return ""
 
         if expression == "*":
-            return all_description
+            return segment.all_description
 
         if not any(ext in expression for ext in ["/", "-", ","]):
-            return get_description_format(expression).format(get_single_item_description(expression))
+            description_format = segment.description if get_description_format is None else get_description_format(expression)
+            return description_format.format(get_single_item_description(expression))
 
         if "/" in expression:
             segments = expression.split("/")
-            description = get_interval_description_format(segments[1]).format(segments[1])
+            interval = segment.interval_one if segments[1] == "1" else segment.interval
+            description = interval.format(segments[1])
 
             # interval contains 'between' piece (i.e. 2-59/3 )
             if "-" in segments[0]:
                 between_segment_description = self.generate_between_segment_description(
                     segments[0],
-                    get_between_description_format,
+                    segment.between,
                     get_single_item_description,
                 )
                 if not between_segment_description.startswith(", "):
@@ -479,47 +439,42 @@ class ExpressionDescriptor:
 
                 description += between_segment_description
             elif not any(ext in segments[0] for ext in ["*", ","]):
-                range_item_description = get_description_format(segments[0]).format(
-                    get_single_item_description(segments[0]),
-                )
+                description_format = segment.description if get_description_format is None else get_description_format(segments[0])
+                range_item_description = description_format.format(get_single_item_description(segments[0]))
                 range_item_description = range_item_description.replace(", ", "")
 
-                description += self.translate(", starting {0}").format(range_item_description)
+                description += self.get_text.templates.messages[", starting {0}"].format(range_item_description)
             return description
 
         if "," in expression:
             segments = expression.split(",")
+            last = len(segments) - 1
+            conjunction = self.get_text.templates.messages[" and "]
 
-            description_content = ""
-            for i, segment in enumerate(segments):
-                if i > 0 and len(segments) > 2:
-                    description_content += ","
+            description_content: list[str] = []
+            for i, item in enumerate(segments):
+                if i > 0 and last > 1:
+                    description_content.append(", " if i < last else ",")
 
-                    if i < len(segments) - 1:
-                        description_content += " "
+                if i > 0 and last in (i, 1):
+                    description_content.append(conjunction)
 
-                if i > 0 and len(segments) > 1 and (i == len(segments) - 1 or len(segments) == 2):
-                    description_content += self.translate(" and ")
-
-                if "-" in segment:
-                    between_segment_description = self.generate_between_segment_description(
-                        segment,
-                        get_range_format,
+                if "-" in item:
+                    description_content.append(self.generate_between_segment_description(
+                        item,
+                        segment.range,
                         get_single_item_description,
-                    )
-
-                    between_segment_description = between_segment_description.replace(", ", "")
-
-                    description_content += between_segment_description
+                    ).replace(", ", ""))
                 else:
-                    description_content += get_single_item_description(segment)
+                    description_content.append(get_single_item_description(item))
 
-            return get_description_format(expression).format(description_content)
+            description_format = segment.description if get_description_format is None else get_description_format(expression)
+            return description_format.format("".join(description_content))
 
         if "-" in expression:
             return self.generate_between_segment_description(
                 expression,
-                get_between_description_format,
+                segment.between,
                 get_single_item_description,
             )
 
@@ -528,25 +483,21 @@ class ExpressionDescriptor:
     def generate_between_segment_description(
             self,
             between_expression: str,
-            get_between_description_format: Callable[[str], str],
+            between_description_format: str,
             get_single_item_description: Callable[[str], str],
     ) -> str:
         """Generates the between segment description
         :param between_expression:
-        :param get_between_description_format:
+        :param between_description_format:
         :param get_single_item_description:
         :return: The between segment description
         """
-        description = ""
         between_segments = between_expression.split("-")
         between_segment_1_description = get_single_item_description(between_segments[0])
         between_segment_2_description = get_single_item_description(between_segments[1])
         between_segment_2_description = between_segment_2_description.replace(":00", ":59")
 
-        between_description_format = get_between_description_format(between_expression)
-        description += between_description_format.format(between_segment_1_description, between_segment_2_description)
-
-        return description
+        return between_description_format.format(between_segment_1_description, between_segment_2_description)
 
     def format_time(
         self,
@@ -567,7 +518,7 @@ class ExpressionDescriptor:
 
         period = ""
         if self._options.use_24hour_time_format is False:
-            period = self.translate("PM") if (hour >= 12) else self.translate("AM")
+            period = self.get_text.templates.messages["PM" if hour >= 12 else "AM"]
             if period:
                 # add preceding space
                 period = " " + period
@@ -595,10 +546,13 @@ class ExpressionDescriptor:
 
         """
         if not use_verbose_format:
-            description = description.replace(self.translate(", every minute"), "")
-            description = description.replace(self.translate(", every hour"), "")
-            description = description.replace(self.translate(", every day"), "")
-            description = re.sub(r", ?$", "", description)
+            for removal in self.get_text.templates.terse_removals:
+                description = description.replace(removal, "")
+            # Trailing ", " or ","
+            if description.endswith(", "):
+                description = description[:-2]
+            elif description.endswith(","):
+                description = description[:-1]
         return description
 
     @staticmethod
@@ -619,11 +573,12 @@ class ExpressionDescriptor:
         return description
 
     @staticmethod
-    def number_to_day(day_number: int) -> str:
+    def number_to_day(day_number: int, day_names: tuple[str, ...] = DEFAULT_NAMES.days) -> str:
         """Returns localized day name by its CRON number
 
         Args:
             day_number: Number of a day
+            day_names: Names indexed by CRON day number, English when not given
         Returns:
             Day corresponding to day_number
         Raises:
@@ -631,15 +586,7 @@ class ExpressionDescriptor:
 
         """
         try:
-            return [
-                calendar.day_name[6],
-                calendar.day_name[0],
-                calendar.day_name[1],
-                calendar.day_name[2],
-                calendar.day_name[3],
-                calendar.day_name[4],
-                calendar.day_name[5],
-            ][day_number]
+            return day_names[day_number]
         except IndexError as e:
             msg = f"Day {day_number} is out of range!"
             raise IndexError(msg) from e
@@ -651,14 +598,31 @@ class ExpressionDescriptor:
         return self.get_description()
 
 
-def get_description(expression: str, options: Options | None=None) -> str:
+# Opt-in memoization of get_description, disabled until resized, i.e. description_cache.resize(4096)
+description_cache: LRUCache[tuple[str | CronExpression, tuple[object, ...]], str] = LRUCache(maxsize=0)
+
+
+def get_description(expression: str | CronExpression, options: Options | None=None) -> str:
     """Generates a human readable string for the Cron Expression
+
+    Results are memoized in description_cache when it is enabled.
+
     Args:
-        expression: The cron expression string
+        expression: The cron expression string or already parsed CronExpression
         options: Options to control the output description
     Returns:
         The cron expression description
 
     """
-    descriptor = ExpressionDescriptor(expression, options)
-    return descriptor.get_description(DescriptionTypeEnum.FULL)
+    if options is None:
+        options = Options()
+
+    if description_cache.maxsize <= 0:
+        return ExpressionDescriptor(expression, options).get_description(DescriptionTypeEnum.FULL)
+
+    key = (expression, options.fingerprint())
+    description = description_cache.get(key)
+    if description is None:
+        description = ExpressionDescriptor(expression, options).get_description(DescriptionTypeEnum.FULL)
+        description_cache.put(key, description)
+    return description
@@ -56,6 +56,9 @@ class ExpressionParser:
         12: "DEC",
     }
 
+    _cron_day_numbers: ClassVar[dict[str, str]] = {name: str(number) for number, name in _cron_days.items()}
+    _cron_month_numbers: ClassVar[dict[str, str]] = {name: str(number) for number, name in _cron_months.items()}
+
     def __init__(self, expression: str, options: Options) -> None:
         """Initializes a new instance of the ExpressionParser class
         Args:
@@ -119,108 +122,152 @@ class ExpressionParser:
     def normalize_expression(self, expression_parts: list[str]) -> None:
         """Converts cron expression components into consistent, predictable formats.
 
+        Every part is visited once, month and day of week parts are converted by single scan
+        that replaces names, step starts and day digits together.
+
         Args:
             expression_parts: A 7 part string array, one part for each component of the cron expression
         Returns:
             None
 
         """
-        # convert ? to * only for DOM and DOW
-        expression_parts[3] = expression_parts[3].replace("?", "*")
-        expression_parts[5] = expression_parts[5].replace("?", "*")
-
-        # convert 0/, 1/ to */
-        if expression_parts[0].startswith("0/"):
-            expression_parts[0] = expression_parts[0].replace("0/", "*/")  # seconds
-
-        if expression_parts[1].startswith("0/"):
-            expression_parts[1] = expression_parts[1].replace("0/", "*/")  # minutes
-
-        if expression_parts[2].startswith("0/"):
-            expression_parts[2] = expression_parts[2].replace("0/", "*/")  # hours
-
-        if expression_parts[3].startswith("1/"):
-            expression_parts[3] = expression_parts[3].replace("1/", "*/")  # DOM
-
-        if expression_parts[4].startswith("1/"):
-            expression_parts[4] = expression_parts[4].replace("1/", "*/")  # Month
-
-        if expression_parts[5].startswith("1/"):
-            expression_parts[5] = expression_parts[5].replace("1/", "*/")  # DOW
-
-        if expression_parts[6].startswith("1/"):
-            expression_parts[6] = expression_parts[6].replace("1/", "*/")  # Years
-
-        # Adjust DOW based on dayOfWeekStartIndexZero option
-        def digit_replace(match: re.Match[str]) -> str:
-            match_value = match.group()
-            dow_digits = re.sub(r"\D", "", match_value)
-            dow_digits_adjusted = dow_digits
-            if self._options.day_of_week_start_index_zero:
-                if dow_digits == "7":
-                    dow_digits_adjusted = "0"
-            else:
-                dow_digits_adjusted = str(int(dow_digits) - 1)
-
-            return match_value.replace(dow_digits, dow_digits_adjusted)
-
-        expression_parts[5] = re.sub(r"(^\d)|([^#/\s]\d)", digit_replace, expression_parts[5])
-
-        # Convert DOM '?' to '*'
-        if expression_parts[3] == "?":
-            expression_parts[3] = "*"
-
-        # convert SUN-SAT format to 0-6 format
-        for day_number in self._cron_days:
-            expression_parts[5] = expression_parts[5].upper().replace(self._cron_days[day_number], str(day_number))
-
-        # convert JAN-DEC format to 1-12 format
-        for month_number in self._cron_months:
-            expression_parts[4] = expression_parts[4].upper().replace(
-                self._cron_months[month_number], str(month_number))
+        # Seconds, minutes, hours: convert 0/ to */
+        for i in (0, 1, 2):
+            part = expression_parts[i]
+            if part.startswith("0/"):
+                part = part.replace("0/", "*/")
+            expression_parts[i] = "*" if part == "*/1" else part
 
         # convert 0 second to (empty)
-        if expression_parts[0] == "0":
-            expression_parts[0] = ""
+        seconds = expression_parts[0]
+        if seconds == "0":
+            seconds = expression_parts[0] = ""
 
         # If time interval is specified for seconds or minutes and next time part is single item, make it a "self-range" so
         # the expression can be interpreted as an interval 'between' range.
         # For example:
         # 0-20/3 9 * * * => 0-20/3 9-9 * * * (9 => 9-9)
         # */5 3 * * * => */5 3-3 * * * (3 => 3-3)
-        star_and_slash = ["*", "/"]
-        has_part_zero_star_and_slash = any(ext in expression_parts[0] for ext in star_and_slash)
-        has_part_one_star_and_slash = any(ext in expression_parts[1] for ext in star_and_slash)
-        has_part_two_special_chars = any(ext in expression_parts[2] for ext in ["*", "-", ",", "/"])
-        if not has_part_two_special_chars and (has_part_zero_star_and_slash or has_part_one_star_and_slash):
-            expression_parts[2] += f"-{expression_parts[2]}"
-
-        # Loop through all parts and apply global normalization
-        length = len(expression_parts)
-        for i in range(length):
-
-            # convert all '*/1' to '*'
-            if expression_parts[i] == "*/1":
-                expression_parts[i] = "*"
-
-            """
-            Convert Month,DOW,Year step values with a starting value (i.e. not '*') to between expressions.
-            This allows us to reuse the between expression handling for step values.
-
-            For Example:
-            - month part '3/2' will be converted to '3-12/2' (every 2 months between March and December)
-            - DOW part '3/2' will be converted to '3-6/2' (every 2 days between Tuesday and Saturday)
-            """
-
-            if "/" in expression_parts[i] and not any(exp in expression_parts[i] for exp in ["*", "-", ","]):
-                choices = {
-                    4: "12",
-                    5: "6",
-                    6: "9999",
-                }
-
-                step_range_through = choices.get(i)
-
-                if step_range_through is not None:
-                    parts = expression_parts[i].split("/")
-                    expression_parts[i] = f"{parts[0]}-{step_range_through}/{parts[1]}"
+        minutes = expression_parts[1]
+        hours = expression_parts[2]
+        if ("*" in seconds or "/" in seconds or "*" in minutes or "/" in minutes) and \
+                not ("*" in hours or "-" in hours or "," in hours or "/" in hours):
+            expression_parts[2] = f"{hours}-{hours}"
+
+        # DOM: convert ? to *, 1/ to */
+        part = expression_parts[3].replace("?", "*")
+        if part.startswith("1/"):
+            part = part.replace("1/", "*/")
+        expression_parts[3] = "*" if part == "*/1" else part
+
+        # Month: convert 1/ to */, JAN-DEC format to 1-12 format
+        part = expression_parts[4]
+        if part != "*":
+            part = self._step_to_range(self._scan_month(part), "12")
+        expression_parts[4] = part
+
+        # DOW: convert ? to *, 1/ to */, adjust digits based on dayOfWeekStartIndexZero option, convert SUN-SAT format to 0-6 format
+        part = expression_parts[5]
+        if part not in ("*", "?"):
+            part = self._step_to_range(self._scan_day_of_week(part, start_index_zero=self._options.day_of_week_start_index_zero), "6")
+        expression_parts[5] = "*" if part == "?" else part
+
+        # Year: convert 1/ to */
+        part = expression_parts[6]
+        if part and part != "*":
+            if part.startswith("1/"):
+                part = part.replace("1/", "*/")
+            part = self._step_to_range(part, "9999")
+        expression_parts[6] = part
+
+    @staticmethod
+    def _step_to_range(part: str, step_range_through: str) -> str:
+        """Convert Month,DOW,Year step values with a starting value (i.e. not '*') to between expressions.
+
+        This allows us to reuse the between expression handling for step values.
+
+        For Example:
+        - month part '3/2' will be converted to '3-12/2' (every 2 months between March and December)
+        - DOW part '3/2' will be converted to '3-6/2' (every 2 days between Tuesday and Saturday)
+        """
+        if part == "*/1":
+            return "*"
+
+        if "/" in part and "*" not in part and "-" not in part and "," not in part:
+            parts = part.split("/")
+            return f"{parts[0]}-{step_range_through}/{parts[1]}"
+
+        return part
+
+    @classmethod
+    def _scan_month(cls, part: str) -> str:
+        """Converts month part in single scan: 1/ to */ when part starts with it, JAN-DEC to 1-12
+        """
+        text = part.upper()
+        steps_from_start = text.startswith("1/")
+        month_numbers = cls._cron_month_numbers
+        converted: list[str] = []
+        i = 0
+        length = len(text)
+        while i < length:
+            if steps_from_start and text.startswith("1/", i):
+                converted.append("*/")
+                i += 2
+            elif (number := month_numbers.get(text[i:i + 3])) is not None:
+                converted.append(number)
+                i += 3
+            else:
+                converted.append(text[i])
+                i += 1
+        return "".join(converted)
+
+    @classmethod
+    def _scan_day_of_week(cls, part: str, *, start_index_zero: bool) -> str:
+        """Converts day of week part in single scan: ? to *, 1/ to */ when part starts with it,
+        digits based on dayOfWeekStartIndexZero option and SUN-SAT to 0-6
+
+        Digit is adjusted when it is first character or follows anything but #, / or whitespace,
+        two such digits are adjusted as one number. Adjusted digit is never adjusted again and day numbers
+        created from names are not adjusted.
+        """
+        text = part.upper()
+        steps_from_start = text.startswith("1/")
+        day_numbers = cls._cron_day_numbers
+        converted: list[str] = []
+        i = 0
+        length = len(text)
+        while i < length:
+            char = text[i]
+            following = text[i + 1] if i + 1 < length else ""
+            if steps_from_start and char == "1" and following == "/":
+                converted.append("*/")
+                i += 2
+            elif i == 0 and char.isdecimal():
+                converted.append(cls._shift_day_digit(char, start_index_zero=start_index_zero))
+                i += 1
+            elif following.isdecimal() and char not in "#/" and not char.isspace() and not (steps_from_start and text.startswith("1/", i + 1)):
+                if char.isdecimal():
+                    # Two digits are adjusted as one number
+                    converted.append(cls._shift_day_digit(char + following, start_index_zero=start_index_zero))
+                else:
+                    converted.append("*" if char == "?" else char)
+                    converted.append(cls._shift_day_digit(following, start_index_zero=start_index_zero))
+                i += 2
+            elif (number := day_numbers.get(text[i:i + 3])) is not None and not (number == "6" and text[i + 3:i + 5] in ("HU", "UE")):
+                # SAT must not take T of following THU/TUE, those were converted first when names were replaced one by one
+                converted.append(number)
+                i += 3
+                if text[i:i + 1].isdecimal() and not (steps_from_start and text.startswith("1/", i)):
+                    # Digit right after name follows its last letter
+                    converted.append(cls._shift_day_digit(text[i], start_index_zero=start_index_zero))
+                    i += 1
+            else:
+                converted.append("*" if char == "?" else char)
+                i += 1
+        return "".join(converted)
+
+    @staticmethod
+    def _shift_day_digit(digits: str, *, start_index_zero: bool) -> str:
+        if start_index_zero:
+            return "0" if digits == "7" else digits
+        return str(int(digits) - 1)
@@ -1,601 +1,571 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
 from __future__ import annotations
 
 import re
-from typing import ClassVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, NamedTuple
 
-from cron_descriptor import FormatError
+from .Exception import FormatError
 
+if TYPE_CHECKING:
+    from .CronExpression import CronExpression
 
-class ExpressionValidator:
-    _cron_days: ClassVar[dict[int, str]] = {
-        0: "SUN",
-        1: "MON",
-        2: "TUE",
-        3: "WED",
-        4: "THU",
-        5: "FRI",
-        6: "SAT",
-    }
-
-    _cron_months: ClassVar[dict[int, str]] = {
-        1: "JAN",
-        2: "FEB",
-        3: "MAR",
-        4: "APR",
-        5: "MAY",
-        6: "JUN",
-        7: "JUL",
-        8: "AUG",
-        9: "SEP",
-        10: "OCT",
-        11: "NOV",
-        12: "DEC",
-    }
-
-    def validate(self, expression: str) -> None:
-        """Parses the cron expression string
-        Returns:
-            A 7 part string array, one part for each component of the cron expression (seconds, minutes, etc.)
+# Field names used in ValidationError, indexes match parts of 7 part expression
+FIELD_NAMES = ("Second", "Minute", "Hour", "DayOfMonth", "Month", "DayOfWeek", "Year")
+
+CRON_DAYS = {"SUN": 0, "MON": 1, "TUE": 2, "WED": 3, "THU": 4, "FRI": 5, "SAT": 6}
+CRON_MONTHS = {"JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5, "JUN": 6, "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12}
+
+_year_regex = re.compile(r"\d{4}$")
+
+# Highest n of day of week n#k
+WEEK_MAXIMUM = 5
+
+
+class ValidationError(NamedTuple):
+    """Validation failure
+
+    code is one of:
+        parts: wrong number of parts
+        format: part does not match any allowed form
+        range: value out of bounds
+        step: increment out of bounds
+        order: range start is greater than its end
+        count: too many list items
+        name: unknown month or day name
+        week: week number of n#k out of bounds
+    field is one of FIELD_NAMES (None for parts), offset is index of offending text in expression.
+    """
+
+    code: str
+    field: str | None
+    offset: int
+    message: str
+
+
+class Rule(NamedTuple):
+    """Allowed form of field part
+
+    kind selects checks done on matched part, pattern is regular expression the whole part has to match.
+    """
+
+    kind: str
+    pattern: str
+
+
+class FieldGrammar(NamedTuple):
+    """Declarative description of one field
+
+    Rules are tried in order: rules first, gated rules only when part contains one of gate characters,
+    after rules only when it does not. First matching rule decides which checks are done.
+    """
+
+    prefix: str
+    minimum: int
+    maximum: int
+    step_maximum: int
+    limit: int
+    names: dict[str, int] | None
+    rules: tuple[Rule, ...]
+    gate: str
+    gated: tuple[Rule, ...]
+    after: tuple[Rule, ...]
+    # Messages for parts matching no rule with and without gate character
+    gated_error: str = "({prefix}) Illegal Expression Format '{expr}'"
+    error: str = "({prefix}) Illegal Expression Format '{expr}'"
+    name_error: str = "({prefix}) Invalid value '{expr}'"
+
+
+class _Check(NamedTuple):
+    code: str
+    offset: int
+    message: str
+
+
+def _number_rules(digits: str, step_digits: str) -> tuple[Rule, ...]:
+    return (
+        Rule("any", r"\*"),
+        Rule("range", rf"{digits}-{digits}"),
+        Rule("value_step", rf"{digits}/{step_digits}"),
+        Rule("range_step", rf"{digits}-{digits}/{step_digits}"),
+        Rule("star_step", rf"\*/{step_digits}"),
+    )
+
+
+SECOND_MINUTE = FieldGrammar(
+    prefix="Second and Minute", minimum=0, maximum=59, step_maximum=59, limit=60, names=None,
+    rules=(Rule("value", r"\d{1,2}"),),
+    gate="-*,/",
+    gated=(*_number_rules(r"\d{1,2}", r"\d{1,2}"), Rule("list", r"(?:\d{1,2}|\d{1,2}-\d{1,2})(?:,\d{1,2}|,\d{1,2}-\d{1,2})+")),
+    after=(),
+)
+
+HOUR = SECOND_MINUTE._replace(prefix="Hour", maximum=23, step_maximum=23, limit=24)
+
+DAY_OF_MONTH = FieldGrammar(
+    prefix="DayOfMonth", minimum=1, maximum=31, step_maximum=31, limit=31, names=None,
+    rules=(Rule("value", r"\d{1,2}"),),
+    gate="-*,/?",
+    gated=(
+        Rule("any", r"[*?]"),
+        *_number_rules(r"\d{1,2}", r"\d{1,2}")[1:],
+        Rule("value_list", r"\d{1,2}(?:,\d{1,2})+"),
+        Rule("last_offset", r"[Ll]-\d{1,2}"),
+    ),
+    after=(
+        Rule("any", r"[Ll][Ww]?|[Ww][Ll]?"),
+        Rule("suffixed", r"\d{1,2}[wW]"),
+        Rule("prefixed", r"[wW]\d{1,2}"),
+    ),
+    gated_error="Illegal Expression Format '{expr}'",
+)
+
+MONTH = FieldGrammar(
+    prefix="Month", minimum=1, maximum=12, step_maximum=12, limit=12, names=CRON_MONTHS,
+    rules=(Rule("value", r"\d{1,2}"), Rule("exact_name", r"\D{3}")),
+    gate="-*,/",
+    gated=(
+        Rule("any", r"\*"),
+        Rule("range", r"\d{1,2}-\d{1,2}"),
+        Rule("exact_name_range", r"\D{3}-\D{3}"),
+        *_number_rules(r"\d{1,2}", r"\d{1,2}")[2:],
+        Rule("value_list", r"\d{1,2}(?:,\d{1,2})+"),
+        Rule("name_list", r"(?:(?:\d{1,2}|\D{3})|(?:\D{3}-\D{3})|(?:\d{1,2}-\d{1,2}))(?:(?:,\d{1,2})+|(?:,\D{3})*|(?:,\d{1,2}-\d{1,2})*|(?:,\D{3}-\D{3})*)*"),
+    ),
+    after=(),
+    name_error="Invalid Month value '{expr}'",
+)
+
+DAY_OF_WEEK = FieldGrammar(
+    prefix="DayOfWeek", minimum=0, maximum=7, step_maximum=7, limit=7, names=CRON_DAYS,
+    rules=(
+        Rule("any", r"[*?]"),
+        Rule("value", r"\d"),
+        Rule("name", r"\D{3}"),
+        Rule("value_step", r"\d/\d"),
+        Rule("range_step", r"\d-\d/\d"),
+        Rule("star_step", r"\*/\d"),
+        Rule("range", r"\d-\d"),
+        Rule("name_range", r"\D{3}-\D{3}"),
+        Rule("name_list", r"(?:(?:\d|\D{3})|(?:\D{3}-\D{3})|(?:\d-\d))(?:(?:,\d)+|(?:,\D{3})*|(?:,\d-\d)*|(?:,\D{3}-\D{3})*)*"),
+        Rule("suffixed", r"\d[lL]"),
+        Rule("nth", r"\d#\d"),
+        Rule("name_nth", r"\D{3}#\d"),
+    ),
+    gate="",
+    gated=(),
+    after=(),
+)
+
+YEAR = FieldGrammar(
+    prefix="Year", minimum=1970, maximum=2099, step_maximum=129, limit=84, names=None,
+    rules=(Rule("value", r"\d{4}"),),
+    gate="-*,/",
+    gated=(
+        *_number_rules(r"\d{4}", r"\d{1,3}"),
+        Rule("digit_step", r"\d/\d{1,3}"),
+        Rule("list", r"(?:\d{4}|\d{4}-\d{4})(?:,\d{4}|,\d{4}-\d{4})+"),
+    ),
+    after=(),
+)
+
+
+def _value(grammar: FieldGrammar, prefix: str, value: str | int, offset: int, minimum: int | None=None, maximum: int | None=None) -> _Check | None:
+    mi = grammar.minimum if minimum is None else minimum
+    mx = grammar.maximum if maximum is None else maximum
+    number = int(value)
+    if number < mi or mx < number:
+        return _Check("range", offset, f"{prefix} values must be between {mi} and {mx} but '{value}' is provided")
+    return None
+
+
+def _step(grammar: FieldGrammar, prefix: str, value: str, offset: int) -> _Check | None:
+    number = int(value)
+    if number < 0 or grammar.step_maximum < number:
+        return _Check("step", offset, f"({prefix}) Accepted increment value range is 0~{grammar.step_maximum} but '{value}' is provided")
+    return None
+
+
+def _week(prefix: str, value: str, offset: int) -> _Check | None:
+    number = int(value)
+    if number < 0 or number > WEEK_MAXIMUM:
+        return _Check("week", offset, f"({prefix}) Accepted week value is 0~{WEEK_MAXIMUM} but '{value}' is provided")
+    return None
+
+
+def _order(grammar: FieldGrammar, prefix: str, start: str | int, end: str | int) -> _Check | None:
+    if int(start) > int(end):
+        return _Check("order", 0, f"({prefix}) Invalid range '{start}-{end}'. Accepted range is {grammar.minimum}-{grammar.maximum}")
+    return None
+
+
+def _range(grammar: FieldGrammar, prefix: str, expr: str, offset: int) -> _Check | None:
+    start, _, end = expr.partition("-")
+    return (
+        _value(grammar, prefix, start, offset)
+        or _value(grammar, prefix, end, offset + len(start) + 1)
+        or _order(grammar, prefix, start, end)
+    )
+
+
+def _check_any(_grammar: FieldGrammar, _prefix: str, _expr: str) -> _Check | None:
+    return None
+
+
+def _check_value(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    return _value(grammar, prefix, expr, 0)
+
+
+def _check_range(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    return _range(grammar, prefix, expr, 0)
+
+
+def _check_value_step(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    value, _, step = expr.partition("/")
+    return _value(grammar, prefix, value, 0) or _step(grammar, prefix, step, len(value) + 1)
+
+
+def _check_digit_step(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    value, _, step = expr.partition("/")
+    return _value(grammar, prefix, value, 0, 0, grammar.step_maximum) or _step(grammar, prefix, step, len(value) + 1)
+
+
+def _check_range_step(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    value, _, step = expr.partition("/")
+    return _range(grammar, prefix, value, 0) or _step(grammar, prefix, step, len(value) + 1)
+
+
+def _check_star_step(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    return _step(grammar, prefix, expr[2:], 2)
+
+
+def _check_count(grammar: FieldGrammar, prefix: str, items: list[str]) -> _Check | None:
+    if len(items) > grammar.limit:
+        return _Check("count", 0, f"({prefix}) Exceeded maximum number({grammar.limit}) of specified value. '{len(items)}' is provided")
+    return None
 
-        Raises:
-            MissingFieldException: if _expression is empty or None
-            FormatException: if _expression has wrong format
 
-        """
-        # Initialize all elements of parsed array to empty strings
-        parsed = ["", "", "", "", "", "", ""]
+def _check_list(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    items = expr.split(",")
+    error = _check_count(grammar, prefix, items)
+    offset = 0
+    for item in items:
+        if error:
+            break
+        error = _range(grammar, prefix, item, offset) if "-" in item else _value(grammar, prefix, item, offset)
+        offset += len(item) + 1
+    return error
 
 
-        expression_parts_temp = expression.split()
-        expression_parts_temp_length = len(expression_parts_temp)
-        if expression_parts_temp_length < 5:
-            msg = f"Error: Expression only has {expression_parts_temp_length} parts.  At least 5 part are required."
-            raise FormatError(msg)
-        if expression_parts_temp_length == 5:
-            # 5 part cron so shift array past seconds element
-            for i, expression_part_temp in enumerate(expression_parts_temp):
-                parsed[i + 1] = expression_part_temp
-        elif expression_parts_temp_length == 6:
-            # We will detect if this 6 part expression has a year specified and if so we will shift the parts and treat the
-            # first part as a minute part rather than a second part.
-            # Ways we detect:
-            # 1. Last part is a literal year (i.e. 2020)
-            # 2. 3rd or 5th part is specified as "?" (DOM or DOW)
-            year_regex = re.compile(r"\d{4}$")
-            is_year_with_no_seconds_part = bool(year_regex.search(expression_parts_temp[5])) or "?" in [
-                expression_parts_temp[4], expression_parts_temp[2]]
-            for i, expression_part_temp in enumerate(expression_parts_temp):
-                if is_year_with_no_seconds_part:
-                    # Shift parts over by one
-                    parsed[i + 1] = expression_part_temp
-                else:
-                    parsed[i] = expression_part_temp
-
-        elif expression_parts_temp_length == 7:
-            parsed = expression_parts_temp
-        else:
-            msg = f"Error: Expression has too many parts ({expression_parts_temp_length}).  Expression must not have more than 7 parts."
-            raise FormatError(msg)
+def _check_value_list(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    items = expr.split(",")
+    error = _check_count(grammar, prefix, items)
+    offset = 0
+    for item in items:
+        if error:
+            break
+        error = _value(grammar, prefix, item, offset)
+        offset += len(item) + 1
+    return error
 
-        self._validate_expression(parsed, expression_parts_temp_length)
 
-    def _validate_expression(self, expression_parts: list[str], expr_length: int) -> None:
-        """Validation for each expression fields
-        Args:
-            expression_parts: expression list
-            expr_length: length of the list
-        """
+def _check_last_offset(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    return _value(grammar, prefix, expr[2:], 2)
 
-        """
-        Apply different index for varying length of the expression parts as it is mutated by parse().
-        Does not validate the case for having both DOW,DOM value because it is already causing exception.
-        """
-        if expr_length == 5:
-            self.second_minute(expression_parts[1], "Second and Minute")
-            self.hour(expression_parts[2], "Hour")
-            self.dayofmonth(expression_parts[3], "DayOfMonth")
-            self.month(expression_parts[4], "Month")
-            self.dayofweek(expression_parts[5], "DayOfWeek")
-        elif expr_length == 6:
-            year_regex = re.compile(r"\d{4}$")
-            if year_regex.search(expression_parts[6]) is None:
-                if expression_parts[0]:
-                    self.second_minute(expression_parts[0], "Second and Minute")
-                self.second_minute(expression_parts[1], "Second and Minute")
-                self.hour(expression_parts[2], "Hour")
-                self.dayofmonth(expression_parts[3], "DayOfMonth")
-                self.month(expression_parts[4], "Month")
-                self.dayofweek(expression_parts[5], "DayOfWeek")
-            else:
-                self.second_minute(expression_parts[1], "Second and Minute")
-                self.hour(expression_parts[2], "Hour")
-                self.dayofmonth(expression_parts[3], "DayOfMonth")
-                self.month(expression_parts[4], "Month")
-                self.dayofweek(expression_parts[5], "DayOfWeek")
-                self.year(expression_parts[6], "Year")
-        else:
-            if expression_parts[0]:
-                self.second_minute(expression_parts[0], "Second and Minute")
-            self.second_minute(expression_parts[1], "Second and Minute")
-            self.hour(expression_parts[2], "Hour")
-            self.dayofmonth(expression_parts[3], "DayOfMonth")
-            self.month(expression_parts[4], "Month")
-            self.dayofweek(expression_parts[5], "DayOfWeek")
-            if expression_parts[6]:
-                self.year(expression_parts[6], "Year")
 
-    def second_minute(self, expr: str, prefix: str) -> None:
-        """ sec/min expressions (n : Number, s: String)
-        *
-        nn (1~59)
-        nn-nn
-        nn/nn
-        nn-nn/nn
-        */nn
-        nn,nn,nn (Maximum 24 elements)
-        """
-        mi, mx = (0, 59)
-        if re.match(r"\d{1,2}$", expr):
-            self.check_range(expr=expr, mi=mi, mx=mx, prefix=prefix)
-
-        elif re.search(r"[-*,/]", expr):
-            if expr == "*":
-                pass
-
-            elif re.match(r"\d{1,2}-\d{1,2}$", expr):
-                parts = expr.split("-")
-                self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"\d{1,2}/\d{1,2}$", expr):
-                parts = expr.split("/")
-                self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"\d{1,2}-\d{1,2}/\d{1,2}$", expr):
-                parts = expr.split("/")
-                fst_parts = parts[0].split("-")
-                self.check_range(expr=fst_parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(expr=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.compare_range(st=fst_parts[0], ed=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"\*/\d{1,2}$", expr):
-                parts = expr.split("/")
-                self.check_range(type_="interval", expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"^(\d{1,2}|\d{1,2}-\d{1,2})(,\d{1,2}|,\d{1,2}-\d{1,2})+$", expr):
-                limit = 60
-                expr_ls = expr.split(",")
-                if len(expr_ls) > limit:
-                    msg = f"({prefix}) Exceeded maximum number({limit}) of specified value. '{len(expr_ls)}' is provided"
-                    raise FormatError(msg)
-                for n in expr_ls:
-                    if "-" in n:
-                        parts = n.split("-")
-                        self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                        self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-                        self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-                    else:
-                        self.check_range(expr=n, mi=mi, mx=mx, prefix=prefix)
-            else:
-                msg = f"({prefix}) Illegal Expression Format '{expr}'"
-                raise FormatError(msg)
+def _check_suffixed(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    return _value(grammar, prefix, expr[:-1], 0)
 
-        else:
-            msg = f"({prefix}) Illegal Expression Format '{expr}'"
-            raise FormatError(msg)
 
-    def hour(self, expr: str, prefix: str) -> None:
-        """ hour expressions (n : Number, s: String)
-        *
-        nn (1~23)
-        nn-nn
-        nn/nn
-        nn-nn/nn
-        */nn
-        nn,nn,nn (Maximum 24 elements)
-        """
-        mi, mx = (0, 23)
-        if re.match(r"\d{1,2}$", expr):
-            self.check_range(expr=expr, mi=mi, mx=mx, prefix=prefix)
-
-        elif re.search(r"[-*,/]", expr):
-            if expr == "*":
-                pass
-
-            elif re.match(r"\d{1,2}-\d{1,2}$", expr):
-                parts = expr.split("-")
-                self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"\d{1,2}/\d{1,2}$", expr):
-                parts = expr.split("/")
-                self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"\d{1,2}-\d{1,2}/\d{1,2}$", expr):
-                parts = expr.split("/")
-                fst_parts = parts[0].split("-")
-                self.check_range(expr=fst_parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(expr=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.compare_range(st=fst_parts[0], ed=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"\*/\d{1,2}$", expr):
-                parts = expr.split("/")
-                self.check_range(type_="interval", expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"^(\d{1,2}|\d{1,2}-\d{1,2})(,\d{1,2}|,\d{1,2}-\d{1,2})+$", expr):
-                limit = 24
-                expr_ls = expr.split(",")
-                if len(expr_ls) > limit:
-                    msg = f"({prefix}) Exceeded maximum number({limit}) of specified value. '{len(expr_ls)}' is provided"
-                    raise FormatError(msg)
-                for n in expr_ls:
-                    if "-" in n:
-                        parts = n.split("-")
-                        self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                        self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-                        self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-                    else:
-                        self.check_range(expr=n, mi=mi, mx=mx, prefix=prefix)
-            else:
-                msg = f"({prefix}) Illegal Expression Format '{expr}'"
-                raise FormatError(msg)
-        else:
-            msg = f"({prefix}) Illegal Expression Format '{expr}'"
-            raise FormatError(msg)
+def _check_prefixed(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    return _value(grammar, prefix, expr[1:], 1)
 
-    def dayofmonth(self, expr: str, prefix: str) -> None:
-        """ DAYOfMonth expressions (n : Number, s: String)
-        *
-        ?
-        nn (1~31)
-        nn-nn
-        nn/nn
-        nn-nn/nn
-        */nn
-        nn,nn,nn (Maximum 31 elements)
-        L-nn
-        LW
-        nW
-        """
-        mi, mx = (1, 31)
-        if re.match(r"\d{1,2}$", expr):
-            self.check_range(expr=expr, mi=mi, mx=mx, prefix=prefix)
-        elif re.search(r"[-*,/?]", expr):
-            if expr in ("*", "?"):
-                pass
-
-            elif re.match(r"\d{1,2}-\d{1,2}$", expr):
-                parts = expr.split("-")
-                self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"\d{1,2}/\d{1,2}$", expr):
-                parts = expr.split("/")
-                self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=0, mx=mx, prefix=prefix)
-
-            elif re.match(r"\d{1,2}-\d{1,2}/\d{1,2}$", expr):
-                parts = expr.split("/")
-                fst_parts = parts[0].split("-")
-                self.check_range(expr=fst_parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(expr=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.compare_range(st=fst_parts[0], ed=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=0, mx=mx, prefix=prefix)
-
-            elif re.match(r"\*/\d{1,2}$", expr):
-                parts = expr.split("/")
-                self.check_range(type_="interval", expr=parts[1], mi=0, mx=mx, prefix=prefix)
-
-            elif re.match(r"^\d{1,2}(,\d{1,2})+$", expr):
-                limit = 31
-                expr_ls = expr.split(",")
-                if len(expr_ls) > 31:
-                    msg = f"({prefix}) Exceeded maximum number({limit}) of specified value. '{len(expr_ls)}' is provided"
-                    raise FormatError(msg)
-                for dayofmonth in expr_ls:
-                    self.check_range(expr=dayofmonth, mi=mi, mx=mx, prefix=prefix)
-            elif re.match(r"^([Ll])-(\d{1,2})$", expr):
-                parts = expr.split("-")
-                self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-            else:
-                msg = f"Illegal Expression Format '{expr}'"
-                raise FormatError(msg)
 
-        elif re.match(r"^([Ll])([Ww])?$", expr) or re.match(r"^([Ww])([Ll])?$", expr):
-            pass
+def _check_exact_name(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    if expr not in grammar.names:  # type: ignore[operator]
+        return _Check("name", 0, grammar.name_error.format(prefix=prefix, expr=expr))
+    return None
 
-        elif re.match(r"^(\d{1,2})([wW])$", expr):
-            self.check_range(expr=expr[:-1], mi=mi, mx=mx, prefix=prefix)
 
-        elif re.match(r"^([wW])(\d{1,2})$", expr):
-            self.check_range(expr=expr[1:], mi=mi, mx=mx, prefix=prefix)
+def _check_name(grammar: FieldGrammar, _prefix: str, expr: str) -> _Check | None:
+    if expr.upper() not in grammar.names:  # type: ignore[operator]
+        return _Check("name", 0, f"Invalid value '{expr}'")
+    return None
 
-        else:
-            msg = f"({prefix}) Illegal Expression Format '{expr}'"
-            raise FormatError(msg)
 
-    def month(self, expr: str, prefix: str) -> None:
-        """ month expressions (n : Number, s: String)
-        *
-        nn (1~12)
-        sss (JAN~DEC)
-        nn-nn
-        sss-sss
-        nn/nn
-        nn-nn/nn
-        */nn
-        nn,nn,nn,nn-nn,sss-sss (Maximum 12 elements)
-        """
-        mi, mx = (1, 12)
-        if re.match(r"\d{1,2}$", expr):
-            self.check_range(expr=expr, mi=mi, mx=mx, prefix=prefix)
-
-        elif re.match(r"\D{3}$", expr):
-            matched_month = [m for m in self._cron_months.values() if expr == m]
-            if len(matched_month) == 0:
-                msg = f"Invalid Month value '{expr}'"
-                raise FormatError(msg)
-
-        elif re.search(r"[-*,/]", expr):
-            if expr == "*":
-                pass
-
-            elif re.match(r"\d{1,2}-\d{1,2}$", expr):
-                parts = expr.split("-")
-                self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"\D{3}-\D{3}$", expr):
-                parts = expr.split("-")
-                cron_months = {v: k for (k, v) in self._cron_months.items()}
-                st_not_exist = parts[0] not in cron_months
-                ed_not_exist = parts[1] not in cron_months
-                if st_not_exist or ed_not_exist:
-                    msg = f"Invalid Month value '{expr}'"
-                    raise FormatError(msg)
-                self.compare_range(st=cron_months[parts[0]], ed=cron_months[parts[1]], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"\d{1,2}/\d{1,2}$", expr):
-                parts = expr.split("/")
-                self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=0, mx=mx, prefix=prefix)
-
-            elif re.match(r"\d{1,2}-\d{1,2}/\d{1,2}$", expr):
-                parts = expr.split("/")
-                fst_parts = parts[0].split("-")
-                self.check_range(expr=fst_parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(expr=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.compare_range(st=fst_parts[0], ed=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=0, mx=12, prefix=prefix)
-
-            elif re.match(r"\*/\d{1,2}$", expr):
-                parts = expr.split("/")
-                self.check_range(type_="interval", expr=parts[1], mi=0, mx=12, prefix=prefix)
-
-            elif re.match(r"^\d{1,2}(,\d{1,2})+$", expr):
-                limit = 12
-                expr_ls = expr.split(",")
-                if len(expr_ls) > limit:
-                    msg = f"({prefix}) Exceeded maximum number({limit}) of specified value. '{len(expr_ls)}' is provided"
-                    raise FormatError(msg)
-                for month in expr_ls:
-                    self.check_range(expr=month, mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"^((\d{1,2}|\D{3})|(\D{3}-\D{3})|(\d{1,2}-\d{1,2}))((,\d{1,2})+"
-                          r"|(,\D{3})*|(,\d{1,2}-\d{1,2})*|(,\D{3}-\D{3})*)*$", expr):
-                """
-                    1st Capture group : digit{1~2}|nondigit{3}|nondigit{3}-nondigit{3}|digit{3}-digit{3}
-                    2nd Capture group : same with 1st capture group but repeated.
-                """
-                limit = 12
-                expr_ls = expr.split(",")
-                if len(expr_ls) > limit:
-                    msg = f"({prefix}) Exceeded maximum number({limit}) of specified value. '{len(expr_ls)}' is provided"
-                    raise FormatError(msg)
-                cron_months = {v: k for (k, v) in self._cron_months.items()}
-                for month in expr_ls:
-                    if "-" in month:
-                        parts = month.split("-")
-                        if len(parts[0]) == 3:
-                            self.check_range(expr=cron_months[parts[0].upper()], mi=mi, mx=mx, prefix=prefix)
-                            self.check_range(expr=cron_months[parts[1].upper()], mi=mi, mx=mx, prefix=prefix)
-                        else:
-                            self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                            self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-                            self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-                    else:
-                        cron_month = cron_months[month.upper()] if len(month) == 3 else month
-                        self.check_range(expr=cron_month, mi=mi, mx=mx, prefix=prefix)
+def _check_exact_name_range(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    start, _, end = expr.partition("-")
+    names: dict[str, int] = grammar.names  # type: ignore[assignment]
+    if start not in names or end not in names:
+        return _Check("name", 0, grammar.name_error.format(prefix=prefix, expr=expr))
+    return _order(grammar, prefix, names[start], names[end])
+
+
+def _check_name_range(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    start, _, end = expr.partition("-")
+    names: dict[str, int] = grammar.names  # type: ignore[assignment]
+    start_day = names.get(start.upper())
+    end_day = names.get(end.upper())
+    if start_day is None or end_day is None:
+        return _Check("name", 0, grammar.name_error.format(prefix=prefix, expr=expr))
+    if start_day > end_day:
+        day_names = list(names)
+        return _Check("order", 0, f"({prefix}) Invalid range '{day_names[start_day]}-{day_names[end_day]}'. Accepted range is {grammar.minimum}-{grammar.maximum}")
+    return None
+
+
+def _check_name_list(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    items = expr.split(",")
+    error = _check_count(grammar, prefix, items)
+    names: dict[str, int] = grammar.names  # type: ignore[assignment]
+    # Day names in lists are numbered from 1 (SUN is 1, SAT is 7)
+    name_shift = 1 if names is CRON_DAYS else 0
+    offset = 0
+    for item in items:
+        if error:
+            break
+        if "-" in item:
+            parts = item.split("-")
+            if len(parts[0]) == 3:
+                start, end = names.get(parts[0].upper()), names.get(parts[1].upper())
+                if start is None or end is None:
+                    return _Check("name", offset, grammar.name_error.format(prefix=prefix, expr=item))
+                error = _value(grammar, prefix, start, offset) or _value(grammar, prefix, end, offset + 4)
+            elif parts[0].isdigit() and parts[1].isdigit():
+                error = _value(grammar, prefix, parts[0], offset) or _value(grammar, prefix, parts[1], offset + len(parts[0]) + 1) or _order(grammar, prefix, parts[0], parts[1])
             else:
-                msg = f"({prefix}) Illegal Expression Format '{expr}'"
-                raise FormatError(msg)
+                return _Check("format", offset, grammar.error.format(prefix=prefix, expr=expr))
+        elif len(item) == 3:
+            number = names.get(item.upper())
+            if number is None:
+                return _Check("name", offset, grammar.name_error.format(prefix=prefix, expr=item))
+            error = _value(grammar, prefix, number + name_shift, offset)
+        elif item.isdigit():
+            error = _value(grammar, prefix, item, offset)
         else:
-            msg = f"({prefix}) Illegal Expression Format '{expr}'"
-            raise FormatError(msg)
+            return _Check("format", offset, grammar.error.format(prefix=prefix, expr=expr))
+        offset += len(item) + 1
+    return error
+
+
+def _check_nth(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    return _value(grammar, prefix, expr[0], 0) or _week(prefix, expr[2], 2)
+
+
+def _check_name_nth(grammar: FieldGrammar, prefix: str, expr: str) -> _Check | None:
+    if expr[:3].upper() not in grammar.names:  # type: ignore[operator]
+        return _Check("name", 0, grammar.name_error.format(prefix=prefix, expr=expr))
+    return _week(prefix, expr[4], 4)
+
+
+_CHECKS: dict[str, Callable[[FieldGrammar, str, str], _Check | None]] = {
+    "any": _check_any,
+    "value": _check_value,
+    "range": _check_range,
+    "value_step": _check_value_step,
+    "digit_step": _check_digit_step,
+    "range_step": _check_range_step,
+    "star_step": _check_star_step,
+    "list": _check_list,
+    "value_list": _check_value_list,
+    "last_offset": _check_last_offset,
+    "suffixed": _check_suffixed,
+    "prefixed": _check_prefixed,
+    "exact_name": _check_exact_name,
+    "name": _check_name,
+    "exact_name_range": _check_exact_name_range,
+    "name_range": _check_name_range,
+    "name_list": _check_name_list,
+    "nth": _check_nth,
+    "name_nth": _check_name_nth,
+}
+
+
+class _CompiledGrammar(NamedTuple):
+    grammar: FieldGrammar
+    pattern: re.Pattern[str]
+    checks: tuple[Callable[[FieldGrammar, str, str], _Check | None], ...]
+    gate: re.Pattern[str] | None
+
+
+def _compile(grammar: FieldGrammar) -> _CompiledGrammar:
+    """Joins all rules of field into single pattern, each rule is one group tried in order
+    """
+    gate_class = f"[{re.escape(grammar.gate)}]" if grammar.gate else ""
+    alternatives = [rule.pattern for rule in grammar.rules]
+    alternatives += [f"(?=.*{gate_class}){rule.pattern}" for rule in grammar.gated]
+    alternatives += [f"(?!.*{gate_class}){rule.pattern}" for rule in grammar.after]
+    pattern = re.compile("|".join(f"({alternative})" for alternative in alternatives), re.DOTALL)
+    rules = grammar.rules + grammar.gated + grammar.after
+    # Rule patterns use only non capturing groups, so rule number is group number
+    assert pattern.groups == len(rules)  # noqa: S101
+    return _CompiledGrammar(grammar, pattern, tuple(_CHECKS[rule.kind] for rule in rules), re.compile(gate_class) if gate_class else None)
+
+
+# Compiled on first use, keeps import cheap
+_compiled: dict[int, _CompiledGrammar] = {}
+
+
+def check_field(grammar: FieldGrammar, expr: str, prefix: str | None=None) -> tuple[str, int, str] | None:
+    """Validates single field part without raising
+
+    Args:
+        grammar: Field grammar, i.e. SECOND_MINUTE or MONTH
+        expr: Field part
+        prefix: Field name used in messages, grammar prefix by default
+    Returns:
+        None for valid part, (code, offset in part, message) otherwise
+
+    """
+    compiled = _compiled.get(id(grammar))
+    if compiled is None or compiled.grammar is not grammar:
+        compiled = _compiled[id(grammar)] = _compile(grammar)
+    if prefix is None:
+        prefix = grammar.prefix
+    match = compiled.pattern.fullmatch(expr)
+    if match is None:
+        gated = compiled.gate is not None and compiled.gate.search(expr) is not None
+        message = grammar.gated_error if gated else grammar.error
+        return "format", 0, message.format(prefix=prefix, expr=expr)
+    try:
+        return compiled.checks[match.lastindex - 1](grammar, prefix, expr)  # type: ignore[operator]
+    except ValueError:
+        # Digits int() does not understand, i.e. superscripts matched by \d
+        return "format", 0, grammar.error.format(prefix=prefix, expr=expr)
+
+
+# Grammar of each of 7 parts
+PART_GRAMMARS = (SECOND_MINUTE, SECOND_MINUTE, HOUR, DAY_OF_MONTH, MONTH, DAY_OF_WEEK, YEAR)
+
+# Results of check_field remembered per part, real world parts repeat a lot ("*", "0", "1-5"), 0 disables remembering
+PART_CACHE_SIZE = 4096
+_MISSING: Any = object()
+_part_results: tuple[dict[str, tuple[str, int, str] | None], ...] = tuple({} for _ in PART_GRAMMARS)
+
+
+def check_expression(expression: str) -> ValidationError | None:
+    """Validates expression without raising
+
+    Args:
+        expression: The cron expression string
+    Returns:
+        None for valid expression, ValidationError otherwise
+
+    """
+    parts = expression.split()
+    length = len(parts)
+    if length < 5:
+        return ValidationError("parts", None, 0, f"Error: Expression only has {length} parts.  At least 5 part are required.")
+    if length > 7:
+        return ValidationError("parts", None, 0, f"Error: Expression has too many parts ({length}).  Expression must not have more than 7 parts.")
+
+    # Indexes of fields (0 second - 6 year) of validated parts
+    if length == 5:
+        fields: tuple[int, ...] = (1, 2, 3, 4, 5)
+    elif length == 6:
+        # Same detection as ExpressionParser: last part is a literal year or DOM/DOW is "?", then there are no seconds.
+        # Year is validated only when it is a literal year
+        if _year_regex.search(parts[5]):
+            fields = (1, 2, 3, 4, 5, 6)
+        elif "?" in (parts[4], parts[2]):
+            fields = (1, 2, 3, 4, 5, -1)
+        else:
+            fields = (0, 1, 2, 3, 4, 5)
+    else:
+        fields = (0, 1, 2, 3, 4, 5, 6)
+
+    for position, (field, part) in enumerate(zip(fields, parts)):
+        if field < 0:
+            continue
+        results = _part_results[field]
+        error = results.get(part, _MISSING)
+        if error is _MISSING:
+            error = check_field(PART_GRAMMARS[field], part)
+            if PART_CACHE_SIZE > 0:
+                if len(results) >= PART_CACHE_SIZE:
+                    results.clear()
+                results[part] = error
+        if error is not None:
+            code, offset, message = error
+            return ValidationError(code, FIELD_NAMES[field], _part_offset(expression, parts, position) + offset, message)
+    return None
+
+
+def _part_offset(expression: str, parts: list[str], position: int) -> int:
+    offset = 0
+    for part in parts[:position]:
+        offset = expression.find(part, offset) + len(part)
+    return expression.find(parts[position], offset)
+
+
+class ExpressionValidator:
+    """Validates cron expressions, checks are described by FieldGrammar of each field
+    """
+
+    _cron_days: ClassVar[dict[int, str]] = {number: name for name, number in CRON_DAYS.items()}
+    _cron_months: ClassVar[dict[int, str]] = {number: name for name, number in CRON_MONTHS.items()}
+
+    def validate(self, expression: str | CronExpression) -> None:
+        """Validates the cron expression string
+        Args:
+            expression: The cron expression string or CronExpression, which is validated by its original string
+
+        Raises:
+            FormatException: if expression has wrong format
 
-    def dayofweek(self, expr: str, prefix: str) -> None:
-        """ DAYOfWeek expressions (n : Number, s: String)
-        *
-        ?
-        n (0~7) - 0 and 7 used interchangeable as Sunday
-        sss (SUN~SAT)
-        n/n
-        n-n/n
-        */n
-        n-n
-        sss-sss
-        n|sss,n|sss,n|sss,n-n,sss-sss (maximum 7 elements)
-        nL
-        n#n
         """
-        mi, mx = (0, 7)
+        error = check_expression(str(expression))
+        if error is not None:
+            raise FormatError(error.message)
 
-        if expr in ("*", "?"):
-            pass
+    @staticmethod
+    def _check(grammar: FieldGrammar, expr: str, prefix: str) -> None:
+        error = check_field(grammar, expr, prefix)
+        if error is not None:
+            raise FormatError(error[2])
 
-        elif re.match(r"\d{1}$", expr):
-            self.check_range(expr=expr, mi=mi, mx=mx, prefix=prefix)
+    def second_minute(self, expr: str, prefix: str) -> None:
+        """Validates seconds or minutes part, see SECOND_MINUTE"""
+        self._check(SECOND_MINUTE, expr, prefix)
 
-        elif re.match(r"\D{3}$", expr):
-            cron_days = {v: k for (k, v) in self._cron_days.items()}
-            if expr.upper() in cron_days:
-                pass
-            else:
-                msg = f"Invalid value '{expr}'"
-                raise FormatError(msg)
-
-        elif re.match(r"\d{1}/\d{1}$", expr):
-            parts = expr.split("/")
-            self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-            self.check_range(type_="interval", expr=parts[1], mi=0, mx=mx, prefix=prefix)
-
-        elif re.match(r"\d{1}-\d{1}/\d{1}$", expr):
-            parts = expr.split("/")
-            fst_parts = parts[0].split("-")
-            self.check_range(expr=fst_parts[0], mi=mi, mx=mx, prefix=prefix)
-            self.check_range(expr=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-            self.compare_range(st=fst_parts[0], ed=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-            self.check_range(type_="interval", expr=parts[1], mi=0, mx=mx, prefix=prefix)
-
-        elif re.match(r"[*]/\d{1}$", expr):
-            parts = expr.split("/")
-            self.check_range(type_="interval", expr=parts[1], mi=0, mx=mx, prefix=prefix)
-
-        elif re.match(r"\d{1}-\d{1}$", expr):
-            parts = expr.split("-")
-            self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-            self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-            self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-        elif re.match(r"\D{3}-\D{3}$", expr):
-            parts = expr.split("-")
-            cron_days = {v: k for (k, v) in self._cron_days.items()}
-            try:
-                st_day = cron_days[parts[0].upper()]
-                ed_day = cron_days[parts[1].upper()]
-            except KeyError as e:
-                msg = f"({prefix}) Invalid value '{expr}'"
-                raise FormatError(msg) from e
-            self.compare_range(st=st_day, ed=ed_day, mi=mi, mx=mx, prefix=prefix, type_="dow")
-
-        elif re.match(r"^((\d{1}|\D{3})|(\D{3}-\D{3})|(\d{1}-\d{1}))"
-                      r"((,\d{1})+|(,\D{3})*|(,\d{1}-\d{1})*|(,\D{3}-\D{3})*)*$", expr):
-            limit = 7
-            expr_ls = expr.split(",")
-            if len(expr_ls) > limit:
-                msg = f"({prefix}) Exceeded maximum number({limit}) of specified value. '{len(expr_ls)}' is provided"
-                raise FormatError(msg)
-            cron_days = {v: k for (k, v) in self._cron_days.items()}
-            for day in expr_ls:
-                if "-" in day:
-                    parts = day.split("-")
-                    if len(parts[0]) == 3:
-                        self.check_range(expr=cron_days[parts[0].upper()], mi=mi, mx=mx, prefix=prefix)
-                        self.check_range(expr=cron_days[parts[1].upper()], mi=mi, mx=mx, prefix=prefix)
-                    else:
-                        self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                        self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-                        self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-                else:
-                    # syncronize by add 1 to cron_days index
-                    cron_day = cron_days[day.upper()] + 1 if len(day) == 3 else day
-                    self.check_range(expr=cron_day, mi=mi, mx=mx, prefix=prefix)
-
-        elif re.match(r"\d{1}([lL])$", expr):
-            parts = expr.upper().split("L")
-            self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-
-        elif re.match(r"\d#\d$", expr):
-            parts = expr.split("#")
-            self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-            self.check_range(expr=parts[1], mi=mi, mx=5, prefix=prefix, type_="dow")
-        elif re.match(r"\D{3}#\d$", expr):
-            parts = expr.split("#")
-            cron_days = {v: k for (k, v) in self._cron_days.items()}
-            try:
-                st_day = cron_days[parts[0].upper()]
-            except KeyError as e:
-                msg = f"({prefix}) Invalid value '{expr}'"
-                raise FormatError(msg) from e
-            self.check_range(expr=parts[1], mi=mi, mx=5, prefix=prefix, type_="dow")
-        else:
-            msg = f"({prefix}) Illegal Expression Format '{expr}'"
-            raise FormatError(msg)
+    def hour(self, expr: str, prefix: str) -> None:
+        """Validates hours part, see HOUR"""
+        self._check(HOUR, expr, prefix)
+
+    def dayofmonth(self, expr: str, prefix: str) -> None:
+        """Validates day of month part, see DAY_OF_MONTH"""
+        self._check(DAY_OF_MONTH, expr, prefix)
+
+    def month(self, expr: str, prefix: str) -> None:
+        """Validates month part, see MONTH"""
+        self._check(MONTH, expr, prefix)
+
+    def dayofweek(self, expr: str, prefix: str) -> None:
+        """Validates day of week part, see DAY_OF_WEEK"""
+        self._check(DAY_OF_WEEK, expr, prefix)
 
     def year(self, expr: str, prefix: str) -> None:
-        """ Year - valid expression (n : Number)
-        *
-        nnnn(1970~2099) - 4 digits number
-        nnnn-nnnn(1970~2099)
-        nnnn/nnn(0~129)
-        */nnn(0~129)
-        nnnn,nnnn,nnnn(1970~2099) - maximum 86 elements
-        """
-        mi, mx = (1970, 2099)
-        if re.match(r"\d{4}$", expr):
-            self.check_range(expr=expr, mi=mi, mx=mx, prefix=prefix)
-
-        elif re.search(r"[-*,/]", expr):
-
-            if expr == "*":
-                pass
-
-            elif re.match(r"\d{4}-\d{4}$", expr):
-                parts = expr.split("-")
-                self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-
-            elif re.match(r"\d{4}/\d{1,3}$", expr):
-                parts = expr.split("/")
-                self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=0, mx=129, prefix=prefix)
-
-            elif re.match(r"\d{4}-\d{4}/\d{1,3}$", expr):
-                parts = expr.split("/")
-                fst_parts = parts[0].split("-")
-                self.check_range(expr=fst_parts[0], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(expr=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.compare_range(st=fst_parts[0], ed=fst_parts[1], mi=mi, mx=mx, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=0, mx=129, prefix=prefix)
-
-            elif re.match(r"\*/\d{1,3}$", expr):
-                parts = expr.split("/")
-                self.check_range(type_="interval", expr=parts[1], mi=0, mx=129, prefix=prefix)
-
-            elif re.match(r"\d{1}/\d{1,3}$", expr):
-                parts = expr.split("/")
-                self.check_range(expr=parts[0], mi=0, mx=129, prefix=prefix)
-                self.check_range(type_="interval", expr=parts[1], mi=0, mx=129, prefix=prefix)
-
-            elif re.match(r"^(\d{4}|\d{4}-\d{4})(,\d{4}|,\d{4}-\d{4})+$", expr):
-                limit = 84
-                expr_ls = expr.split(",")
-                if len(expr_ls) > limit:
-                    msg = f"({prefix}) Exceeded maximum number({limit}) of specified value. '{len(expr_ls)}' is provided"
-                    raise FormatError(msg)
-                for year in expr_ls:
-                    if "-" in year:
-                        parts = year.split("-")
-                        self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
-                        self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
-                        self.compare_range(st=parts[0], ed=parts[1], mi=mi, mx=mx, prefix=prefix)
-                    else:
-                        self.check_range(expr=year, mi=mi, mx=mx, prefix=prefix)
-            else:
-                msg = f"({prefix}) Illegal Expression Format '{expr}'"
-                raise FormatError(msg)
-        else:
-            msg = f"({prefix}) Illegal Expression Format '{expr}'"
-            raise FormatError(msg)
+        """Validates year part, see YEAR"""
+        self._check(YEAR, expr, prefix)
 
     def check_range(self, prefix: str, mi: int, mx: int, expr: str | int, type_: str| None=None) -> None:
         """
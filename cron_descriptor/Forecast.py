@@ -0,0 +1,171 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import datetime as dt
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, NamedTuple
+
+from .CronExpression import CronExpression
+from .Exception import WrongArgumentError
+from .Options import Options
+from .Schedule import bit_count
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+SECONDS_PER_DAY = 86400
+
+
+class Forecast(NamedTuple):
+    """Number of fire times per bucket, counts[i] covers start + i * bucket up to the next bucket
+    """
+
+    start: dt.datetime
+    bucket: dt.timedelta
+    counts: list[int]
+
+    def times(self) -> list[dt.datetime]:
+        """Returns start time of every bucket, i.e. for use as x axis of a plot
+        """
+        return [self.start + self.bucket * i for i in range(len(self.counts))]
+
+
+def forecast(
+        expressions: Iterable[str | CronExpression],
+        start: dt.datetime,
+        end: dt.datetime,
+        bucket: dt.timedelta = dt.timedelta(hours=1),
+        options: Options | None=None,
+) -> Forecast:
+    """Counts fire times of all expressions in every bucket between start and end
+
+    Counts are computed from field bitmasks: time of day fields give number of fire times per
+    bucket of one day, which is added for every day the expression fires on. No fire time
+    is generated. Times are wall clock times, daylight saving changes are not taken into account.
+
+    Args:
+        expressions: Cron expression strings or parsed CronExpressions, duplicates are counted
+        start: Start of the first bucket
+        end: End of the last bucket
+        bucket: Bucket size, has to divide a day or be whole number of days
+        options: Parsing options used for expression strings
+    Returns:
+        Forecast with one count per bucket
+    Raises:
+        WrongArgumentException: if bucket, start or end do not fit together
+        MissingFieldException: if some expression is empty
+        FormatException: if some expression has wrong format
+
+    """
+    bucket_seconds = bucket // dt.timedelta(seconds=1)
+    if bucket_seconds <= 0 or bucket != dt.timedelta(seconds=bucket_seconds):
+        msg = "Bucket must be positive whole number of seconds"
+        raise WrongArgumentError(msg)
+    if SECONDS_PER_DAY % bucket_seconds and bucket_seconds % SECONDS_PER_DAY:
+        msg = "Bucket must divide a day or be whole number of days"
+        raise WrongArgumentError(msg)
+    window_seconds = (end - start) // dt.timedelta(seconds=1)
+    if end <= start or start + dt.timedelta(seconds=window_seconds) != end or window_seconds % bucket_seconds:
+        msg = "Time between start and end must be whole number of buckets"
+        raise WrongArgumentError(msg)
+    # Fire times are counted in bins of this size within a day
+    resolution = min(bucket_seconds, SECONDS_PER_DAY)
+    start_of_day = start.hour * 3600 + start.minute * 60 + start.second
+    if start.microsecond or start_of_day % resolution:
+        msg = f"Start must be aligned to {resolution} seconds since midnight"
+        raise WrongArgumentError(msg)
+
+    if options is None:
+        options = Options()
+    compiled: dict[str | CronExpression, CronExpression] = {}
+    multiplicity: Counter[CronExpression] = Counter()
+    for expression in expressions:
+        cron = compiled.get(expression)
+        if cron is None:
+            cron = compiled[expression] = expression if isinstance(expression, CronExpression) else CronExpression(expression, options)
+        multiplicity[cron] += 1
+
+    first_day = start.date()
+    days = [first_day + dt.timedelta(days=i) for i in range((end.date() - first_day).days + 1)]
+
+    # Expressions sharing time of day fields share the per day profile, only days they fire on differ
+    weights: defaultdict[tuple[int, int, int], list[int]] = defaultdict(lambda: [0] * len(days))
+    for cron, count in multiplicity.items():
+        schedule = cron.schedule
+        masks = schedule.masks
+        day_weights = weights[(masks.hours, masks.minutes, masks.seconds)]
+        for i, day in enumerate(days):
+            if schedule.fires_on(day):
+                day_weights[i] += count
+
+    counts = [0] * (window_seconds // bucket_seconds)
+    for key, day_weights in weights.items():
+        profile = day_profile(*key, resolution)
+        for i, weight in enumerate(day_weights):
+            if not weight:
+                continue
+            day_offset = i * SECONDS_PER_DAY - start_of_day
+            for bin_start, fires in profile:
+                offset = day_offset + bin_start
+                if 0 <= offset < window_seconds:
+                    counts[offset // bucket_seconds] += weight * fires
+
+    return Forecast(start, bucket, counts)
+
+
+def day_profile(hours: int, minutes: int, seconds: int, resolution: int) -> list[tuple[int, int]]:
+    """Counts fire times within one day in bins of resolution seconds
+
+    Args:
+        hours: Hours bitmask
+        minutes: Minutes bitmask
+        seconds: Seconds bitmask
+        resolution: Bin size in seconds, has to divide a day
+    Returns:
+        Sorted (bin start in seconds since midnight, number of fire times) pairs of non empty bins
+
+    """
+    hour_values = _values(hours)
+    bins: Counter[int] = Counter()
+    if resolution % 3600 == 0:
+        per_hour = bit_count(minutes) * bit_count(seconds)
+        for hour in hour_values:
+            bins[hour * 3600 // resolution * resolution] += per_hour
+    elif resolution % 60 == 0:
+        per_minute = bit_count(seconds)
+        minute_values = _values(minutes)
+        for hour in hour_values:
+            for minute in minute_values:
+                bins[(hour * 3600 + minute * 60) // resolution * resolution] += per_minute
+    else:
+        minute_values = _values(minutes)
+        second_values = _values(seconds)
+        for hour in hour_values:
+            for minute in minute_values:
+                for second in second_values:
+                    bins[(hour * 3600 + minute * 60 + second) // resolution * resolution] += 1
+    return sorted(bins.items())
+
+
+def _values(mask: int) -> list[int]:
+    return [value for value in range(mask.bit_length()) if mask >> value & 1]
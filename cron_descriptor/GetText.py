@@ -24,6 +24,20 @@ from __future__ import annotations
 import gettext
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from .CalendarNames import calendar_names
+from .CatalogBundle import package_bundle
+from .LRUCache import LRUCache
+from .Templates import compile_templates
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from typing import Callable
+
+    from .CalendarNames import CalendarNames
+    from .CatalogBundle import CatalogKey
+    from .Templates import Templates
 
 logger = logging.getLogger(__name__)
 
@@ -34,31 +48,231 @@ class FallBackNull(gettext.NullTranslations):
         return ""
 
 
+class CompiledTranslations(gettext.GNUTranslations):
+    """Catalog read from bundle built by tools/compilepos.py, behaves as GNUTranslations of the .mo file
+    """
+
+    def __init__(self, catalog: Mapping[CatalogKey, str], info: dict[str, str]) -> None:
+        """Initialize CompiledTranslations
+
+        Args:
+            catalog: Message ids mapped to translations, as parsed from .mo file
+            info: Catalog headers with lowercase keys
+
+        """
+        super().__init__()
+        self._catalog = catalog
+        self._info = info
+        self._charset = info.get("content-type", "").partition("charset=")[2] or None
+        self.plural = self._plural(info.get("plural-forms"))
+
+    @staticmethod
+    def _plural(plural_forms: str | None) -> Callable[[int], int]:
+        # Same as GNUTranslations._parse
+        if plural_forms is None:
+            return lambda n: int(n != 1)
+        return gettext.c2py(plural_forms.split(";")[1].split("plural=")[1])
+
+
 class GetText:
     """Handles language translations
     """
 
+    default_locale_code = "en_US"
+
     def __init__(self, locale_code: str, locale_location: str | None = None) -> None:
         """Initialize GetText
         :param locale_code selected locale
         """
-        try:
-            self.trans = self.load_locale(locale_code, locale_location)
-        except OSError:
-            logger.debug("Failed to find locale %s", locale_code)
-            logger.debug("Attempting to load en_US as fallback")
-            self.trans = self.load_locale("en_US")
+        self.locale_code = locale_code
+        # Localization kept by Options is resolved again when catalog_cache is cleared
+        self.generation = catalog_cache.generation
+        self.trans = self.resolve_locale(locale_code, locale_location)
+        # Day and month names follow the catalog that was found, so they are in the language of the description
+        self.names: CalendarNames = calendar_names(self.locale_code)
+        # Messages with fallbacks and verbosity resolved, compiled once per catalog
+        self.templates: Templates = catalog_cache.templates.get_or_create(self.trans, lambda: compile_templates(self.trans))
 
-        # Add fallback that does not return original string, this is hack to add
-        # support for _("") or _("")
-        self.trans.add_fallback(FallBackNull())
+    def resolve_locale(self, locale_code: str, locale_location: str | None = None) -> gettext.GNUTranslations:
+        """Returns catalog for locale, walking fallback chain (de_AT -> de_DE -> de -> en_US) when it is missing
+
+        Resolution result and missing catalogs are cached, so unsupported locale costs the same as supported one
+        after first lookup. Code of locale that was found is stored in locale_code.
+
+        Args:
+            locale_code: Requested locale
+            locale_location: Directory with .mo files, package locale directory when None
+        Returns:
+            Translations with FallBackNull attached
+        Raises:
+            OSError: if not even fallback locale can be loaded
+
+        """
+        key = (locale_code, locale_location)
+        resolved = catalog_cache.resolved.get(key)
+        if resolved is not None:
+            trans = self.find_locale(*resolved)
+            if trans is not None:
+                self.locale_code = resolved[0]
+                return trans
+
+        for candidate in self.locale_candidates(locale_code, locale_location):
+            trans = self.find_locale(*candidate)
+            if trans is not None:
+                if candidate != key:
+                    logger.debug("Locale %s resolved to %s", locale_code, candidate[0])
+                catalog_cache.resolved.put(key, candidate)
+                self.locale_code = candidate[0]
+                return trans
+
+        msg = f"No catalog found for locale {locale_code}"
+        raise FileNotFoundError(msg)
+
+    def locale_candidates(self, locale_code: str, locale_location: str | None = None) -> Iterator[tuple[str, str | None]]:
+        """Yields (locale_code, locale_location) pairs to try for requested locale, best match first
+
+        Args:
+            locale_code: Requested locale, "de_AT", "de-AT", "de_AT.UTF-8" and "de" forms are accepted
+            locale_location: Directory with .mo files, package locale directory when None
+        Returns:
+            Iterator of candidates
+
+        """
+        seen: set[str] = set()
+        normalized = locale_code.partition(".")[0].partition("@")[0].replace("-", "_")
+        language, _, territory = normalized.partition("_")
+        if territory:
+            normalized = f"{language.lower()}_{territory.upper()}"
+        language = language.lower()
+
+        def siblings() -> Iterator[str]:
+            # Any other territory of the same language, e.g. ja -> ja_JP
+            for name in self.available_locales(locale_location):
+                if name.startswith(f"{language}_"):
+                    yield name
+
+        for candidates in ((locale_code, normalized, f"{language}_{language.upper()}", language), siblings(), (self.default_locale_code,)):
+            for candidate in candidates:
+                if candidate and candidate not in seen:
+                    seen.add(candidate)
+                    yield candidate, locale_location
+
+        if locale_location:
+            # Package locale directory is the last resort for custom locations
+            yield self.default_locale_code, None
+
+    def find_locale(self, locale_code: str, locale_location: str | None=None) -> gettext.GNUTranslations | None:
+        """Returns cached catalog for locale, reading it from disk only when it was not looked up yet
+
+        Args:
+            locale_code: Locale to load
+            locale_location: Directory with .mo files, package locale directory when None
+        Returns:
+            Translations with FallBackNull attached or None if .mo file does not exist
+
+        """
+        return catalog_cache.get_or_create(
+            (locale_code, locale_location),
+            lambda: self.read_locale(locale_code, locale_location),
+        )
 
     def load_locale(self, locale_code: str, locale_location: str | None=None) -> gettext.GNUTranslations:
-        dir_path = Path(locale_location) if locale_location else Path(__file__).resolve().parent.joinpath("locale")
-        filename = dir_path.joinpath(f"{locale_code}.mo")
-        with filename.open("rb") as f:
-            trans = gettext.GNUTranslations(f)
-        logger.debug("%s Loaded", filename)
+        """Returns catalog for exactly this locale
+
+        Args:
+            locale_code: Locale to load
+            locale_location: Directory with .mo files, package locale directory when None
+        Returns:
+            Translations with FallBackNull attached
+        Raises:
+            OSError: if .mo file for locale_code does not exist
+
+        """
+        trans = self.find_locale(locale_code, locale_location)
+        if trans is None:
+            msg = f"No catalog found for locale {locale_code}"
+            raise FileNotFoundError(msg)
+        return trans
+
+    @staticmethod
+    def locale_dir(locale_location: str | None=None) -> Path:
+        return Path(locale_location) if locale_location else Path(__file__).resolve().parent.joinpath("locale")
+
+    @staticmethod
+    def available_locales(locale_location: str | None=None) -> list[str]:
+        """Returns sorted codes of locales in bundle for package locale, of .mo files in locale_location otherwise
+        """
+        bundle = None if locale_location else package_bundle()
+        if bundle is not None:
+            return bundle.locales()
+        return sorted(path.stem for path in GetText.locale_dir(locale_location).glob("*.mo"))
+
+    @staticmethod
+    def bundle_locale(locale_code: str) -> gettext.GNUTranslations | None:
+        """Returns catalog from package bundle, messages are looked up in memory mapped file
+
+        Args:
+            locale_code: Locale to load
+        Returns:
+            Translations or None if there is no bundle or it does not contain locale_code
+
+        """
+        bundle = package_bundle()
+        found = bundle.catalog(locale_code) if bundle is not None else None
+        return None if found is None else CompiledTranslations(*found)
+
+    @staticmethod
+    def read_locale(locale_code: str, locale_location: str | None=None) -> gettext.GNUTranslations | None:
+        """Returns catalog for locale
+
+        Package locales come from bundle, .mo file is parsed only when bundle is missing or does not have it
+        and for custom locale_location.
+
+        Args:
+            locale_code: Locale to load
+            locale_location: Directory with .mo files, package locale directory when None
+        Returns:
+            Translations with FallBackNull attached or None if catalog does not exist
+
+        """
+        trans = None if locale_location else GetText.bundle_locale(locale_code)
+        if trans is None:
+            filename = GetText.locale_dir(locale_location).joinpath(f"{locale_code}.mo")
+            try:
+                with filename.open("rb") as f:
+                    trans = gettext.GNUTranslations(f)
+            except OSError:
+                logger.debug("Failed to find locale %s", locale_code)
+                return None
+            logger.debug("%s Loaded", filename)
+
+        # Add fallback that does not return original string, this is hack to add
+        # support for _("") or _("")
+        trans.add_fallback(FallBackNull())
         return trans
 
 
+class CatalogCache(LRUCache[tuple[str, Optional[str]], Optional[gettext.GNUTranslations]]):
+    """Cache of parsed catalogs keyed by (locale_code, locale_location)
+
+    Missing catalogs are stored as None, so they are looked up on disk only once.
+    Results of fallback chain resolution are kept in resolved,
+    rendering templates compiled from catalogs in templates.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        super().__init__(maxsize)
+        self.resolved: LRUCache[tuple[str, str | None], tuple[str, str | None]] = LRUCache(maxsize * 4)
+        self.templates: LRUCache[gettext.NullTranslations, Templates] = LRUCache(maxsize)
+        # Incremented by clear(), localization resolved before is outdated
+        self.generation = 0
+
+    def clear(self) -> None:
+        super().clear()
+        self.resolved.clear()
+        self.templates.clear()
+        self.generation += 1
+
+
+# Parsed catalogs shared by all GetText instances
+catalog_cache = CatalogCache(maxsize=64)
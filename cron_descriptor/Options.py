@@ -23,15 +23,66 @@ from __future__ import annotations
 
 import locale
 import warnings
+from functools import cache
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from .CasingTypeEnum import CasingTypeEnum
+from .Exception import WrongArgumentError
+
+if TYPE_CHECKING:
+    import sys
+
+    from .GetText import GetText
+
+    if sys.version_info >= (3, 11):
+        from typing import Unpack
+    else:
+        from typing_extensions import Unpack
+
+
+class OptionsKwargs(TypedDict, total=False):
+    use_24hour_time_format: bool
+    locale_code: str
+    casing_type: CasingTypeEnum
+    verbose: bool
+    day_of_week_start_index_zero: bool
+    locale_location: str | None
+
+
+@cache
+def system_locale_code() -> str | None:
+    """Returns locale code of process, looked up once as locale.getlocale() is not free and may change under other threads
+    """
+    return locale.getlocale()[0]
 
 
 class Options:
     """
     Options for parsing and describing a Cron Expression
+
+    Options are immutable and hashable, so one instance can be shared by threads and used as cache key,
+    use replace() to get modified copy.
     """
 
+    __slots__ = (
+        "_get_text",
+        "casing_type",
+        "day_of_week_start_index_zero",
+        "locale_code",
+        "locale_location",
+        "use_24hour_time_format",
+        "verbose",
+    )
+
+    _fields = (
+        "casing_type",
+        "day_of_week_start_index_zero",
+        "locale_code",
+        "locale_location",
+        "use_24hour_time_format",
+        "verbose",
+    )
+
     locale_code: str
     casing_type: CasingTypeEnum
     verbose: bool
@@ -69,27 +120,119 @@ class Options:
                  locale_code: str | None = None,
                  locale_location: str | None = None,
                  ) -> None:
-        self.casing_type = casing_type
-        self.verbose = verbose
-        self.day_of_week_start_index_zero = day_of_week_start_index_zero
-        self.locale_location = locale_location
-
         if not locale_code:
             # Autodetect
-            code, _encoding = locale.getlocale()
-            if not code:
+            locale_code = system_locale_code()
+            if not locale_code:
                 warnings.warn(
                     "No system locale set. Falling back to 'en_US'. "
                     "Set LANG/LC_ALL or pass locale_code to override.",
                     stacklevel=2,
                 )
-                code = "en_US"
-            self.locale_code = code
-        else:
-            self.locale_code = locale_code
+                locale_code = "en_US"
 
         if use_24hour_time_format is None:
             # Autodetect
-            self.use_24hour_time_format = self.locale_code not in self._twelve_hour_locales
-        else:
-            self.use_24hour_time_format = use_24hour_time_format
+            use_24hour_time_format = locale_code not in self._twelve_hour_locales
+
+        self._set(
+            casing_type=casing_type,
+            verbose=verbose,
+            day_of_week_start_index_zero=day_of_week_start_index_zero,
+            use_24hour_time_format=use_24hour_time_format,
+            locale_code=locale_code,
+            locale_location=locale_location,
+        )
+
+    def _set(self, **values: Any) -> None:  # noqa: ANN401
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        msg = f"Options are immutable, use options.replace({name}=...) instead"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = "Options are immutable"
+        raise AttributeError(msg)
+
+    def replace(self, **changes: Unpack[OptionsKwargs]) -> Options:
+        """Returns copy of options with changed values
+
+        Values are taken as they are, i.e. use_24hour_time_format is not detected again for new locale_code.
+
+        Args:
+            changes: Option values to change
+        Returns:
+            New Options
+        Raises:
+            WrongArgumentError: if option is unknown
+
+        """
+        for name in changes:
+            if name not in self._fields:
+                msg = f"Unknown {name} configuration argument"
+                raise WrongArgumentError(msg)
+        options = object.__new__(Options)
+        options._set(**{name: getattr(self, name) for name in self._fields})
+        options._set(**changes)
+        return options
+
+    # copy.replace() on Python 3.13+
+    __replace__ = replace
+
+    def get_text(self) -> GetText:
+        """Returns localization for locale_code and locale_location, resolved once per instance
+
+        Resolved localization is kept on the instance, so describing with the same options takes no lock
+        and touches no shared cache. It is resolved again after catalog_cache.clear().
+
+        Returns:
+            GetText
+        Raises:
+            OSError: if not even fallback locale can be loaded
+
+        """
+        # GetText pulls in gettext, it is imported on first description to keep import of cron_descriptor fast
+        from .GetText import GetText, catalog_cache  # noqa: PLC0415
+
+        get_text: GetText | None = getattr(self, "_get_text", None)
+        if get_text is None or get_text.generation != catalog_cache.generation:
+            get_text = GetText(self.locale_code, self.locale_location)
+            # Benign race, threads resolving at the same time get equal localization
+            object.__setattr__(self, "_get_text", get_text)
+        return get_text
+
+    def fingerprint(self) -> tuple[str, CasingTypeEnum, bool, bool, bool, str | None]:
+        """Returns tuple of all option values, stable and hashable so it can be used as cache key
+
+        Returns:
+            Option values
+
+        """
+        return (
+            self.locale_code,
+            self.casing_type,
+            self.verbose,
+            self.day_of_week_start_index_zero,
+            self.use_24hour_time_format,
+            self.locale_location,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Options):
+            return NotImplemented
+        return self.fingerprint() == other.fingerprint()
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint())
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"Options({values})"
+
+    def __getstate__(self) -> dict[str, object]:
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._set(**state)
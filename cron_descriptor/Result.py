@@ -0,0 +1,113 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, NamedTuple
+
+from .CronExpression import CronExpression
+from .Exception import FormatException, MissingFieldException
+from .ExpressionDescriptor import get_description
+from .ExpressionValidator import ValidationError, check_expression
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from .Options import Options
+
+
+class Result(NamedTuple):
+    """Outcome of validating or describing single expression, returned instead of raising
+
+    code is None on success, otherwise one of ValidationError codes or:
+        missing: expression is empty
+        description: expression is valid but description could not be generated
+    """
+
+    ok: bool
+    value: str | None
+    code: str | None = None
+    field: str | None = None
+    offset: int = 0
+    message: str | None = None
+
+    @classmethod
+    def failure(cls, error: ValidationError) -> Result:
+        return cls(ok=False, value=None, code=error.code, field=error.field, offset=error.offset, message=error.message)
+
+
+_MISSING = Result(ok=False, value=None, code="missing", message="Field 'ExpressionDescriptor.expression' not found.")
+
+
+def _check(text: str) -> Result | None:
+    """Returns failure for empty or invalid expression, None for valid one
+    """
+    if not text:
+        return _MISSING
+    error = check_expression(text)
+    return None if error is None else Result.failure(error)
+
+
+def validate_many(expressions: Iterable[str | CronExpression], *, cache_size: int | None=None) -> Iterator[Result]:
+    """Validates many expressions, no exception is raised for invalid ones
+
+    Every unique expression is validated only once, repeated expressions reuse the first result.
+
+    Args:
+        expressions: Any iterable of cron expression strings or CronExpression
+        cache_size: Maximum number of unique results kept for reuse, unlimited when None
+    Returns:
+        Iterator yielding, in input order, Result with expression string as value
+
+    """
+    results: dict[str, Result] = {}
+    limit = sys.maxsize if cache_size is None else cache_size
+    for expression in expressions:
+        text = str(expression)
+        result = results.get(text)
+        if result is None:
+            result = _check(text) or Result(True, text)  # noqa: FBT003
+            if len(results) >= limit:
+                results.clear()
+            if limit > 0:
+                results[text] = result
+        yield result
+
+
+def try_describe(expression: str | CronExpression, options: Options | None=None) -> Result:
+    """Validates expression and generates its description, returning failure instead of raising
+
+    Args:
+        expression: The cron expression string or already parsed CronExpression
+        options: Options to control the output description
+    Returns:
+        Result with description as value
+
+    """
+    text = expression.expression if isinstance(expression, CronExpression) else expression
+    failure = _check(text)
+    if failure is not None:
+        return failure
+    try:
+        return Result(ok=True, value=get_description(expression, options))
+    except (FormatException, MissingFieldException) as e:
+        return Result(ok=False, value=None, code="description", message=str(e))
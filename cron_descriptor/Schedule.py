@@ -0,0 +1,300 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import calendar
+import datetime as dt
+from itertools import count
+from typing import TYPE_CHECKING, NamedTuple
+
+from .LRUCache import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from .CronExpression import ExpandedFields
+
+# Gregorian calendar repeats every 400 years, schedule without fire time in that span never fires
+CALENDAR_CYCLE_YEARS = 400
+
+# Bit 0 of year mask is this year
+YEAR_OFFSET = 1970
+
+
+class FieldMasks(NamedTuple):
+    """Expanded fields as integer bitmasks, bit n is set when value minimum + n is allowed
+
+    Seconds and minutes use 60 bits (0-59), hours 24 (0-23), days of month 31 (1-31),
+    months 12 (1-12), days of week 7 (0-6, Sunday first) and years start at YEAR_OFFSET,
+    None years means every year.
+    """
+
+    seconds: int
+    minutes: int
+    hours: int
+    days_of_month: int
+    months: int
+    days_of_week: int
+    years: int | None
+
+
+def to_mask(values: Iterable[int], minimum: int = 0) -> int:
+    """Returns bitmask with bit value - minimum set for each value
+    """
+    mask = 0
+    for value in values:
+        mask |= 1 << (value - minimum)
+    return mask
+
+
+def bit_count(mask: int) -> int:
+    """Returns number of set bits, int.bit_count is available since Python 3.10 only
+    """
+    return bin(mask).count("1")
+
+
+def set_bits(bits: int) -> Iterator[int]:
+    """Yields positions of set bits, lowest first
+
+    Zero runs are skipped by str.find, so cost of long sparse masks depends mostly on number of set bits.
+    """
+    digits = bin(bits)[:1:-1]
+    position = digits.find("1")
+    while position != -1:
+        yield position
+        position = digits.find("1", position + 1)
+
+
+class Schedule:
+    """Compiled cron expression matching times and finding fire times
+
+    Fields are stored as FieldMasks, so matching a time is a few bit tests. Days a schedule
+    fires on depend on year and month when day specials (L, W, nL, n#k) are used, such day
+    masks are computed once per month and cached.
+
+    Search of fire times jumps from field to field (year, month, day, hour, minute, second)
+    over set bits, so sparse schedules cost about the same as dense ones.
+
+    Day of month and day of week follow Vixie cron: when both fields are restricted
+    (neither starts with *), a day matching either of them fires.
+    """
+
+    __slots__ = ("_day_cache", "any_day_of_month", "fields", "has_day_specials", "masks")
+
+    def __init__(self, fields: ExpandedFields, *, day_of_month_star: bool, day_of_week_star: bool) -> None:
+        """Initializes schedule
+
+        Args:
+            fields: Expanded expression fields
+            day_of_month_star: Day of month part starts with *
+            day_of_week_star: Day of week part starts with *
+
+        """
+        self.fields = fields
+        # Vixie cron: both day fields restricted means either of them has to match, otherwise both
+        self.any_day_of_month = not (day_of_month_star or day_of_week_star)
+        self.has_day_specials = bool(fields.last_day_offsets or fields.nearest_weekdays or fields.last_weekday or fields.last_days_of_week or fields.nth_days_of_week)
+        self.masks = FieldMasks(
+            seconds=to_mask(fields.seconds),
+            minutes=to_mask(fields.minutes),
+            hours=to_mask(fields.hours),
+            days_of_month=to_mask(fields.days_of_month, 1),
+            months=to_mask(fields.months, 1),
+            days_of_week=to_mask(fields.days_of_week),
+            years=None if fields.years is None else to_mask(fields.years, YEAR_OFFSET),
+        )
+        self._day_cache: LRUCache[tuple[int, int], int] = LRUCache(maxsize=48)
+
+    def matches(self, time: dt.datetime) -> bool:
+        """Checks whether schedule fires at time, microseconds are ignored
+
+        Args:
+            time: Time to check
+        Returns:
+            True when schedule fires at time
+
+        """
+        masks = self.masks
+        return bool(masks.seconds >> time.second & masks.minutes >> time.minute & masks.hours >> time.hour & 1) and self.fires_on(time)
+
+    def fires_on(self, date: dt.date) -> bool:
+        """Checks whether schedule fires at some time of date
+
+        Args:
+            date: Date to check
+        Returns:
+            True when year, month and day of date match
+
+        """
+        masks = self.masks
+        if not masks.months >> (date.month - 1) & 1:
+            return False
+        if masks.years is not None and (date.year < YEAR_OFFSET or not masks.years >> (date.year - YEAR_OFFSET) & 1):
+            return False
+        if self.has_day_specials:
+            return bool(self.day_mask(date.year, date.month) >> (date.day - 1) & 1)
+        by_day_of_month = masks.days_of_month >> (date.day - 1) & 1
+        by_day_of_week = masks.days_of_week >> (date.isoweekday() % 7) & 1
+        return bool(by_day_of_month | by_day_of_week if self.any_day_of_month else by_day_of_month & by_day_of_week)
+
+    def day_mask(self, year: int, month: int) -> int:
+        """Returns mask of days the schedule fires on in month, bit 0 is the first day
+
+        Args:
+            year: Year
+            month: Month 1-12
+        Returns:
+            Day mask
+
+        """
+        return self._day_cache.get_or_create((year, month), lambda: self._compute_day_mask(year, month))
+
+    def _compute_day_mask(self, year: int, month: int) -> int:
+        fields = self.fields
+        masks = self.masks
+        first_weekday, last_day = calendar.monthrange(year, month)
+        # Cron weekday of the first day, 0 is Sunday
+        first_weekday = (first_weekday + 1) % 7
+        month_mask = (1 << last_day) - 1
+
+        def weekday(day: int) -> int:
+            return (first_weekday + day - 1) % 7
+
+        by_day_of_month = masks.days_of_month & month_mask
+        by_day_of_month |= to_mask((last_day - offset for offset in fields.last_day_offsets if offset < last_day), 1)
+        by_day_of_month |= to_mask((nearest_weekday(day, weekday(day), last_day) for day in fields.nearest_weekdays if day <= last_day), 1)
+        if fields.last_weekday:
+            by_day_of_month |= 1 << (nearest_weekday(last_day, weekday(last_day), last_day) - 1)
+
+        # Days of week repeat every 7 days starting with the first one of each in this month
+        week_mask = to_mask((day_of_week - first_weekday) % 7 for day_of_week in fields.days_of_week)
+        by_day_of_week = 0
+        for shift in range(0, last_day, 7):
+            by_day_of_week |= week_mask << shift
+        by_day_of_week &= month_mask
+        by_day_of_week |= to_mask((last_day - (weekday(last_day) - day_of_week) % 7 for day_of_week in fields.last_days_of_week), 1)
+        for day_of_week, nth in fields.nth_days_of_week:
+            day = 1 + (day_of_week - first_weekday) % 7 + (nth - 1) * 7
+            if day <= last_day:
+                by_day_of_week |= 1 << (day - 1)
+
+        if self.any_day_of_month:
+            return by_day_of_month | by_day_of_week
+        return by_day_of_month & by_day_of_week
+
+    def iter_forward(self, start: dt.datetime) -> Iterator[dt.datetime]:
+        """Yields fire times at or after start in ascending order
+
+        Args:
+            start: First candidate, microseconds are ignored
+        Returns:
+            Iterator of fire times with tzinfo of start
+
+        """
+        masks = self.masks
+        tzinfo = start.tzinfo
+        years: Iterable[int] = count(start.year) if masks.years is None else _ascending(masks.years, start.year, YEAR_OFFSET)
+        last_found = start.year
+        for year in years:
+            if year > dt.MAXYEAR or year - last_found > CALENDAR_CYCLE_YEARS:
+                return
+            at_year = year == start.year
+            for month in _ascending(masks.months, start.month if at_year else 1, 1):
+                at_month = at_year and month == start.month
+                for day in _ascending(self.day_mask(year, month), start.day if at_month else 1, 1):
+                    at_day = at_month and day == start.day
+                    for hour in _ascending(masks.hours, start.hour if at_day else 0):
+                        at_hour = at_day and hour == start.hour
+                        for minute in _ascending(masks.minutes, start.minute if at_hour else 0):
+                            at_minute = at_hour and minute == start.minute
+                            for second in _ascending(masks.seconds, start.second if at_minute else 0):
+                                last_found = year
+                                yield dt.datetime(year, month, day, hour, minute, second, tzinfo=tzinfo)
+
+    def iter_backward(self, start: dt.datetime) -> Iterator[dt.datetime]:
+        """Yields fire times at or before start in descending order
+
+        Args:
+            start: First candidate, microseconds are ignored
+        Returns:
+            Iterator of fire times with tzinfo of start
+
+        """
+        masks = self.masks
+        tzinfo = start.tzinfo
+        years: Iterable[int] = range(start.year, dt.MINYEAR - 1, -1) if masks.years is None else _descending(masks.years, start.year, YEAR_OFFSET)
+        last_found = start.year
+        for year in years:
+            if last_found - year > CALENDAR_CYCLE_YEARS:
+                return
+            at_year = year == start.year
+            for month in _descending(masks.months, start.month if at_year else 12, 1):
+                at_month = at_year and month == start.month
+                for day in _descending(self.day_mask(year, month), start.day if at_month else 31, 1):
+                    at_day = at_month and day == start.day
+                    for hour in _descending(masks.hours, start.hour if at_day else 23):
+                        at_hour = at_day and hour == start.hour
+                        for minute in _descending(masks.minutes, start.minute if at_hour else 59):
+                            at_minute = at_hour and minute == start.minute
+                            for second in _descending(masks.seconds, start.second if at_minute else 59):
+                                last_found = year
+                                yield dt.datetime(year, month, day, hour, minute, second, tzinfo=tzinfo)
+
+
+def nearest_weekday(day: int, weekday: int, last_day: int) -> int:
+    """Returns weekday (Monday-Friday) nearest to day without leaving the month
+
+    Args:
+        day: Day of month
+        weekday: Weekday of day, 0 is Sunday
+        last_day: Last day of month
+    Returns:
+        Nearest weekday
+
+    """
+    if weekday == 6:
+        return day + 2 if day == 1 else day - 1
+    if weekday == 0:
+        return day - 2 if day == last_day else day + 1
+    return day
+
+
+def _ascending(mask: int, minimum: int, offset: int = 0) -> Iterator[int]:
+    """Yields values of set bits not lower than minimum, lowest first
+    """
+    mask = mask >> (minimum - offset) << (minimum - offset) if minimum > offset else mask
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1 + offset
+        mask ^= lowest
+
+
+def _descending(mask: int, maximum: int, offset: int = 0) -> Iterator[int]:
+    """Yields values of set bits not higher than maximum, highest first
+    """
+    if maximum < offset:
+        return
+    mask &= (1 << (maximum - offset + 1)) - 1
+    while mask:
+        highest = mask.bit_length() - 1
+        yield highest + offset
+        mask ^= 1 << highest
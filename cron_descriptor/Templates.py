@@ -0,0 +1,210 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Description templates of one locale
+
+Every message used to render descriptions is looked up in catalog once, messages with an alternative
+(i.e. ", minute {0} through minute {1}" falling back to ", {0} through {1}") are stored already resolved,
+so rendering only indexes resolved strings.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import gettext
+
+# Message: message used when catalog has no translation for it
+ALTERNATIVES = {
+    ", second {0} through second {1}": ", {0} through {1}",
+    ", minute {0} through minute {1}": ", {0} through {1}",
+    ", hour {0} through hour {1}": ", {0} through {1}",
+    ", month {0} through month {1}": ", {0} through {1}",
+    ", year {0} through year {1}": ", {0} through {1}",
+    "at {0} seconds past the minute [grThen20]": "at {0} seconds past the minute",
+    "at {0} minutes past the hour [grThen20]": "at {0} minutes past the hour",
+}
+
+MESSAGES = (
+    " and",
+    " and ",
+    " {0} of the month",
+    ", between day {0} and {1} of the month",
+    ", every day",
+    ", every hour",
+    ", every minute",
+    ", every {0} days",
+    ", every {0} days of the week",
+    ", every {0} months",
+    ", every {0} years",
+    ", on day {0} of the month",
+    ", on the ",
+    ", on the last day of the month",
+    ", on the last weekday of the month",
+    ", on the last {0} of the month",
+    ", on the {0} of the month",
+    ", only in {0}",
+    ", only on {0}",
+    ", starting {0}",
+    ", {0} days before the last day of the month",
+    ", {0} through {1}",
+    "AM",
+    "At",
+    "At ",
+    "Every minute between {0} and {1}",
+    "PM",
+    "at {0}",
+    "at {0} minutes past the hour",
+    "at {0} seconds past the minute",
+    "between {0} and {1}",
+    "every hour",
+    "every minute",
+    "every second",
+    "every {0} hours",
+    "every {0} minutes",
+    "every {0} seconds",
+    "first weekday",
+    "minutes {0} through {1} past the hour",
+    "seconds {0} through {1} past the minute",
+    "weekday nearest day {0}",
+    *ALTERNATIVES,
+)
+
+# Index is number after # in day of week, 0 and anything above 5 are not described
+ORDINALS = ("", "first", "second", "third", "fourth", "fifth")
+
+# Removed from description when verbose option is off, in this order
+TERSE_REMOVALS = (", every minute", ", every hour", ", every day")
+
+
+class Segment(NamedTuple):
+    """Formats of one part of expression
+
+    all_description is used for *, interval for step (interval_one for step 1), between for range,
+    description for single value or list (description_large for values of 20 and more) and range
+    for range in list.
+    """
+    all_description: str
+    interval: str
+    interval_one: str
+    between: str
+    description: str
+    description_large: str
+    range: str
+
+
+class Templates(NamedTuple):
+    """Resolved templates of one locale
+    """
+    messages: dict[str, str]
+    ordinals: tuple[str, ...]
+    terse_removals: tuple[str, ...]
+    seconds: Segment
+    minutes: Segment
+    hours: Segment
+    day_of_month: Segment
+    month: Segment
+    day_of_week: Segment
+    year: Segment
+
+
+def compile_templates(trans: gettext.NullTranslations) -> Templates:
+    """Resolves all messages used for rendering
+
+    Args:
+        trans: Catalog with FallBackNull attached, so missing messages are empty
+    Returns:
+        Templates
+
+    """
+    messages = {message: trans.gettext(message) for message in MESSAGES}
+    for message, alternative in ALTERNATIVES.items():
+        messages[message] = messages[message] or messages[alternative]
+
+    return Templates(
+        messages=messages,
+        ordinals=tuple(trans.gettext(ordinal) if ordinal else "" for ordinal in ORDINALS),
+        # Empty translation would remove nothing
+        terse_removals=tuple(removal for removal in (messages[message] for message in TERSE_REMOVALS) if removal),
+        seconds=Segment(
+            messages["every second"],
+            messages["every {0} seconds"],
+            messages["every {0} seconds"],
+            messages["seconds {0} through {1} past the minute"],
+            messages["at {0} seconds past the minute"],
+            messages["at {0} seconds past the minute [grThen20]"],
+            messages[", second {0} through second {1}"],
+        ),
+        minutes=Segment(
+            messages["every minute"],
+            messages["every {0} minutes"],
+            messages["every {0} minutes"],
+            messages["minutes {0} through {1} past the hour"],
+            messages["at {0} minutes past the hour"],
+            messages["at {0} minutes past the hour [grThen20]"],
+            messages[", minute {0} through minute {1}"],
+        ),
+        hours=Segment(
+            messages["every hour"],
+            messages["every {0} hours"],
+            messages["every {0} hours"],
+            messages["between {0} and {1}"],
+            messages["at {0}"],
+            messages["at {0}"],
+            messages[", hour {0} through hour {1}"],
+        ),
+        day_of_month=Segment(
+            messages[", every day"],
+            messages[", every {0} days"],
+            messages[", every day"],
+            messages[", between day {0} and {1} of the month"],
+            messages[", on day {0} of the month"],
+            messages[", on day {0} of the month"],
+            messages[", {0} through {1}"],
+        ),
+        month=Segment(
+            "",
+            messages[", every {0} months"],
+            messages[", every {0} months"],
+            messages[", month {0} through month {1}"],
+            messages[", only in {0}"],
+            messages[", only in {0}"],
+            messages[", month {0} through month {1}"],
+        ),
+        day_of_week=Segment(
+            messages[", every day"],
+            messages[", every {0} days of the week"],
+            messages[", every {0} days of the week"],
+            messages[", {0} through {1}"],
+            messages[", only on {0}"],
+            messages[", only on {0}"],
+            messages[", {0} through {1}"],
+        ),
+        year=Segment(
+            "",
+            messages[", every {0} years"],
+            messages[", every {0} years"],
+            messages[", year {0} through year {1}"],
+            messages[", only in {0}"],
+            messages[", only in {0}"],
+            messages[", year {0} through year {1}"],
+        ),
+    )
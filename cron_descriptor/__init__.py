@@ -19,24 +19,109 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+"""Public API, submodules are imported on first attribute access so `import cron_descriptor` stays cheap"""
+from __future__ import annotations
 
-from .CasingTypeEnum import CasingTypeEnum
-from .DescriptionTypeEnum import DescriptionTypeEnum
-from .Exception import FormatError, FormatException, MissingFieldError, MissingFieldException, WrongArgumentError, WrongArgumentException
-from .ExpressionDescriptor import ExpressionDescriptor, get_description
-from .Options import Options
+import importlib
+import sys
+import types
+
+# Same as typing.TYPE_CHECKING without importing typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .BulkDescriptor import describe_many
+    from .CasingTypeEnum import CasingTypeEnum
+    from .Collisions import CollisionGroup, collision_report
+    from .CronExpression import CronExpression
+    from .CronIndex import CronIndex
+    from .Describer import Describer
+    from .DescriptionTypeEnum import DescriptionTypeEnum
+    from .Exception import FormatError, FormatException, MissingFieldError, MissingFieldException, WrongArgumentError, WrongArgumentException
+    from .ExpressionDescriptor import ExpressionDescriptor, description_cache, get_description
+    from .Forecast import Forecast, forecast
+    from .Options import Options
+    from .Result import Result, try_describe, validate_many
 
 __version__ = "2.0.6"
+
+# Public name: submodule defining it
+_lazy_attributes = {
+    "CasingTypeEnum": "CasingTypeEnum",
+    "CollisionGroup": "Collisions",
+    "CronExpression": "CronExpression",
+    "CronIndex": "CronIndex",
+    "Describer": "Describer",
+    "DescriptionTypeEnum": "DescriptionTypeEnum",
+    "ExpressionDescriptor": "ExpressionDescriptor",
+    "Forecast": "Forecast",
+    "FormatError": "Exception",
+    "FormatException": "Exception",
+    "MissingFieldError": "Exception",
+    "MissingFieldException": "Exception",
+    "Options": "Options",
+    "Result": "Result",
+    "WrongArgumentError": "Exception",
+    "WrongArgumentException": "Exception",
+    "collision_report": "Collisions",
+    "describe_many": "BulkDescriptor",
+    "description_cache": "ExpressionDescriptor",
+    "forecast": "Forecast",
+    "get_description": "ExpressionDescriptor",
+    "try_describe": "Result",
+    "validate_many": "Result",
+}
+
 __all__ = [
     "CasingTypeEnum",
+    "CollisionGroup",
+    "CronExpression",
+    "CronIndex",
+    "Describer",
     "DescriptionTypeEnum",
     "ExpressionDescriptor",
+    "Forecast",
     "FormatError",
     "FormatException",
     "MissingFieldError",
     "MissingFieldException",
     "Options",
+    "Result",
     "WrongArgumentError",
     "WrongArgumentException",
+    "collision_report",
+    "describe_many",
+    "description_cache",
+    "forecast",
     "get_description",
+    "try_describe",
+    "validate_many",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Imports submodule defining public name on first access and caches the name in module globals
+    """
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name: str, value: object) -> None:
+        # Importing submodule binds it on package, keep public name defined by it instead (i.e. class CronExpression)
+        if isinstance(value, types.ModuleType) and _lazy_attributes.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -1,25 +1,132 @@
+from __future__ import annotations
+
 import argparse
+import json
+import sys
+from collections import deque
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from cron_descriptor import CasingTypeEnum, Describer, Options, describe_many
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import TextIO
+
+# Number of unique descriptions remembered in --stdin mode, keeps memory use constant
+STREAM_CACHE_SIZE = 4096
+
+
+class InputLine(NamedTuple):
+    expression: str
+    record: dict[str, Any] | None
+    error: str | None
+
+
+def parse_line(line: str, field: str | None) -> InputLine:
+    """Parses single input line, plain expression or JSON object with expression in field
+
+    Args:
+        line: Input line
+        field: JSON field holding expression, None for plain text input
+    Returns:
+        Parsed line, error is set when line can not be parsed
+
+    """
+    line = line.rstrip("\r\n")
+    if field is None:
+        return InputLine(line, None, None)
+
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return InputLine("", None, f"Invalid JSON: {e}")
+    if not isinstance(record, dict):
+        return InputLine("", None, "Invalid JSON: object expected")
+    expression = record.get(field)
+    if not isinstance(expression, str):
+        return InputLine("", record, f"Field '{field}' not found.")
+    return InputLine(expression, record, None)
+
+
+def stream(input_stream: TextIO, output_stream: TextIO, options: Options, field: str | None, *, as_json: bool) -> int:
+    """Describes expressions read line by line from input_stream, writing one result per line
+
+    Args:
+        input_stream: Stream with one expression (or JSON object when field is set) per line
+        output_stream: Stream results are written to
+        options: Options to control the output description
+        field: JSON field holding expression, None for plain text input
+        as_json: Write JSON records instead of plain text, always True when field is set
+    Returns:
+        Number of lines that failed
+
+    """
+    pending: deque[InputLine] = deque()
+
+    def expressions() -> Iterator[str]:
+        for line in input_stream:
+            parsed = parse_line(line, field)
+            pending.append(parsed)
+            yield parsed.expression
+
+    failed = 0
+    for result in describe_many(expressions(), options, cache_size=STREAM_CACHE_SIZE):
+        parsed = pending.popleft()
+        error = parsed.error or (str(result) if isinstance(result, Exception) else None)
+        failed += error is not None
+
+        if field is not None or as_json:
+            record: dict[str, Any] = dict(parsed.record) if parsed.record is not None else {"expression": parsed.expression}
+            if error is None:
+                record["description"] = result
+            else:
+                record["error"] = error
+            output_stream.write(json.dumps(record, ensure_ascii=False))
+        elif error is None:
+            output_stream.write(str(result))
+        else:
+            output_stream.write(f"error: {error}")
+        output_stream.write("\n")
+        output_stream.flush()
+
+    return failed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="cron_descriptor")
+    parser.add_argument("expression", nargs="?")
+    parser.add_argument("-c", "--casing",
+                        choices=[v for v in vars(CasingTypeEnum)
+                                 if not v.startswith("_")],
+                        default="Sentence")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument("-W", "--one-indexed-week", action="store_true")
+    parser.add_argument("-H", "--use-24-hour-time-format", action="store_true")
+    parser.add_argument("-l", "--locale", help="Locale code, i.e. de_DE, system locale is used by default")
+    parser.add_argument("--stdin", action="store_true", help="Read one expression per line from stdin")
+    parser.add_argument("--field", help="Read JSON object per line from stdin and describe expression in this field")
+    parser.add_argument("--json", action="store_true", help="Write JSON record per line in --stdin mode")
+
+    args = parser.parse_args(argv)
 
-from cron_descriptor import CasingTypeEnum, ExpressionDescriptor, Options
+    streaming = args.stdin or args.field is not None
+    if streaming == (args.expression is not None):
+        parser.error("either expression or --stdin must be given")
 
-parser = argparse.ArgumentParser(prog="cron_descriptor")
-parser.add_argument("expression")
-parser.add_argument("-c", "--casing",
-                    choices=[v for v in vars(CasingTypeEnum)
-                             if not v.startswith("_")],
-                    default="Sentence")
-parser.add_argument("-v", "--verbose", action="store_true")
-parser.add_argument("-W", "--one-indexed-week", action="store_true")
-parser.add_argument("-H", "--use-24-hour-time-format", action="store_true")
+    options = Options(
+        getattr(CasingTypeEnum, args.casing),
+        verbose=args.verbose,
+        day_of_week_start_index_zero=not args.one_indexed_week,
+        use_24hour_time_format=args.use_24_hour_time_format,
+        locale_code=args.locale,
+    )
 
-args = parser.parse_args()
+    if streaming:
+        return 1 if stream(sys.stdin, sys.stdout, options, args.field, as_json=args.json) else 0
 
-options = Options()
-options.casing_type = getattr(CasingTypeEnum, args.casing)
-options.verbose = args.verbose
-options.day_of_week_start_index_zero = not args.one_indexed_week
-options.use_24hour_time_format = args.use_24_hour_time_format
+    print(Describer(options).describe(args.expression))
+    return 0
 
-descriptor = ExpressionDescriptor(args.expression, options)
 
-print(str(descriptor))
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Reading of system crontabs, /etc/cron.d fragments and user spool files
+"""
+from __future__ import annotations
+
+import logging
+import re
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
+
+from .BulkDescriptor import describe_one
+from .Describer import Describer
+from .LRUCache import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from concurrent.futures import Future
+
+    from .BulkDescriptor import DescriptionResult
+    from .Options import Options
+
+logger = logging.getLogger(__name__)
+
+MACROS: Mapping[str, str | None] = MappingProxyType({
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+    "@reboot": None,
+})
+
+SYSTEM_CRONTAB = "etc/crontab"
+SYSTEM_CRON_DIR = "etc/cron.d"
+USER_SPOOL_DIRS = ("var/spool/cron/crontabs", "var/spool/cron")
+
+_environment_line = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)$")
+
+# cron skips cron.d files with names not matching run-parts naming (i.e. *.dpkg-old, foo~)
+_cron_d_name = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+class EnvironmentSetting(NamedTuple):
+    name: str
+    value: str
+
+
+class JobLine(NamedTuple):
+    expression: str | None
+    command: str
+    user: str | None
+    macro: str | None
+
+
+class CrontabEntry(NamedTuple):
+    path: str
+    line_number: int
+    expression: str | None  # None for @reboot
+    command: str
+    user: str | None  # Only set in system crontab and cron.d fragments
+    macro: str | None
+    environment: Mapping[str, str]
+
+
+def parse_line(line: str, *, system: bool) -> JobLine | EnvironmentSetting | None:
+    """Parses single crontab line
+
+    Args:
+        line: Crontab line
+        system: Line has user column (system crontab and cron.d format)
+    Returns:
+        Parsed job or environment line, None for comments and empty lines
+
+    """
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#"):
+        return None
+
+    environment = _environment_line.match(stripped)
+    if environment:
+        name, value = environment.groups()
+        if len(value) > 1 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        return EnvironmentSetting(name, value)
+
+    if stripped.startswith("@"):
+        parts = stripped.split(None, 2 if system else 1)
+        macro = parts[0].lower()
+        expression = MACROS.get(macro, parts[0])
+        rest = parts[1:]
+    else:
+        parts = stripped.split(None, 6 if system else 5)
+        macro = None
+        expression = " ".join(parts[:5])
+        rest = parts[5:]
+
+    user = None
+    if system and rest:
+        user, *rest = rest
+    return JobLine(expression, rest[0] if rest else "", user, macro)
+
+
+def read_crontab(path: str | Path, *, system: bool | None = None) -> Iterator[CrontabEntry]:
+    """Reads crontab file line by line
+
+    Args:
+        path: Path to crontab file
+        system: File has user column, detected from path (/etc/crontab, cron.d) when None
+    Returns:
+        Iterator of job entries, environment and comment lines are not yielded
+
+    """
+    path = Path(path)
+    if system is None:
+        system = path.parent.name == "cron.d" or (path.name == "crontab" and path.parent.name == "etc")
+
+    environment: Mapping[str, str] = MappingProxyType({})
+    with path.open(encoding="utf-8", errors="replace") as f:
+        for line_number, line in enumerate(f, 1):
+            parsed = parse_line(line, system=system)
+            if isinstance(parsed, EnvironmentSetting):
+                # Entries keep snapshot of environment defined above them
+                environment = MappingProxyType({**environment, parsed.name: parsed.value})
+            elif parsed is not None:
+                yield CrontabEntry(str(path), line_number, *parsed, environment)
+
+
+def crontab_paths(root: str | Path = "/") -> list[Path]:
+    """Lists system crontab, cron.d fragments and user spool files
+
+    Args:
+        root: Filesystem root, useful for scanning mounted images
+    Returns:
+        Existing crontab files
+
+    """
+    root = Path(root)
+    paths = []
+    system_crontab = root.joinpath(SYSTEM_CRONTAB)
+    if system_crontab.is_file():
+        paths.append(system_crontab)
+
+    cron_dir = root.joinpath(SYSTEM_CRON_DIR)
+    if cron_dir.is_dir():
+        paths.extend(sorted(path for path in cron_dir.iterdir() if path.is_file() and _cron_d_name.match(path.name)))
+
+    for spool in USER_SPOOL_DIRS:
+        spool_dir = root.joinpath(spool)
+        if spool_dir.is_dir():
+            paths.extend(sorted(path for path in spool_dir.iterdir() if path.is_file() and not path.name.startswith(".")))
+    return paths
+
+
+def read_crontabs(paths: Iterable[str | Path], *, workers: int | None = None) -> Iterator[CrontabEntry]:
+    """Reads many crontab files, optionally concurrently, entries are yielded in path order
+
+    Files that can not be read are logged and skipped. Only a few files per worker are read ahead,
+    so paths are consumed lazily and memory does not grow with number of files.
+
+    Args:
+        paths: Crontab files
+        workers: Number of threads reading files, files are read one by one when None
+    Returns:
+        Iterator of job entries
+
+    """
+    if workers is None:
+        for path in paths:
+            yield from _stream_or_skip(path)
+        return
+
+    pending: deque[Future[list[CrontabEntry]]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for path in paths:
+            pending.append(executor.submit(_read_or_skip, path))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _stream_or_skip(path: str | Path) -> Iterator[CrontabEntry]:
+    try:
+        yield from read_crontab(path)
+    except OSError as e:
+        logger.warning("Failed to read crontab %s: %s", path, e)
+
+
+def _read_or_skip(path: str | Path) -> list[CrontabEntry]:
+    # Whole file is read in worker thread, entries are handed over to consumer at once
+    return list(_stream_or_skip(path))
+
+
+def describe_entries(
+    entries: Iterable[CrontabEntry],
+    options: Options | None = None,
+    *,
+    cache_size: int | None = None,
+) -> Iterator[tuple[CrontabEntry, DescriptionResult | None]]:
+    """Describes crontab entries, every distinct schedule is described only once
+
+    Args:
+        entries: Crontab entries
+        options: Options to control the output description
+        cache_size: Maximum number of distinct descriptions kept, unlimited when None
+    Returns:
+        Iterator of (entry, description or exception), description is None for @reboot
+
+    """
+    describer = Describer(options)
+
+    results: LRUCache[str, DescriptionResult] = LRUCache(sys.maxsize if cache_size is None else cache_size)
+    for entry in entries:
+        if entry.expression is None:
+            yield entry, None
+            continue
+        result = results.get(entry.expression)
+        if result is None:
+            result = describe_one(entry.expression, describer)
+            results.put(entry.expression, result)
+        yield entry, result
@@ -27,11 +27,11 @@ from __future__ import annotations
 #     "cron-descriptor",
 # ]
 # ///
-import re
 from pathlib import Path
 
 try:
-    from cron_descriptor import ExpressionDescriptor, Options
+    from cron_descriptor import Options
+    from cron_descriptor.crontab import crontab_paths, describe_entries, read_crontabs
 except ImportError:
     print("!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
     print('\033[1mFailed to import cron_descriptor, maybe ? "pip install cron-descriptor ?"\033[0m')
@@ -40,41 +40,22 @@ except ImportError:
 
 
 class CrontabReader:
-    """Simple example reading /etc/contab"""
+    """Simple example reading /etc/crontab, /etc/cron.d/* and user crontabs"""
 
-    rex = re.compile(r"^(\S{1,3}\s+\S{1,3}\s+\S{1,3}\s+\S{1,3}\s+\S{1,3}).+$")
-
-    def __init__(self, cronfile: Path) -> None:
+    def __init__(self, root: Path) -> None:
         """Initialize CrontabReader
 
         Args:
-            cronfile: Path to cronfile
+            root: Filesystem root to look for crontabs in
         Returns:
             None
         """
-        options = Options()
-        options.day_of_week_start_index_zero = False
-        options.use_24hour_time_format = True
-        with cronfile.open("r", encoding="utf-8") as f:
-            for line in f.readlines():
-                if parsed_line := self.parse_cron_line(line):
-                    print(f"{parsed_line} -> {ExpressionDescriptor(parsed_line, options)}")
-
-    def parse_cron_line(self, line: str) -> str | None:
-        """Parses crontab line and returns only starting time string
-
-        Args:
-            line: crontab line
-        Returns:
-            Time part of cron line or None
-        """
-        if (stripped := line.strip()) and not stripped.startswith("#"):
-            rexres = self.rex.search(stripped)
-            if rexres:
-                return " ".join(rexres.group(1).split())
-
-        return None
+        options = Options(use_24hour_time_format=True)
+        entries = read_crontabs(crontab_paths(root), workers=4)
+        for entry, description in describe_entries(entries, options):
+            schedule = entry.macro or entry.expression
+            print(f"{entry.path}:{entry.line_number} {schedule} -> {description or 'At startup'}")
 
 
 if __name__ == "__main__":
-    CrontabReader(Path("/etc/crontab"))
+    CrontabReader(Path("/"))
@@ -20,14 +20,21 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from cron_descriptor import DescriptionTypeEnum, ExpressionDescriptor, Options
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cron_descriptor import CasingTypeEnum, DescriptionTypeEnum, ExpressionDescriptor, Options, WrongArgumentError, get_description
+from cron_descriptor.GetText import catalog_cache
 
 """
 Testing that API of ExpressionDescriptor is working as specified in DOCs
 """
 
 def test_full(options: Options) -> None:
-    options.use_24hour_time_format = True
+    options = options.replace(use_24hour_time_format=True)
     ceh = ExpressionDescriptor("* * * * *", options)
     assert ceh.get_description(DescriptionTypeEnum.FULL) == "Every minute"
 
@@ -42,3 +49,69 @@ def test_to_repr(options: Options) -> None:
 
 def test_to_kargs(options: Options) -> None:
     assert str(ExpressionDescriptor("17 17 * * *", options, use_24hour_time_format=True)) == "At 17:17"
+
+def test_kwargs_do_not_change_options(options: Options) -> None:
+    ExpressionDescriptor("17 17 * * *", options, use_24hour_time_format=True, casing_type=CasingTypeEnum.LowerCase)
+    assert options.use_24hour_time_format is False
+    assert options.casing_type == CasingTypeEnum.Sentence
+    with pytest.raises(WrongArgumentError):
+        ExpressionDescriptor("* * * * *", options, unknown=True)  # type: ignore[call-arg]
+
+def test_options_immutable(options: Options) -> None:
+    with pytest.raises(AttributeError):
+        options.verbose = True
+    with pytest.raises(AttributeError):
+        del options.verbose
+    with pytest.raises(AttributeError):
+        options.unknown = True
+    assert not hasattr(options, "__dict__")
+
+def test_options_replace(options: Options) -> None:
+    verbose = options.replace(verbose=True)
+    assert verbose.verbose is True
+    assert options.verbose is False
+    assert verbose.replace(verbose=False) == options
+    # Values are not detected again for changed locale
+    assert options.replace(locale_code="de_DE").use_24hour_time_format is False
+    with pytest.raises(WrongArgumentError):
+        options.replace(unknown=True)  # type: ignore[call-arg]
+
+def test_options_hashable(options: Options) -> None:
+    same = Options(locale_code="en_US")
+    assert same == options
+    assert hash(same) == hash(options)
+    assert len({options, same, options.replace(verbose=True)}) == 2
+    assert options != options.fingerprint()
+    assert repr(options).startswith("Options(casing_type=")
+
+def test_options_copy(options: Options) -> None:
+    verbose = options.replace(verbose=True)
+    assert pickle.loads(pickle.dumps(verbose)) == verbose  # noqa: S301
+    assert copy.copy(verbose) == verbose
+    assert copy.deepcopy(verbose) == verbose
+
+def test_options_resolve_localization_once(options: Options) -> None:
+    get_text = options.get_text()
+    caches = (catalog_cache, catalog_cache.resolved, catalog_cache.templates)
+    before = [cache.info() for cache in caches]
+    for expression in ("*/5 * * * *", "0 12 * * MON-FRI"):
+        get_description(expression, options)
+        ExpressionDescriptor(expression, options).get_description()
+    # Describing does not look up shared caches
+    assert [cache.info() for cache in caches] == before
+    assert options.get_text() is get_text
+    # Copies resolve their own, equal options are still equal
+    assert options.replace(verbose=True).get_text() is not get_text
+    assert pickle.loads(pickle.dumps(options)) == options  # noqa: S301
+    with pytest.raises(WrongArgumentError):
+        options.replace(_get_text=None)  # type: ignore[call-arg]
+
+    catalog_cache.clear()
+    assert options.get_text() is not get_text
+    assert get_description("*/5 * * * *", options) == "Every 5 minutes"
+
+def test_shared_options_threads(options: Options) -> None:
+    expressions = ["*/5 * * * *", "0 12 * * MON-FRI", "0 0 1 JAN *"] * 50
+    expected = [get_description(expression, options) for expression in expressions]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(lambda expression: get_description(expression, options), expressions)) == expected
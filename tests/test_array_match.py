@@ -0,0 +1,83 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import datetime as dt
+
+import pytest
+
+from cron_descriptor import ArrayMatch, CronExpression, Options
+
+"""
+Tests vectorized matching of timestamp arrays
+"""
+
+EXPRESSIONS = (
+    "* * * * *",
+    "*/15 9-17 * * MON-FRI",
+    "*/20 * * * * *",
+    "0 0 1 * MON",
+    "0 0 */2 * MON",
+    "0 0 L,L-3 * ?",
+    "0 0 LW * ?",
+    "0 0 1W,15W,31W * ?",
+    "0 0 ? * 6L,2#3",
+    "0 0 0 ? 2 1#5 2027-2030",
+    "0 0 0 29 2 ? 2000/4",
+)
+
+def times(count: int, step: dt.timedelta) -> list[dt.datetime]:
+    start = dt.datetime(2026, 1, 1)  # noqa: DTZ001
+    return [start + step * i for i in range(count)]
+
+def test_match_list(options: Options) -> None:
+    expression = CronExpression("*/15 9-17 * * MON-FRI", options)
+    assert ArrayMatch.match_list(expression.schedule, [dt.datetime(2026, 10, 19, 9, 15), dt.datetime(2026, 10, 18, 9, 15)]) == [True, False]  # noqa: DTZ001
+
+def test_fallback_without_numpy(options: Options, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ArrayMatch, "numpy_module", lambda: None)
+    expression = CronExpression("0 0 L * ?", options)
+    assert expression.match_array([dt.datetime(2026, 1, 31), dt.datetime(2026, 1, 30)]) == [True, False]  # noqa: DTZ001
+
+def test_match_array(options: Options) -> None:
+    np = pytest.importorskip("numpy")
+    expression = CronExpression("*/15 9-17 * * MON-FRI", options)
+    result = expression.match_array(np.array(["2026-10-19T09:15", "2026-10-18T09:15", "2026-10-19T09:15:01"], dtype="datetime64[s]"))
+    assert result.dtype == np.bool_
+    assert result.tolist() == [True, False, False]
+
+def test_match_array_nat(options: Options) -> None:
+    np = pytest.importorskip("numpy")
+    expression = CronExpression("* * * * *", options)
+    result = expression.match_array(np.array(["NaT", "2026-10-19T09:15", "NaT"], dtype="datetime64[s]"))
+    assert result.tolist() == [False, True, False]
+    assert CronExpression("0 0 1 1 * 1970", options).match_array(np.array(["NaT"], dtype="datetime64[m]")).tolist() == [False]
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_match_array_same_as_fallback(expression: str, options: Options) -> None:
+    np = pytest.importorskip("numpy")
+    cron = CronExpression(expression, options)
+    # Days over several years hit all day specials, minutes and seconds over a few days hit time fields
+    matched = 0
+    for values in (times(365 * 6, dt.timedelta(days=1)), times(365 * 6, dt.timedelta(days=1, minutes=30)), times(10000, dt.timedelta(seconds=37))):
+        expected = ArrayMatch.match_list(cron.schedule, values)
+        assert cron.match_array(np.array(values, dtype="datetime64[s]")).tolist() == expected
+        matched += sum(expected)
+    assert matched or expression == "0 0 0 ? 2 1#5 2027-2030"
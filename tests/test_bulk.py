@@ -0,0 +1,75 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pickle
+from collections.abc import Iterator
+from unittest.mock import patch
+
+from cron_descriptor import CronExpression, FormatError, MissingFieldError, Options, describe_many, get_description
+
+"""
+Tests bulk description API
+"""
+
+def test_describe_many_order(options: Options) -> None:
+    expressions = ["* * * * *", "*/5 * * * *", "30 11 * * 1-5"]
+    assert list(describe_many(expressions, options)) == [get_description(expression, options) for expression in expressions]
+
+def test_describe_many_errors(options: Options) -> None:
+    results = list(describe_many(["* * * * *", "INVALID", "", "* * * * *"], options))
+    assert results[0] == "Every minute"
+    assert isinstance(results[1], FormatError)
+    assert isinstance(results[2], MissingFieldError)
+    assert results[3] == "Every minute"
+
+def test_describe_many_lazy(options: Options) -> None:
+    def expressions() -> Iterator[str]:
+        yield "* * * * *"
+        msg = "Not consumed"
+        raise AssertionError(msg)
+
+    assert next(describe_many(expressions(), options)) == "Every minute"
+
+def test_describe_many_dedupe(options: Options) -> None:
+    with patch("cron_descriptor.BulkDescriptor.describe_one", return_value="described") as mock_describe:
+        results = list(describe_many(["0 * * * *"] * 1000 + ["* * * * *"] * 1000, options))
+    assert results == ["described"] * 2000
+    assert mock_describe.call_count == 2
+
+def test_describe_many_bounded(options: Options) -> None:
+    with patch("cron_descriptor.BulkDescriptor.describe_one", return_value="described") as mock_describe:
+        list(describe_many(["0 * * * *", "1 * * * *", "0 * * * *"], options, cache_size=1))
+    assert mock_describe.call_count == 3
+
+def test_describe_many_cron_expression(options: Options) -> None:
+    assert list(describe_many([CronExpression("*/5 * * * *", options)], options)) == ["Every 5 minutes"]
+
+def test_describe_many_workers(options: Options) -> None:
+    expressions = [f"{minute} {minute % 24} * * *" for minute in range(60)] * 3 + ["INVALID", ""]
+    expected = list(describe_many(expressions, options))
+    results = list(describe_many(expressions, options, workers=2, chunk_size=16))
+    assert [str(result) for result in results] == [str(result) for result in expected]
+    assert [type(result) for result in results] == [type(result) for result in expected]
+
+def test_missing_field_error_pickle() -> None:
+    error = pickle.loads(pickle.dumps(MissingFieldError("expression")))  # noqa: S301
+    assert str(error) == "Field 'expression' not found."
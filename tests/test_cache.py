@@ -0,0 +1,194 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cron_descriptor import CasingTypeEnum, ExpressionDescriptor, Options, description_cache, get_description
+from cron_descriptor.GetText import GetText, catalog_cache
+from cron_descriptor.LRUCache import LRUCache
+
+"""
+Tests caching of parsed locale catalogs and descriptions
+"""
+
+@pytest.fixture
+def enabled_description_cache() -> Iterator[None]:
+    description_cache.resize(16)
+    try:
+        yield
+    finally:
+        description_cache.resize(0)
+        description_cache.clear()
+
+def test_lru_eviction() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert "a" in cache
+    assert "c" in cache
+    assert cache.info() == (1, 0, 2, 2)
+
+def test_lru_disabled() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+def test_lru_resize() -> None:
+    cache: LRUCache[int, int] = LRUCache(maxsize=10)
+    for i in range(10):
+        cache.put(i, i)
+    cache.resize(3)
+    assert len(cache) == 3
+    assert 9 in cache
+    assert 0 not in cache
+
+def test_lru_get_or_create_does_not_block() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=10)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow() -> int:
+        started.set()
+        release.wait(5)
+        return 1
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(cache.get_or_create, "a", slow)
+        assert started.wait(5)
+        # Other key is created while "a" is still being created
+        assert cache.get_or_create("b", lambda: 2) == 2
+        release.set()
+        assert future.result() == 1
+    assert cache.get_or_create("a", lambda: 3) == 1
+    assert cache.info() == (1, 2, 10, 2)
+
+def test_lru_get_or_create_concurrent_first_lookup() -> None:
+    cache: LRUCache[str, object] = LRUCache(maxsize=10)
+    both_missed = threading.Barrier(2, timeout=5)
+    first_stored = threading.Event()
+    created: list[object] = []
+    created_lock = threading.Lock()
+
+    def factory() -> object:
+        both_missed.wait()
+        value = object()
+        with created_lock:
+            created.append(value)
+            second = len(created) > 1
+        # Second factory finishes only after first value is stored
+        if second:
+            assert first_stored.wait(5)
+        return value
+
+    def lookup() -> object:
+        value = cache.get_or_create("a", factory)
+        first_stored.set()
+        return value
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = [future.result() for future in [executor.submit(lookup) for _ in range(2)]]
+
+    assert len(created) == 2
+    assert results == [created[0], created[0]]
+    assert cache.get("a") is created[0]
+    assert cache.info().misses == 2
+
+def test_lru_get_or_create_keeps_first() -> None:
+    cache: LRUCache[str, object] = LRUCache(maxsize=10)
+    first = object()
+
+    def racing() -> object:
+        cache.put("a", first)
+        return object()
+
+    assert cache.get_or_create("a", racing) is first
+
+def test_catalog_is_loaded_once() -> None:
+    catalog_cache.clear()
+    first = GetText("de_DE")
+    second = GetText("de_DE")
+    assert first.trans is second.trans
+    info = catalog_cache.info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+def test_catalog_clear() -> None:
+    first = GetText("de_DE")
+    catalog_cache.clear()
+    assert catalog_cache.info().currsize == 0
+    assert GetText("de_DE").trans is not first.trans
+
+def test_catalog_fallback_not_stacked() -> None:
+    catalog_cache.clear()
+    options = Options(locale_code="de_DE")
+    for _ in range(3):
+        assert ExpressionDescriptor("* * * * *", options).get_description() == "Jede Minute"
+    assert ExpressionDescriptor("* * * * *", options).translate("No such message") == ""
+
+def test_catalog_threads() -> None:
+    catalog_cache.clear()
+    results: list[GetText] = []
+
+    def load() -> None:
+        results.append(GetText("fr_FR"))
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(result.trans) for result in results}) == 1
+    # Threads starting together may all miss, they still share the catalog stored first
+    assert catalog_cache.info().misses >= 1
+
+def test_description_cache_disabled_by_default(options: Options) -> None:
+    get_description("* * * * *", options)
+    assert description_cache.info() == (0, 0, 0, 0)
+
+@pytest.mark.usefixtures("enabled_description_cache")
+def test_description_cache(options: Options) -> None:
+    assert get_description("*/5 * * * *", options) == "Every 5 minutes"
+    assert get_description("*/5 * * * *", options) == "Every 5 minutes"
+    assert description_cache.info() == (1, 1, 16, 1)
+
+@pytest.mark.usefixtures("enabled_description_cache")
+def test_description_cache_keyed_by_options() -> None:
+    assert get_description("*/5 * * * *", Options(locale_code="en_US")) == "Every 5 minutes"
+    assert get_description("*/5 * * * *", Options(locale_code="en_US", casing_type=CasingTypeEnum.LowerCase)) == "every 5 minutes"
+    assert description_cache.info().currsize == 2
+
+@pytest.mark.usefixtures("enabled_description_cache")
+def test_description_cache_threads(options: Options) -> None:
+    expressions = [f"{minute} * * * *" for minute in range(10)] * 20
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda expression: get_description(expression, options), expressions))
+    assert results == [get_description(expression, options) for expression in expressions]
+    assert description_cache.info().currsize == 10
@@ -27,16 +27,16 @@ Tests casing transformation
 """
 
 def test_sentence_casing(options: Options) -> None:
-    options.casing_type = CasingTypeEnum.Sentence
+    options = options.replace(casing_type=CasingTypeEnum.Sentence)
     ceh = ExpressionDescriptor("* * * * *", options)
     assert ceh.get_description(DescriptionTypeEnum.FULL) == "Every minute"
 
 def test_title_casing(options: Options) -> None:
-    options.casing_type = CasingTypeEnum.Title
+    options = options.replace(casing_type=CasingTypeEnum.Title)
     ceh = ExpressionDescriptor("* * * * *", options)
     assert ceh.get_description(DescriptionTypeEnum.FULL) == "Every Minute"
 
 def test_lower_casing(options: Options) -> None:
-    options.casing_type = CasingTypeEnum.LowerCase
+    options = options.replace(casing_type=CasingTypeEnum.LowerCase)
     ceh = ExpressionDescriptor("* * * * *", options)
     assert ceh.get_description(DescriptionTypeEnum.FULL) == "every minute"
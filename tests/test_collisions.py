@@ -0,0 +1,67 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import datetime as dt
+
+from cron_descriptor import CollisionGroup, CronExpression, Options, collision_report
+
+"""
+Tests start time collision report
+"""
+
+MONDAY = dt.date(2026, 10, 19)
+
+def test_collision_groups(options: Options) -> None:
+    expressions = ["0 * * * *", "0 * * * *", "0 */6 * * *", "30 4 * * *", "15 4 * * *"]
+    report = collision_report(expressions, options, start=MONDAY, days=1)
+    assert report == [
+        CollisionGroup(
+            expressions=("0 * * * *", "0 */6 * * *"),
+            descriptions=("Every hour", "Every 6 hours"),
+            jobs=3,
+            times=(dt.time(0), dt.time(6), dt.time(12), dt.time(18)),
+            instants_per_day=4.0,
+        ),
+        CollisionGroup(
+            expressions=("0 * * * *",),
+            descriptions=("Every hour",),
+            jobs=2,
+            times=tuple(dt.time(hour) for hour in range(24) if hour % 6),
+            instants_per_day=20.0,
+        ),
+    ]
+
+def test_collision_days(options: Options) -> None:
+    # Monday and Tuesday jobs never run together, both collide with daily job on their day
+    report = collision_report(["0 9 * * MON", "0 9 * * TUE", "0 9 * * *"], options, start=MONDAY, days=7)
+    assert [(group.expressions, group.instants_per_day) for group in report] == [
+        (("0 9 * * MON", "0 9 * * *"), 1 / 7),
+        (("0 9 * * TUE", "0 9 * * *"), 1 / 7),
+    ]
+
+def test_collision_seconds(options: Options) -> None:
+    report = collision_report(["*/30 0 0 * * *", "0 0 0 * * *", CronExpression("15 0 0 * * *", options)], options, start=MONDAY, days=1)
+    assert [(group.expressions, group.times) for group in report] == [(("*/30 0 0 * * *", "0 0 0 * * *"), (dt.time(0),))]
+
+def test_collision_min_jobs(options: Options) -> None:
+    assert collision_report(["0 * * * *", "30 * * * *"], options, start=MONDAY) == []
+    assert len(collision_report(["0 * * * *", "30 * * * *"], options, start=MONDAY, min_jobs=1)) == 2
+    assert collision_report([], options) == []
@@ -0,0 +1,100 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pickle
+
+import pytest
+
+from cron_descriptor import CasingTypeEnum, CronExpression, ExpressionDescriptor, FormatError, Options, get_description
+from cron_descriptor.ExpressionValidator import ExpressionValidator
+
+"""
+Tests parsed CronExpression
+"""
+
+def test_parts(options: Options) -> None:
+    expression = CronExpression("*/5 9 * JAN MON-FRI", options)
+    assert expression.expression == "*/5 9 * JAN MON-FRI"
+    assert expression.parts == ("", "*/5", "9-9", "*", "1", "1-5", "")
+
+def test_expanded_values(options: Options) -> None:
+    expression = CronExpression("0 */15 9-17 ? 1,6 MON-FRI 2030", options)
+    assert expression.seconds == {0}
+    assert expression.minutes == {0, 15, 30, 45}
+    assert expression.hours == set(range(9, 18))
+    assert expression.days_of_month == set(range(1, 32))
+    assert expression.months == {1, 6}
+    assert expression.days_of_week == {1, 2, 3, 4, 5}
+    assert expression.years == frozenset({2030})
+
+def test_expanded_no_year(options: Options) -> None:
+    assert CronExpression("* * * * *", options).years is None
+
+def test_expanded_step_with_start(options: Options) -> None:
+    expression = CronExpression("5/20 * 3/10 4/4 *", options)
+    assert expression.minutes == {5, 25, 45}
+    assert expression.days_of_month == {3, 13, 23}
+    assert expression.months == {4, 8, 12}
+
+def test_expanded_wrapping_range(options: Options) -> None:
+    assert CronExpression("* * * * FRI-MON", options).days_of_week == {5, 6, 0, 1}
+
+def test_expanded_one_indexed_week() -> None:
+    options = Options(locale_code="en_US", day_of_week_start_index_zero=False)
+    assert CronExpression("* * * * 1,7", options).days_of_week == {0, 6}
+
+def test_expanded_specials(options: Options) -> None:
+    expanded = CronExpression("0 15 10 L-3,15W * ? 2099", options).expanded
+    assert expanded.last_day_offsets == {3}
+    assert expanded.nearest_weekdays == {15}
+    assert CronExpression("0 0 LW * *", options).expanded.last_weekday
+    expanded = CronExpression("0 15 10 ? * 6L,2#3", options).expanded
+    assert expanded.last_days_of_week == {6}
+    assert expanded.nth_days_of_week == {(2, 3)}
+
+def test_expanded_invalid(options: Options) -> None:
+    expression = CronExpression("* 25 * * *", options)
+    with pytest.raises(FormatError):
+        _ = expression.hours
+
+def test_immutable(options: Options) -> None:
+    expression = CronExpression("* * * * *", options)
+    with pytest.raises(AttributeError):
+        expression._parts = ()  # noqa: SLF001
+
+def test_hash_and_pickle(options: Options) -> None:
+    expression = CronExpression("0 0/1 * * * ?", options)
+    assert expression == CronExpression("*/1 * * * *", options)
+    assert len({expression, CronExpression("* * * * *", options)}) == 1
+    assert pickle.loads(pickle.dumps(expression)) == expression  # noqa: S301
+
+def test_describe_many_renderings() -> None:
+    expression = CronExpression("30 11 * * 1-5", Options(locale_code="en_US"))
+    assert get_description(expression, Options(locale_code="en_US")) == "At 11:30 AM, Monday through Friday"
+    assert str(ExpressionDescriptor(expression, Options(locale_code="en_US", casing_type=CasingTypeEnum.LowerCase))) == \
+        "at 11:30 am, monday through friday"
+    assert get_description(expression, Options(locale_code="de_DE")).startswith("Um 11:30")
+
+def test_validate(options: Options) -> None:
+    ExpressionValidator().validate(CronExpression("* * ? JAN-DEC *", options))
+    with pytest.raises(FormatError):
+        ExpressionValidator().validate(CronExpression("* 25 * * *", options))
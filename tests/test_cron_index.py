@@ -0,0 +1,87 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import datetime as dt
+
+import pytest
+
+from cron_descriptor import CronExpression, CronIndex, Options
+
+"""
+Tests inverted index of cron jobs
+"""
+
+EXPRESSIONS = {
+    "every-minute": "* * * * *",
+    "workdays": "*/15 9-17 * * MON-FRI",
+    "seconds": "*/20 * * * * *",
+    "first-or-monday": "0 0 1 * MON",
+    "odd-mondays": "0 0 */2 * MON",
+    "last-day": "0 0 L,L-3 * ?",
+    "last-weekday": "0 0 LW * ?",
+    "nearest-weekday": "0 0 1W,15W * ?",
+    "last-saturday": "0 0 ? * 6L,2#3",
+    "year": "0 0 * * * 2026",
+    "other-year": "0 0 * * * 2030",
+}
+
+def build(options: Options) -> CronIndex[str]:
+    index: CronIndex[str] = CronIndex()
+    for job_id, expression in EXPRESSIONS.items():
+        index.add(job_id, expression, options)
+    return index
+
+def test_due(options: Options) -> None:
+    index = build(options)
+    assert index.due(dt.datetime(2026, 10, 19, 9, 15)) == ["every-minute", "workdays", "seconds"]  # noqa: DTZ001
+    assert index.due(dt.datetime(2026, 10, 19, 9, 15, 20)) == ["seconds"]  # noqa: DTZ001
+    assert index.due(dt.datetime(2031, 10, 19, 9, 15, 1)) == []  # noqa: DTZ001
+
+def test_due_same_as_matches(options: Options) -> None:
+    index = build(options)
+    expressions = {job_id: CronExpression(expression, options) for job_id, expression in EXPRESSIONS.items()}
+    time = dt.datetime(2025, 12, 1)  # noqa: DTZ001
+    while time < dt.datetime(2027, 1, 1):  # noqa: DTZ001
+        assert sorted(index.due(time)) == sorted(job_id for job_id, expression in expressions.items() if expression.matches(time)), time
+        time += dt.timedelta(hours=6)
+
+def test_remove(options: Options) -> None:
+    index = build(options)
+    index.remove("every-minute")
+    index.remove("year")
+    assert "every-minute" not in index
+    assert len(index) == len(EXPRESSIONS) - 2
+    assert index.due(dt.datetime(2026, 10, 19, 0, 0)) == ["seconds", "first-or-monday", "odd-mondays"]  # noqa: DTZ001
+    with pytest.raises(KeyError):
+        index.remove("every-minute")
+
+def test_add_reuses_slot_and_replaces(options: Options) -> None:
+    index = build(options)
+    index.remove("workdays")
+    index.add("new", "5 * * * *", options)
+    index.add("every-minute", CronExpression("10 * * * *", options))
+    assert index.get("every-minute") == CronExpression("10 * * * *", options)
+    assert index.get("workdays") is None
+    assert index.due(dt.datetime(2026, 10, 19, 9, 5)) == ["new", "seconds"]  # noqa: DTZ001
+    assert index.due(dt.datetime(2026, 10, 19, 9, 10)) == ["every-minute", "seconds"]  # noqa: DTZ001
+
+def test_empty() -> None:
+    assert CronIndex().due(dt.datetime(2026, 10, 19)) == []  # noqa: DTZ001
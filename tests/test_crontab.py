@@ -0,0 +1,151 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from cron_descriptor import FormatError, Options, crontab
+from cron_descriptor.crontab import CrontabEntry, crontab_paths, describe_entries, read_crontab, read_crontabs
+
+"""
+Tests crontab ingestion
+"""
+
+SYSTEM_CRONTAB = """\
+# /etc/crontab: system-wide crontab
+SHELL=/bin/sh
+PATH = "/usr/local/sbin:/usr/local/bin"
+
+17 *\t* * *\troot    cd / && run-parts --report /etc/cron.hourly
+25 6\t* * *\troot\ttest -x /usr/sbin/anacron || ( cd / && run-parts --report /etc/cron.daily )
+@reboot root /usr/local/bin/boot.sh
+0,15,30,45 8-18/2 * JAN-MAR,OCT-DEC MON-FRI backup /usr/bin/backup --all
+"""
+
+USER_CRONTAB = """\
+MAILTO=admin@example.com
+@daily /home/user/cleanup.sh
+*/5 * * * * /home/user/poll.sh > /dev/null 2>&1
+invalid line
+"""
+
+
+def write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_read_system_crontab(tmp_path: Path) -> None:
+    entries = list(read_crontab(write(tmp_path / "etc" / "crontab", SYSTEM_CRONTAB)))
+    assert [entry.line_number for entry in entries] == [5, 6, 7, 8]
+    assert entries[0].expression == "17 * * * *"
+    assert entries[0].user == "root"
+    assert entries[0].command == "cd / && run-parts --report /etc/cron.hourly"
+    assert entries[0].environment == {"SHELL": "/bin/sh", "PATH": "/usr/local/sbin:/usr/local/bin"}
+    assert entries[2].expression is None
+    assert entries[2].macro == "@reboot"
+    assert entries[2].command == "/usr/local/bin/boot.sh"
+    assert entries[3].expression == "0,15,30,45 8-18/2 * JAN-MAR,OCT-DEC MON-FRI"
+    assert entries[3].user == "backup"
+
+
+def test_read_user_crontab(tmp_path: Path) -> None:
+    entries = list(read_crontab(write(tmp_path / "user", USER_CRONTAB)))
+    assert entries[0].expression == "0 0 * * *"
+    assert entries[0].macro == "@daily"
+    assert entries[0].user is None
+    assert entries[0].command == "/home/user/cleanup.sh"
+    assert entries[1].command == "/home/user/poll.sh > /dev/null 2>&1"
+    assert entries[1].environment == {"MAILTO": "admin@example.com"}
+    assert entries[2].expression == "invalid line"
+
+
+def test_crontab_paths(tmp_path: Path) -> None:
+    write(tmp_path / "etc" / "crontab", SYSTEM_CRONTAB)
+    write(tmp_path / "etc" / "cron.d" / "php", "09,39 * * * * root /usr/lib/php/sessionclean\n")
+    write(tmp_path / "etc" / "cron.d" / "php.dpkg-old", "* * * * * root true\n")
+    write(tmp_path / "var" / "spool" / "cron" / "crontabs" / "user", USER_CRONTAB)
+    assert [path.relative_to(tmp_path).as_posix() for path in crontab_paths(tmp_path)] == [
+        "etc/crontab",
+        "etc/cron.d/php",
+        "var/spool/cron/crontabs/user",
+    ]
+
+
+def test_read_crontabs_concurrent(tmp_path: Path) -> None:
+    paths = [write(tmp_path / "etc" / "cron.d" / f"job{i:03}", f"{i % 60} * * * * root /bin/job{i}\n") for i in range(50)]
+    paths.append(tmp_path / "etc" / "cron.d" / "missing")
+    entries = list(read_crontabs(paths, workers=8))
+    assert [entry.command for entry in entries] == [f"/bin/job{i}" for i in range(50)]
+    assert all(entry.user == "root" for entry in entries)
+
+
+def test_read_crontabs_bounded(tmp_path: Path) -> None:
+    paths = [write(tmp_path / f"job{i:03}", f"* * * * * /bin/job{i}\n") for i in range(50)]
+    consumed: list[Path] = []
+
+    def lazy_paths() -> Iterator[Path]:
+        for path in paths:
+            consumed.append(path)
+            yield path
+
+    entries = read_crontabs(lazy_paths(), workers=2)
+    assert next(entries).command == "/bin/job0"
+    assert len(consumed) == 4
+    assert [entry.command for entry in entries] == [f"/bin/job{i}" for i in range(1, 50)]
+    assert len(consumed) == 50
+
+
+def test_read_crontabs_streams_lines(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    path = write(tmp_path / "user", "".join(f"* * * * * /bin/job{i}\n" for i in range(3)))
+    read: list[CrontabEntry] = []
+
+    def failing_read_crontab(path: Path) -> Iterator[CrontabEntry]:
+        for entry in read_crontab(path):
+            read.append(entry)
+            yield entry
+        msg = "disk gone"
+        raise OSError(msg)
+
+    monkeypatch.setattr(crontab, "read_crontab", failing_read_crontab)
+    entries = read_crontabs([path])
+    # Entry is yielded before rest of file is read
+    assert next(entries).command == "/bin/job0"
+    assert len(read) == 1
+    with caplog.at_level(logging.WARNING, logger="cron_descriptor.crontab"):
+        assert [entry.command for entry in entries] == ["/bin/job1", "/bin/job2"]
+    assert "disk gone" in caplog.text
+
+
+def test_describe_entries(tmp_path: Path) -> None:
+    system = write(tmp_path / "etc" / "crontab", SYSTEM_CRONTAB)
+    user = write(tmp_path / "user", USER_CRONTAB)
+    described = list(describe_entries(read_crontabs([system, user]), Options(locale_code="en_US")))
+    descriptions = [description for _, description in described]
+    assert descriptions[0] == "At 17 minutes past the hour"
+    assert descriptions[2] is None
+    assert descriptions[4] == "At 12:00 AM"
+    assert isinstance(descriptions[6], FormatError)
@@ -0,0 +1,70 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from cron_descriptor import CronExpression, Describer, DescriptionTypeEnum, ExpressionDescriptor, FormatError, MissingFieldError, Options
+from cron_descriptor.BulkDescriptor import describe_one
+from cron_descriptor.GetText import GetText
+
+"""
+Tests Describer bound to options
+"""
+
+EXPRESSIONS = ["* * * * *", "*/5 * * * *", "0 23 ? * MON-FRI", "30 11 * JAN,FEB SUN", "0 0 12 ? * 2#3", "23 12 * JAN-FEB * 2013-2014"]
+
+def test_describe_matches_descriptor(options: Options) -> None:
+    describer = Describer(options)
+    for expression in EXPRESSIONS:
+        for description_type in DescriptionTypeEnum:
+            assert describer.describe(expression, description_type) == ExpressionDescriptor(expression, options).get_description(description_type)
+    assert describer.describe(CronExpression("*/5 * * * *", options)) == "Every 5 minutes"
+
+def test_describe_locale() -> None:
+    describer = Describer(Options(locale_code="de_DE"))
+    assert describer.describe("0 12 * * MON") == "Um 12:00, nur am Montag"
+
+def test_describe_resolves_once(options: Options) -> None:
+    describer = Describer(options)
+    with patch.object(GetText, "resolve_locale") as resolve_locale:
+        for expression in EXPRESSIONS:
+            describer.describe(expression)
+        describer.descriptor("* * * * *").get_description()
+    resolve_locale.assert_not_called()
+
+def test_describe_errors(options: Options) -> None:
+    describer = Describer(options)
+    with pytest.raises(FormatError):
+        describer.describe("INVALID")
+    with pytest.raises(MissingFieldError):
+        describer.describe("")
+    assert isinstance(describe_one("INVALID", describer), FormatError)
+    assert describe_one("* * * * *", describer) == "Every minute"
+
+def test_describe_shared_by_threads(options: Options) -> None:
+    describer = Describer(options)
+    expressions = EXPRESSIONS * 50
+    expected = [describer.describe(expression) for expression in expressions]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(describer.describe, expressions)) == expected
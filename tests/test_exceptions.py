@@ -41,3 +41,10 @@ def test_invalid_syntax_exception(options: Options) -> None:
     with pytest.raises(FormatError):
         ceh.get_description(DescriptionTypeEnum.FULL)
 
+
+def test_invalid_month_exception(options: Options) -> None:
+    for expression in ("0 0 * 0 *", "0 0 * 0-3 *", "0 0 * 0,5 *", "0 0 * 13 *"):
+        with pytest.raises(FormatError):
+            ExpressionDescriptor(expression, options).get_description(DescriptionTypeEnum.FULL)
+        with pytest.raises(FormatError):
+            ExpressionDescriptor(expression, options).get_description(DescriptionTypeEnum.MONTH)
@@ -0,0 +1,70 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import datetime as dt
+
+import pytest
+
+from cron_descriptor import CronExpression, Forecast, Options, WrongArgumentError, forecast
+
+"""
+Tests fleet load forecast
+"""
+
+EXPRESSIONS = ["0 * * * *", "*/15 * * * *", "0 0 * * *", "0 0 * * *", "30 2 * * MON", "0 0 L * ?", "*/20 * * * * *", "0 0 12 ? * 1#1"]
+START = dt.datetime(2026, 10, 18)  # noqa: DTZ001
+
+def simulate(expressions: list[str], start: dt.datetime, end: dt.datetime, bucket: dt.timedelta, options: Options) -> list[int]:
+    counts = [0] * ((end - start) // bucket)
+    for expression in expressions:
+        for time in CronExpression(expression, options).occurrences(start - dt.timedelta(seconds=1)):
+            if time >= end:
+                break
+            counts[(time - start) // bucket] += 1
+    return counts
+
+@pytest.mark.parametrize(("start", "days", "bucket"), [
+    (START, 7, dt.timedelta(hours=1)),
+    (START, 2, dt.timedelta(minutes=1)),
+    (START, 1, dt.timedelta(seconds=10)),
+    (START, 35, dt.timedelta(days=1)),
+    (START, 28, dt.timedelta(days=7)),
+    (START.replace(hour=6, minute=30), 3, dt.timedelta(minutes=30)),
+])
+def test_forecast_same_as_simulation(start: dt.datetime, days: int, bucket: dt.timedelta, options: Options) -> None:
+    end = start + dt.timedelta(days=days)
+    result = forecast(EXPRESSIONS, start, end, bucket, options)
+    assert result.counts == simulate(EXPRESSIONS, start, end, bucket, options)
+
+def test_forecast_result(options: Options) -> None:
+    result = forecast(["0 0 * * *", CronExpression("0 0 * * *", options), "0 */6 * * *"], START, START + dt.timedelta(days=1), dt.timedelta(hours=6), options)
+    assert result == Forecast(START, dt.timedelta(hours=6), [3, 1, 1, 1])
+    assert result.times() == [START + dt.timedelta(hours=6) * i for i in range(4)]
+
+def test_forecast_wrong_arguments(options: Options) -> None:
+    with pytest.raises(WrongArgumentError):
+        forecast(EXPRESSIONS, START, START + dt.timedelta(days=1), dt.timedelta(minutes=7), options)
+    with pytest.raises(WrongArgumentError):
+        forecast(EXPRESSIONS, START, START + dt.timedelta(minutes=90), dt.timedelta(hours=1), options)
+    with pytest.raises(WrongArgumentError):
+        forecast(EXPRESSIONS, START.replace(minute=5), START + dt.timedelta(days=1, minutes=5), dt.timedelta(hours=1), options)
+    with pytest.raises(WrongArgumentError):
+        forecast(EXPRESSIONS, START, START, dt.timedelta(hours=1), options)
@@ -221,7 +221,7 @@ def test_day_of_week_modifier(options: Options) -> None:
 
 def test_day_of_week_modifier_with_sunday_start_one(options: Options) -> None:
 
-    options.day_of_week_start_index_zero = False
+    options = options.replace(day_of_week_start_index_zero=False)
     assert get_description("23 12 * * 1#2", options) == "At 12:23 PM, on the second Sunday of the month"
 
 def test_hour_range_with_every_portion(options: Options) -> None:
@@ -247,11 +247,11 @@ def test_every_2_day_of_the_week_in_range(options: Options) -> None:
     assert get_description("* * * ? * 1-5/2", options) == "Every second, every 2 days of the week, Monday through Friday"
 
 def test_every_2_day_of_the_week_in_range_with_sunday_start_one(options: Options) -> None:
-    options.day_of_week_start_index_zero = False
+    options = options.replace(day_of_week_start_index_zero=False)
     assert get_description("* * * ? * 2-6/2", options) == "Every second, every 2 days of the week, Monday through Friday"
 
 def test_multi_with_day_of_week_start_index_zero_false(options: Options) -> None:
-    options.day_of_week_start_index_zero = False
+    options = options.replace(day_of_week_start_index_zero=False)
 
     assert get_description("* * * ? * 1,2,3", options) == "Every second, only on Sunday, Monday, and Tuesday"
 
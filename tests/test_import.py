@@ -20,8 +20,17 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import cron_descriptor
 from cron_descriptor.Options import Options
 
+ROOT = Path(__file__).resolve().parent.parent
+
 
 def test_inline_import(options: Options) -> None:
     from cron_descriptor import DescriptionTypeEnum, ExpressionDescriptor, Options
@@ -43,3 +52,22 @@ def test_full_import(options: Options) -> None:
     )
     ceh = ExpressionDescriptor("* * * * *", new_options)
     assert ceh.get_description(DescriptionTypeEnum.FULL) == "Every minute"
+
+def test_lazy_import() -> None:
+    code = (
+        "import sys, cron_descriptor; "
+        "print(sorted(m for m in sys.modules if m.startswith('cron_descriptor.') or m in ('gettext', 'calendar', 'typing_extensions', 'multiprocessing')))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout  # noqa: S603
+    assert output.strip() == "[]"
+
+def test_lazy_attributes() -> None:
+    from cron_descriptor.CronExpression import CronExpression
+
+    # Submodule import must not shadow public class of the same name
+    assert cron_descriptor.CronExpression is CronExpression
+    assert set(cron_descriptor.__all__) <= set(dir(cron_descriptor))
+    for name in cron_descriptor.__all__:
+        assert getattr(cron_descriptor, name) is not None
+    with pytest.raises(AttributeError):
+        cron_descriptor.Missing  # noqa: B018
@@ -20,13 +20,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import gettext
 import logging
 import shutil
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-from cron_descriptor import ExpressionDescriptor, Options
+from cron_descriptor import ExpressionDescriptor, Options, get_description
+from cron_descriptor.CalendarNames import CALENDAR_NAMES, DEFAULT_NAMES, calendar_names
+from cron_descriptor.CatalogBundle import BUNDLE_NAME, CatalogKey, build_bundle, package_bundle, read_bundle
+from cron_descriptor.GetText import CompiledTranslations, GetText, catalog_cache
+
+LOCALE_DIR = Path(__file__).resolve().parent.joinpath("../cron_descriptor/locale")
 
 
 def test_locale_de() -> None:
@@ -51,3 +57,96 @@ def test_locale_de_custom_location() -> None:
 
         assert ExpressionDescriptor("* * * * *", options).get_description() == "Jede Minute"
         mock_logger.assert_called_once_with("%s Loaded", temp_path)
+
+def test_locale_territory_fallback() -> None:
+    options = Options(locale_code="de_AT")
+    assert ExpressionDescriptor("* * * * *", options).get_description() == "Jede Minute"
+
+def test_locale_language_fallback() -> None:
+    assert ExpressionDescriptor("* * * * *", Options(locale_code="ja")).get_description() == \
+        ExpressionDescriptor("* * * * *", Options(locale_code="ja_JP")).get_description()
+
+def test_locale_unknown_fallback() -> None:
+    options = Options(locale_code="xx_YY")
+    assert ExpressionDescriptor("* * * * *", options).get_description() == "Every minute"
+
+def test_locale_missing_is_cached() -> None:
+    catalog_cache.clear()
+    GetText("de_AT")
+    with patch("cron_descriptor.GetText.GetText.read_locale", return_value=None) as mock_read:
+        GetText("de_AT")
+        GetText("de_CH")
+        # de_CH is only catalog that was not looked up yet
+        mock_read.assert_called_once_with("de_CH", None)
+    catalog_cache.clear()
+
+def test_locale_bundle_matches_mo() -> None:
+    bundle = package_bundle()
+    assert bundle is not None
+    mo_files = sorted(LOCALE_DIR.glob("*.mo"))
+    assert bundle.locales() == [mo_file.stem for mo_file in mo_files], f"{BUNDLE_NAME} changed, run tools/compilepos.py"
+    for mo_file in mo_files:
+        with mo_file.open("rb") as f:
+            parsed = gettext.GNUTranslations(f)
+        found = bundle.catalog(mo_file.stem)
+        assert found is not None
+        catalog, info = found
+        assert dict(catalog) == parsed._catalog, f"{mo_file.name} changed, run tools/compilepos.py"  # type: ignore[attr-defined]  # noqa: SLF001
+        assert info == parsed.info()
+        assert catalog.get("missing message") is None
+
+def test_locale_prefers_bundle() -> None:
+    catalog_cache.clear()
+    with patch.object(gettext, "GNUTranslations", side_effect=AssertionError("parsed .mo file")):
+        assert ExpressionDescriptor("* * * * *", Options(locale_code="de_DE")).get_description() == "Jede Minute"
+        # Sibling territories are listed from bundle too
+        assert GetText("ja").trans is GetText("ja_JP").trans
+    assert isinstance(GetText("de_DE").trans, CompiledTranslations)
+    assert not isinstance(GetText("de_DE", str(LOCALE_DIR)).trans, CompiledTranslations)
+    assert GetText("de_DE.UTF-8").trans is GetText("de_DE").trans
+    catalog_cache.clear()
+
+def test_locale_bundle_from_bytes() -> None:
+    catalog: dict[CatalogKey, str] = {"Every minute": "Chaque minute", ("day", 1): "days"}
+    info = {"content-type": "text/plain; charset=UTF-8"}
+    data = build_bundle({"xx_XX": (catalog, info)})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp).joinpath(BUNDLE_NAME)
+        path.write_bytes(data)
+        # Anything but pathlib.Path is read through read_bytes, as resources in zip archive are
+        resource = type("Resource", (), {"read_bytes": lambda _: path.read_bytes()})()
+        for bundle in (read_bundle(path), read_bundle(resource)):
+            assert bundle is not None
+            assert bundle.locales() == ["xx_XX"]
+            assert bundle.catalog("de_DE") is None
+            found = bundle.catalog("xx_XX")
+            assert found is not None
+            assert dict(found[0]) == catalog
+            assert found[1] == info
+            assert CompiledTranslations(*found).gettext("Every minute") == "Chaque minute"
+
+def test_locale_bundle_invalid() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp).joinpath(BUNDLE_NAME)
+        assert read_bundle(path) is None
+        path.write_bytes(b"not a bundle")
+        assert read_bundle(path) is None
+
+def test_locale_calendar_names() -> None:
+    assert get_description("0 12 * JAN-MAR MON-FRI", Options(locale_code="de_DE")) == "Um 12:00, Montag bis Freitag, Januar bis März"
+    assert get_description("0 12 * 5 3#2", Options(locale_code="fr_FR")) == "À 12:00, le second mercredi du mois, uniquement en mai"
+    # Fallback locale describes in English, names follow it
+    assert get_description("0 12 * 5 3", Options(locale_code="xx_YY")) == "At 12:00, only on Wednesday, only in May"
+    assert GetText("de_AT").names is CALENDAR_NAMES["de"]
+    assert GetText("ru_RU").names.months[1] == "январь"
+
+def test_locale_calendar_names_complete() -> None:
+    bundle = package_bundle()
+    assert bundle is not None
+    for code in bundle.locales():
+        names = calendar_names(code)
+        assert names is not DEFAULT_NAMES or code.startswith("en_"), f"{code} has no calendar names"
+        assert len(names.days) == 7
+        assert len(names.months) == 13
+        assert all(names.days)
+        assert all(names.months[1:])
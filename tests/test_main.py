@@ -0,0 +1,74 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+import json
+
+import pytest
+
+from cron_descriptor.__main__ import main
+
+"""
+Tests command line interface
+"""
+
+def run(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], argv: list[str], stdin: str = "") -> tuple[int, list[str]]:
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    status = main(argv)
+    return status, capsys.readouterr().out.splitlines()
+
+def test_single_expression(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    assert run(monkeypatch, capsys, ["*/5 * * * *", "--locale", "en_US"]) == (0, ["Every 5 minutes"])
+
+def test_stdin(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    status, lines = run(monkeypatch, capsys, ["--stdin", "-l", "en_US"], "* * * * *\nINVALID\n*/5 * * * *\n")
+    assert status == 1
+    assert lines[0] == "Every minute"
+    assert lines[1].startswith("error: ")
+    assert lines[2] == "Every 5 minutes"
+
+def test_stdin_locale(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    assert run(monkeypatch, capsys, ["--stdin", "--locale", "de_DE"], "* * * * *\n") == (0, ["Jede Minute"])
+
+def test_stdin_json_output(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    status, lines = run(monkeypatch, capsys, ["--stdin", "--json", "-l", "en_US"], "* * * * *\n")
+    assert status == 0
+    assert json.loads(lines[0]) == {"expression": "* * * * *", "description": "Every minute"}
+
+def test_jsonl_field(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    stdin = "\n".join([
+        json.dumps({"id": 1, "schedule": "0 * * * *"}),
+        "not json",
+        json.dumps({"id": 3}),
+        json.dumps({"id": 4, "schedule": "0 * * * *"}),
+    ])
+    status, lines = run(monkeypatch, capsys, ["--field", "schedule", "-l", "en_US"], stdin)
+    records = [json.loads(line) for line in lines]
+    assert status == 1
+    assert records[0] == {"id": 1, "schedule": "0 * * * *", "description": "Every hour"}
+    assert records[1]["error"].startswith("Invalid JSON")
+    assert records[2] == {"id": 3, "error": "Field 'schedule' not found."}
+    assert records[3]["description"] == "Every hour"
+
+def test_expression_or_stdin_required(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit):
+        run(monkeypatch, capsys, [])
@@ -0,0 +1,63 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from cron_descriptor import Options
+from cron_descriptor.ExpressionParser import ExpressionParser
+
+"""
+Tests normalization of parsed expression parts
+"""
+
+def parse(expression: str, options: Options) -> list[str]:
+    return ExpressionParser(expression, options).parse()
+
+def test_normalize_steps(options: Options) -> None:
+    assert parse("0 0/1 * * * ?", options) == ["", "*", "*", "*", "*", "*", ""]
+    assert parse("0 0 0/30 8-9 5,20 * ?", options) == ["", "0", "*/30", "8-9", "5,20", "*", "?"]
+    assert parse("* * * 3/2 *", options) == ["", "*", "*", "*", "3-12/2", "*", ""]
+    assert parse("* * * * 3/2", options) == ["", "*", "*", "*", "*", "3-6/2", ""]
+    assert parse("* * * * * * 2020/2", options) == ["*", "*", "*", "*", "*", "*", "2020-9999/2"]
+
+def test_normalize_self_range(options: Options) -> None:
+    assert parse("*/5 3 * * *", options) == ["", "*/5", "3-3", "*", "*", "*", ""]
+    assert parse("0-20/3 9 * * *", options) == ["", "0-20/3", "9-9", "*", "*", "*", ""]
+
+def test_normalize_names(options: Options) -> None:
+    assert parse("0 23 ? * MON-FRI", options) == ["", "0", "23", "*", "*", "1-5", ""]
+    assert parse("* * * JAN,nov *", options) == ["", "*", "*", "*", "1,11", "*", ""]
+    assert parse("* * * * sun-sat", options) == ["", "*", "*", "*", "*", "0-6", ""]
+    # THU is converted before SAT could take its T
+    assert parse("* * * * SATHU", options) == ["", "*", "*", "*", "*", "SA4", ""]
+
+def test_normalize_day_of_week_index(options: Options) -> None:
+    assert parse("* * * * 1-7", options) == ["", "*", "*", "*", "*", "1-0", ""]
+    assert parse("* * * * 5#3", options) == ["", "*", "*", "*", "*", "5#3", ""]
+    one_indexed = Options(locale_code="en_US", day_of_week_start_index_zero=False)
+    assert parse("* * * * 1-7", one_indexed) == ["", "*", "*", "*", "*", "0-6", ""]
+    assert parse("* * * * 5#3", one_indexed) == ["", "*", "*", "*", "*", "4#3", ""]
+    assert parse("* * * * 6L", one_indexed) == ["", "*", "*", "*", "*", "5L", ""]
+    assert parse("* * * * 3/2", one_indexed) == ["", "*", "*", "*", "*", "2-6/2", ""]
+    assert parse("* * * * MON7", one_indexed) == ["", "*", "*", "*", "*", "16", ""]
+
+def test_normalize_step_start(options: Options) -> None:
+    assert parse("* * * 1/2 1/2", options) == ["", "*", "*", "*", "*/2", "*/2", ""]
+    assert parse("* * * * 1/2,SAT1/3", Options(locale_code="en_US", day_of_week_start_index_zero=False)) == ["", "*", "*", "*", "*", "*/2,6*/3", ""]
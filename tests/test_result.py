@@ -0,0 +1,74 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+from cron_descriptor import CronExpression, FormatError, Options, Result, try_describe, validate_many
+
+"""
+Tests non-raising validation and description results
+"""
+
+def test_validate_many() -> None:
+    results = list(validate_many(["* * * * *", "* * 32 * *", CronExpression("*/5 * * * *"), "* *"]))
+    assert [result.ok for result in results] == [True, False, True, False]
+    assert results[0] == Result(ok=True, value="* * * * *")
+    assert results[1].code == "range"
+    assert results[1].field == "DayOfMonth"
+    assert results[1].offset == 4
+    assert results[1].message == "DayOfMonth values must be between 1 and 31 but '32' is provided"
+    assert results[2].value == "*/5 * * * *"
+    assert results[3].code == "parts"
+    assert results[3].field is None
+
+def test_empty_expression_code(options: Options) -> None:
+    # Same code from both APIs, whitespace only expression has no parts
+    assert next(validate_many([""])) == try_describe("", options)
+    assert try_describe("", options).code == "missing"
+    assert next(validate_many(["  "])).code == try_describe("  ", options).code == "parts"
+
+def test_validate_many_dedupe() -> None:
+    with patch("cron_descriptor.Result.check_expression", return_value=None) as mock_check:
+        results = list(validate_many(["0 * * * *", "1 * * * *"] * 500))
+    assert len(results) == 1000
+    assert mock_check.call_count == 2
+
+def test_validate_many_bounded() -> None:
+    with patch("cron_descriptor.Result.check_expression", return_value=None) as mock_check:
+        list(validate_many(["0 * * * *", "1 * * * *", "0 * * * *"], cache_size=1))
+    assert mock_check.call_count == 3
+
+def test_try_describe(options: Options) -> None:
+    assert try_describe("*/5 * * * *", options) == Result(ok=True, value="Every 5 minutes")
+    assert try_describe(CronExpression("*/5 * * * *"), options).value == "Every 5 minutes"
+
+    result = try_describe("0 12 * * MON#6", options)
+    assert not result.ok
+    assert result.value is None
+    assert (result.code, result.field, result.offset) == ("week", "DayOfWeek", 13)
+
+    assert try_describe("", options).code == "missing"
+
+def test_try_describe_description_error(options: Options) -> None:
+    with patch("cron_descriptor.Result.get_description", side_effect=FormatError("broken")):
+        result = try_describe("* * * * *", options)
+    assert result == Result(ok=False, value=None, code="description", message="broken")
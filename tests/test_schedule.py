@@ -0,0 +1,181 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import datetime as dt
+
+from cron_descriptor import CronExpression, Options
+
+"""
+Tests next and previous fire times
+"""
+
+START = dt.datetime(2026, 10, 18, 12, 0, 0)  # noqa: DTZ001
+
+def at(year: int, month: int, day: int, hour: int = 0, minute: int = 0, second: int = 0) -> dt.datetime:
+    return dt.datetime(year, month, day, hour, minute, second)  # noqa: DTZ001
+
+def test_next(options: Options) -> None:
+    expression = CronExpression("*/15 9-17 * * MON-FRI", options)
+    assert expression.get_next(START) == [at(2026, 10, 19, 9, 0)]
+    assert expression.get_next(START, 3) == [at(2026, 10, 19, 9, 0), at(2026, 10, 19, 9, 15), at(2026, 10, 19, 9, 30)]
+    assert expression.get_next(at(2026, 10, 19, 17, 45), 2) == [at(2026, 10, 20, 9, 0), at(2026, 10, 20, 9, 15)]
+
+def test_prev(options: Options) -> None:
+    expression = CronExpression("*/15 9-17 * * MON-FRI", options)
+    assert expression.get_prev(START, 2) == [at(2026, 10, 16, 17, 45), at(2026, 10, 16, 17, 30)]
+    assert expression.get_prev(at(2026, 10, 19, 9, 15)) == [at(2026, 10, 19, 9, 0)]
+
+def test_start_is_exclusive(options: Options) -> None:
+    expression = CronExpression("0 12 * * *", options)
+    assert expression.get_next(START) == [at(2026, 10, 19, 12, 0)]
+    assert expression.get_prev(START) == [at(2026, 10, 17, 12, 0)]
+    assert expression.get_prev(START.replace(microsecond=1)) == [START]
+    assert expression.get_next(START.replace(microsecond=1)) == [at(2026, 10, 19, 12, 0)]
+
+def test_seconds(options: Options) -> None:
+    expression = CronExpression("*/20 * * * * *", options)
+    assert expression.get_next(START, 3) == [at(2026, 10, 18, 12, 0, 20), at(2026, 10, 18, 12, 0, 40), at(2026, 10, 18, 12, 1, 0)]
+    assert expression.get_prev(START) == [at(2026, 10, 18, 11, 59, 40)]
+
+def test_year(options: Options) -> None:
+    expression = CronExpression("* * * * * 2099", options)
+    assert expression.get_next(START, 2) == [at(2099, 1, 1, 0, 0), at(2099, 1, 1, 0, 1)]
+    assert expression.get_prev(START) == []
+    assert CronExpression("0 0 1 1 * 2027", options).get_next(START, 5) == [at(2027, 1, 1)]
+
+def test_leap_day(options: Options) -> None:
+    expression = CronExpression("0 0 29 2 *", options)
+    assert expression.get_next(START, 2) == [at(2028, 2, 29), at(2032, 2, 29)]
+    assert expression.get_prev(START) == [at(2024, 2, 29)]
+
+def test_never_fires(options: Options) -> None:
+    assert CronExpression("0 0 30 2 *", options).get_next(START) == []
+    assert CronExpression("0 0 30 2 *", options).get_prev(START) == []
+
+def test_last_day_of_month(options: Options) -> None:
+    assert CronExpression("0 0 L * ?", options).get_next(START, 3) == [at(2026, 10, 31), at(2026, 11, 30), at(2026, 12, 31)]
+    assert CronExpression("0 0 L-2 * ?", options).get_next(START, 2) == [at(2026, 10, 29), at(2026, 11, 28)]
+    assert CronExpression("0 0 L 2 ?", options).get_next(START, 2) == [at(2027, 2, 28), at(2028, 2, 29)]
+
+def test_nearest_weekday(options: Options) -> None:
+    # 2026-11-15 is Sunday
+    assert CronExpression("0 0 15W * ?", options).get_next(START, 2) == [at(2026, 11, 16), at(2026, 12, 15)]
+    # 2022-10-01 is Saturday, nearest weekday must stay in October
+    assert CronExpression("0 0 1W 10 ? 2022", options).get_next(at(2022, 1, 1)) == [at(2022, 10, 3)]
+    # 2026-05-31 is Sunday, nearest weekday must stay in May
+    assert CronExpression("0 0 31W 5 ? 2026", options).get_next(at(2026, 1, 1)) == [at(2026, 5, 29)]
+
+def test_last_weekday(options: Options) -> None:
+    assert CronExpression("0 0 LW * ?", options).get_next(at(2026, 5, 1), 4) == [at(2026, 5, 29), at(2026, 6, 30), at(2026, 7, 31), at(2026, 8, 31)]
+
+def test_last_day_of_week(options: Options) -> None:
+    expression = CronExpression("0 15 10 ? * 6L", options)
+    assert expression.get_next(START, 2) == [at(2026, 10, 31, 10, 15), at(2026, 11, 28, 10, 15)]
+    assert expression.get_prev(START) == [at(2026, 9, 26, 10, 15)]
+
+def test_nth_day_of_week(options: Options) -> None:
+    expression = CronExpression("0 0 12 ? * 2#3", options)
+    assert expression.get_next(START, 2) == [at(2026, 10, 20, 12, 0), at(2026, 11, 17, 12, 0)]
+    # No fifth Monday in February 2027
+    assert CronExpression("0 0 0 ? 2 1#5 2027-2028", options).get_next(START) == []
+
+def test_one_indexed_day_of_week() -> None:
+    expression = CronExpression("0 15 10 ? * 7L", Options(day_of_week_start_index_zero=False))
+    assert expression.get_next(START) == [at(2026, 10, 31, 10, 15)]
+    assert CronExpression("0 9 * * 2", Options(day_of_week_start_index_zero=False)).get_next(START) == [at(2026, 10, 19, 9, 0)]
+
+def test_day_of_month_or_day_of_week(options: Options) -> None:
+    # Both restricted: either matches
+    assert CronExpression("0 0 1 * MON", options).get_next(START, 3) == [at(2026, 10, 19), at(2026, 10, 26), at(2026, 11, 1)]
+    # Day of month starts with *: both must match
+    assert CronExpression("0 0 */2 * MON", options).get_next(START, 2) == [at(2026, 10, 19), at(2026, 11, 9)]
+
+def test_timezone_is_kept(options: Options) -> None:
+    tz = dt.timezone(dt.timedelta(hours=2))
+    assert CronExpression("0 12 * * *", options).get_next(START.replace(tzinfo=tz)) == [at(2026, 10, 19, 12, 0).replace(tzinfo=tz)]
+
+def test_occurrences_is_lazy(options: Options) -> None:
+    occurrences = CronExpression("* * * * *", options).occurrences(START)
+    assert next(occurrences) == at(2026, 10, 18, 12, 1)
+    assert next(occurrences) == at(2026, 10, 18, 12, 2)
+
+def test_next_prev_roundtrip(options: Options) -> None:
+    for text in ("*/7 */5 * * *", "0 0 L,15 * ?", "0 0 ? * 1#1,5L", "0 0 0 29 2 ? 2020-2099/3"):
+        expression = CronExpression(text, options)
+        upcoming = expression.get_next(START, 20)
+        assert upcoming == sorted(upcoming)
+        assert expression.get_prev(upcoming[-1], len(upcoming) - 1) == upcoming[-2::-1]
+
+def test_matches_brute_force(options: Options) -> None:
+    expression = CronExpression("*/10 8-10,22 1,15 * 0,3", options)
+    expected: list[dt.datetime] = []
+    current = START
+    while len(expected) < 30:
+        current += dt.timedelta(minutes=1)
+        day_of_week = (current.weekday() + 1) % 7
+        if current.minute % 10 == 0 and current.hour in (8, 9, 10, 22) and (current.day in (1, 15) or day_of_week in (0, 3)):
+            expected.append(current)
+    assert expression.get_next(START, 30) == expected
+
+def test_masks(options: Options) -> None:
+    masks = CronExpression("*/20 0,30 9-10 1,31 DEC MON,SUN 1970,2000", options).schedule.masks
+    assert masks.seconds == 1 | 1 << 20 | 1 << 40
+    assert masks.minutes == 1 | 1 << 30
+    assert masks.hours == 1 << 9 | 1 << 10
+    assert masks.days_of_month == 1 | 1 << 30
+    assert masks.months == 1 << 11
+    assert masks.days_of_week == 0b11
+    assert masks.years == 1 | 1 << 30
+    assert CronExpression("* * * * *", options).schedule.masks.years is None
+
+def test_matches(options: Options) -> None:
+    expression = CronExpression("*/15 9-17 * * MON-FRI", options)
+    assert expression.matches(at(2026, 10, 19, 9, 15))
+    assert expression.matches(at(2026, 10, 19, 9, 15).replace(microsecond=500))
+    assert not expression.matches(at(2026, 10, 19, 9, 15, 1))
+    assert not expression.matches(at(2026, 10, 19, 9, 16))
+    assert not expression.matches(at(2026, 10, 19, 18, 0))
+    assert not expression.matches(START)
+
+def test_matches_year(options: Options) -> None:
+    expression = CronExpression("0 0 1 1 * 2027", options)
+    assert expression.matches(at(2027, 1, 1))
+    assert not expression.matches(at(2028, 1, 1))
+    assert not expression.matches(at(1900, 1, 1))
+
+def test_matches_day_fields(options: Options) -> None:
+    assert CronExpression("0 0 1 * MON", options).matches(at(2026, 10, 19))
+    assert CronExpression("0 0 1 * MON", options).matches(at(2026, 11, 1))
+    assert not CronExpression("0 0 */2 * MON", options).matches(at(2026, 10, 26))
+    assert CronExpression("0 0 L * ?", options).matches(at(2028, 2, 29))
+    assert not CronExpression("0 0 L * ?", options).matches(at(2027, 2, 28).replace(day=27))
+    assert CronExpression("0 15 10 ? * 6L", options).matches(at(2026, 10, 31, 10, 15))
+    assert not CronExpression("0 15 10 ? * 6L", options).matches(at(2026, 10, 24, 10, 15))
+
+def test_matches_agrees_with_next(options: Options) -> None:
+    for text in ("0 0 * * *", "0 0 1,15 * 3", "0 0 L-3,LW * ?", "0 0 ? * 2#2,5L", "0 0 10W * ?", "0 0 */3 * 1-5"):
+        expression = CronExpression(text, options)
+        fire_times = set(expression.get_next(at(2025, 12, 31, 23, 59), 200))
+        end = max(fire_times)
+        day = at(2026, 1, 1)
+        while day <= end:
+            assert expression.matches(day) == (day in fire_times), (text, day)
+            day += dt.timedelta(days=1)
@@ -0,0 +1,78 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2016 Adam Schubert
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import gettext
+
+from cron_descriptor import Describer, Options
+from cron_descriptor.GetText import GetText, catalog_cache
+from cron_descriptor.Templates import ALTERNATIVES, MESSAGES, compile_templates
+
+"""
+Tests rendering templates compiled from catalogs
+"""
+
+def test_templates_resolve_alternatives() -> None:
+    templates = compile_templates(gettext.NullTranslations())
+    assert set(templates.messages) == set(MESSAGES)
+    for message in ALTERNATIVES:
+        assert templates.messages[message] == message
+    assert templates.terse_removals == (", every minute", ", every hour", ", every day")
+    assert templates.day_of_month.interval_one == ", every day"
+
+
+class EmptyAlternatives(gettext.NullTranslations):
+    def gettext(self, message: str) -> str:
+        return "" if message in ALTERNATIVES or message == ", every hour" else message
+
+
+def test_templates_fallback_to_alternative() -> None:
+    templates = compile_templates(EmptyAlternatives())
+    assert templates.messages[", second {0} through second {1}"] == ", {0} through {1}"
+    assert templates.seconds.range == ", {0} through {1}"
+    assert templates.minutes.description_large == "at {0} minutes past the hour"
+    assert templates.terse_removals == (", every minute", ", every day")
+
+
+def test_templates_compiled_once_per_catalog() -> None:
+    catalog_cache.clear()
+    first = GetText("de_DE")
+    second = GetText("de_DE")
+    assert first.templates is second.templates
+    assert GetText("fr_FR").templates is not first.templates
+    assert catalog_cache.templates.info().currsize == 2
+
+    catalog_cache.clear()
+    assert not catalog_cache.templates
+    assert GetText("de_DE").templates is not first.templates
+
+
+def test_templates_locale() -> None:
+    templates = GetText("de_DE").templates
+    assert templates.messages["At "] == "Um "
+    assert Describer(Options(locale_code="de_DE")).describe("0 12 * * MON") == "Um 12:00, nur am Montag"
+
+
+def test_templates_verbosity(options: Options) -> None:
+    verbose = Describer(options.replace(verbose=True))
+    terse = Describer(options)
+    assert verbose.describe("30 2 * * *") == "At 02:30 AM, every day"
+    assert terse.describe("30 2 * * *") == "At 02:30 AM"
+    assert terse.describe("*/5 * * * *") == "Every 5 minutes"
@@ -1,5 +1,9 @@
 
-from cron_descriptor.ExpressionValidator import ExpressionValidator
+import pytest
+
+from cron_descriptor import ExpressionValidator as expression_validator_module  # noqa: N813
+from cron_descriptor import FormatError
+from cron_descriptor.ExpressionValidator import DAY_OF_WEEK, MONTH, ExpressionValidator, ValidationError, check_expression, check_field
 
 """
 Tests validator
@@ -78,3 +82,51 @@ def test_validator_expression() -> None:
     for expression in valid:
         ExpressionValidator().validate(expression)
 
+
+
+@pytest.mark.parametrize(("expression", "message"), [
+    ("60 * * * *", "Second and Minute values must be between 0 and 59 but '60' is provided"),
+    ("* */24 * * *", "(Hour) Accepted increment value range is 0~23 but '24' is provided"),
+    ("* 5-3 * * *", "(Hour) Invalid range '5-3'. Accepted range is 0-23"),
+    ("* * 1-2-3 * *", "Illegal Expression Format '1-2-3'"),
+    ("* * 1X * *", "(DayOfMonth) Illegal Expression Format '1X'"),
+    ("* * * Jan *", "Invalid Month value 'Jan'"),
+    ("* * * * FRI-MON", "(DayOfWeek) Invalid range 'FRI-MON'. Accepted range is 0-7"),
+    ("* * * * 1#6", "(DayOfWeek) Accepted week value is 0~5 but '6' is provided"),
+    ("* * * * * * 2100", "Year values must be between 1970 and 2099 but '2100' is provided"),
+    ("* * * * * * * *", "Error: Expression has too many parts (8).  Expression must not have more than 7 parts."),
+])
+def test_validator_messages(expression: str, message: str) -> None:
+    for _ in range(2):  # second round is answered from remembered part results
+        with pytest.raises(FormatError) as e:
+            ExpressionValidator().validate(expression)
+        assert str(e.value) == message
+
+
+def test_validator_garbage_is_format_error() -> None:
+    for expression in ("* * * JAN,XYZ *", "* * * * MON-XYZ,1", "* * * * 1,-1-", "* * * * ²"):
+        with pytest.raises(FormatError):
+            ExpressionValidator().validate(expression)
+
+
+def test_check_expression() -> None:
+    assert check_expression("*/5 * * * MON-FRI") is None
+    error = check_expression("0 12  1,2,40 * *")
+    assert error == ValidationError("range", "DayOfMonth", 10, "DayOfMonth values must be between 1 and 31 but '40' is provided")
+    assert error is not None
+    assert "0 12  1,2,40 * *"[error.offset:] == "40 * *"
+    assert check_expression("* *") == ValidationError("parts", None, 0, "Error: Expression only has 2 parts.  At least 5 part are required.")
+
+
+def test_check_field() -> None:
+    assert check_field(MONTH, "JAN-MAR,6") is None
+    assert check_field(DAY_OF_WEEK, "MON#9") == ("week", 4, "(DayOfWeek) Accepted week value is 0~5 but '9' is provided")
+    assert check_field(DAY_OF_WEEK, "8", "Weekday") == ("range", 0, "Weekday values must be between 0 and 7 but '8' is provided")
+
+
+def test_check_expression_part_cache_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(expression_validator_module, "PART_CACHE_SIZE", 0)
+    for results in expression_validator_module._part_results:  # noqa: SLF001
+        results.clear()
+    assert check_expression("*/5 * * * MON-FRI") is None
+    assert not any(expression_validator_module._part_results)  # noqa: SLF001
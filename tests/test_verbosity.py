@@ -27,14 +27,14 @@ Tests verbosity
 """
 
 def test_simple_expression(options: Options) -> None:
-    options.verbose = True
+    options = options.replace(verbose=True)
     assert get_description("30 4 1 * *", options) == "At 04:30 AM, on day 1 of the month"
 
 
 def test_every_minute_simple_expression(options: Options) -> None:
-    options.verbose = True
+    options = options.replace(verbose=True)
     assert get_description("* * * * *", options) == "Every minute, every hour, every day"
 
 def test_single_day_of_the_week(options: Options) -> None:
-    options.verbose = True
+    options = options.replace(verbose=True)
     assert get_description("0 9 * * 2", options) == "At 09:00 AM, only on Tuesday"
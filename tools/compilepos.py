@@ -1,13 +1,26 @@
+import gettext
 import logging
 import pathlib
+import sys
 
 import polib
 
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from cron_descriptor.CatalogBundle import BUNDLE_NAME, build_bundle
+
 log = logging.getLogger(__name__)
 base_dir = pathlib.Path("../cron_descriptor/locale")
 
-for po_file in base_dir.rglob("*.po"):
+catalogs = {}
+for po_file in sorted(base_dir.rglob("*.po")):
     mo_file = po_file.with_suffix(".mo")
     log.info("Compiling %s → %s", po_file, mo_file)
     po = polib.pofile(po_file)
     po.save_as_mofile(str(mo_file))
+    with mo_file.open("rb") as f:
+        trans = gettext.GNUTranslations(f)
+    catalogs[mo_file.stem] = (trans._catalog, trans.info())  # type: ignore[attr-defined]  # noqa: SLF001
+
+# All catalogs in single file, read by GetText through mmap
+base_dir.joinpath(BUNDLE_NAME).write_bytes(build_bundle(catalogs))